@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import random
+from typing import List, Tuple
+
+from src.logic.substitution import Substitution
+from src.models.term import Constant, Function, Term, Variable
+
+TermPair = Tuple[Term, Term]
+
+
+# Shapes
+def deep_chain(depth: int, leaf: Term = None) -> Term:
+    """Return s(s(...s(leaf)...)) nested `depth` times (leaf defaults to the constant Z)."""
+    term = leaf if leaf is not None else Constant("Z")
+    for _ in range(depth):
+        term = Function("s", [term])
+    return term
+
+
+def wide_function(width: int, prefix: str = "x") -> Term:
+    """Return f(x0, x1, ..., x{width-1})."""
+    return Function("f", [Variable(f"{prefix}{i}") for i in range(width)])
+
+
+# Pairs
+def deep_chain_pair(depth: int) -> TermPair:
+    """s^depth(x) vs s^depth(Z): one binding at the bottom of a long chain."""
+    return deep_chain(depth, Variable("x")), deep_chain(depth)
+
+
+def wide_pair(width: int) -> TermPair:
+    """f(x0..xn) vs f(C0..Cn): many independent bindings."""
+    return wide_function(width), Function("f", [Constant(f"C{i}") for i in range(width)])
+
+
+def shared_variables_pair(width: int) -> TermPair:
+    """f(x, x, ..., x) vs f(y0, y1, ..., yn): every binding aliases the same variable."""
+    return Function("f", [Variable("x")] * width), wide_function(width, "y")
+
+
+def exponential_pair(n: int) -> TermPair:
+    """
+    The classic p(x1, ..., xn) vs p(f(x0, x0), ..., f(x{n-1}, x{n-1})): the MGU binds xi to a
+    term with 2^i leaves, so engines that copy terms instead of sharing them blow up.
+    """
+    left = Function("p", [Variable(f"x{i}") for i in range(1, n + 1)])
+    right = Function("p", [Function("f", [Variable(f"x{i}"), Variable(f"x{i}")]) for i in range(n)])
+    return left, right
+
+
+def occurs_check_pair(depth: int) -> TermPair:
+    """x vs s^depth(x): fails only after the occurs check walks the whole chain."""
+    return Variable("x"), deep_chain(depth, Variable("x"))
+
+
+def random_term(rng: random.Random, depth: int, max_arity: int = 3, variables: int = 5,
+                variable_ratio: float = 0.3) -> Term:
+    """Return a random term of at most `depth` levels over functors f0..f{max_arity-1} (iterative)."""
+    def leaf() -> Term:
+        if rng.random() < variable_ratio:
+            return Variable(f"v{rng.randrange(variables)}")
+        return Constant(f"K{rng.randrange(variables)}")
+
+    # Build bottom-up: decide the shape top-down on a stack, then assemble in post-order
+    shape: List[Tuple[int, int]] = []   # (level, arity) in preorder
+    pending = [0]
+    while pending:
+        level = pending.pop()
+        arity = 0 if level >= depth - 1 or rng.random() < 0.2 else rng.randint(1, max_arity)
+        shape.append((level, arity))
+        pending.extend([level + 1] * arity)
+    built: List[Term] = []
+    for level, arity in reversed(shape):
+        if arity == 0:
+            built.append(leaf())
+        else:
+            args = built[len(built) - arity:][::-1]
+            del built[len(built) - arity:]
+            built.append(Function(f"f{arity}", args))
+    return built[0]
+
+
+def random_pair(rng: random.Random, depth: int, **options) -> TermPair:
+    """Return a random term paired with a partial instance of it (70%) or with another random term."""
+    left = random_term(rng, depth, **options)
+    right = random_term(rng, depth, **options) if rng.random() < 0.3 else _perturb(rng, left)
+    return left, right
+
+
+def _perturb(rng: random.Random, term: Term) -> Term:
+    """Replace about half of the variables of `term` by constants, so the pair is likely to unify."""
+    bindings = {name: Constant(f"K_{name}") for name in term.variables() if rng.random() < 0.5}
+    return term.apply_substitution(Substitution(bindings))
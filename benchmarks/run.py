@@ -0,0 +1,217 @@
+"""
+Benchmark harness for parsing, unification, substitution application and printing.
+
+    python -m benchmarks.run                          # quick profile, table on stdout
+    python -m benchmarks.run --output after.json --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.generators import (TermPair, deep_chain_pair, exponential_pair, occurs_check_pair, random_pair,
+                                   shared_variables_pair, wide_pair)
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+
+PROFILES = {
+    "quick": {"deep_chain": (100, 1000), "wide": (10, 100), "shared_variables": (10, 100),
+              "exponential": (8, 12), "occurs_check": (100, 1000), "random": (4, 6)},
+    "full": {"deep_chain": (100, 1000, 10000, 100000), "wide": (10, 100, 1000, 10000),
+             "shared_variables": (10, 100, 1000), "exponential": (8, 12, 16),
+             "occurs_check": (100, 1000, 10000), "random": (4, 6, 8)},
+}
+RANDOM_PAIRS = 200
+OPERATIONS = ("parse", "unify/recursive", "unify/union_find", "apply", "print")
+
+
+@dataclass(frozen=True)
+class Case:
+    """A named family of term pairs at one size."""
+
+    family: str
+    size: int
+    pairs: Sequence[TermPair]
+
+
+def build_cases(profile: str, only: Optional[Sequence[str]] = None, seed: int = 0) -> List[Case]:
+    """Generate every case of `profile`, optionally restricted to the families in `only`."""
+    builders: Dict[str, Callable[[int], List[TermPair]]] = {
+        "deep_chain": lambda n: [deep_chain_pair(n)],
+        "wide": lambda n: [wide_pair(n)],
+        "shared_variables": lambda n: [shared_variables_pair(n)],
+        "exponential": lambda n: [exponential_pair(n)],
+        "occurs_check": lambda n: [occurs_check_pair(n)],
+        "random": lambda depth: [random_pair(rng, depth) for _ in range(RANDOM_PAIRS)],
+    }
+    rng = random.Random(seed)
+    cases = []
+    for family, sizes in PROFILES[profile].items():
+        if only and family not in only:
+            continue
+        for size in sizes:
+            cases.append(Case(family, size, builders[family](size)))
+    return cases
+
+
+# Operations: each returns a zero-argument callable plus the number of items it processes per call
+def _try_unify(unifier: Unifier, left, right):
+    """Return the MGU or None on failure."""
+    try:
+        return unifier.unify(left, right)
+    except UnificationError:
+        return None
+
+
+def make_operation(name: str, case: Case) -> Tuple[Callable[[], object], int]:
+    """Prepare the inputs of operation `name` outside the timed region; return the timed callable and its item count."""
+    if name == "parse":
+        texts = [str(term) for pair in case.pairs for term in pair]
+        return (lambda: [ParserAIMA.parse_term(text) for text in texts]), len(texts)
+    if name.startswith("unify/"):
+        unifier = Unifier(engine=name.split("/", 1)[1])
+        return (lambda: [_try_unify(unifier, left, right) for left, right in case.pairs]), len(case.pairs)
+
+    reference = Unifier(engine="union_find")
+    solved = [(left, mgu) for left, right in case.pairs
+              for mgu in [_try_unify(reference, left, right)] if mgu is not None]
+    if name == "apply":
+        return (lambda: [left.apply_substitution(mgu) for left, mgu in solved]), len(solved)
+    if name == "print":
+        return (lambda: [str(mgu) for _, mgu in solved]), len(solved)
+    raise ValueError(f"Unknown operation '{name}'. Expected one of: {', '.join(OPERATIONS)}")
+
+
+# Measurement
+def measure(func: Callable[[], object], min_time: float = 0.2, repeat: int = 3) -> float:
+    """Return the best seconds per call over `repeat` rounds, each running for at least `min_time`."""
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak bytes allocated by one call (traced separately from timing)."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(profile: str = "quick", only: Optional[Sequence[str]] = None,
+              operations: Sequence[str] = OPERATIONS, min_time: float = 0.2, repeat: int = 3,
+              progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """Run every (case, operation) combination and return the JSON-serializable report."""
+    results = []
+    for case in build_cases(profile, only):
+        for operation in operations:
+            func, items = make_operation(operation, case)
+            if not items:
+                continue   # e.g. applying the MGU of a pair that never unifies
+            seconds = measure(func, min_time, repeat)
+            record = {
+                "case": f"{case.family}/{case.size}",
+                "operation": operation,
+                "items": items,
+                "seconds_per_call": seconds,
+                "ops_per_sec": items / seconds,
+                "peak_bytes": peak_memory(func),
+            }
+            results.append(record)
+            if progress is not None:
+                progress(record)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "profile": profile,
+            "min_time": min_time,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    Pair up results by (case, operation) and return one row per pair with the relative change
+    in ops/sec; rows slower by more than `threshold` are flagged as regressions.
+    """
+    previous = {(r["case"], r["operation"]): r for r in baseline.get("results", [])}
+    rows = []
+    for record in current["results"]:
+        before = previous.get((record["case"], record["operation"]))
+        if before is None or not before["ops_per_sec"]:
+            continue
+        change = record["ops_per_sec"] / before["ops_per_sec"] - 1
+        rows.append({"case": record["case"], "operation": record["operation"], "change": change,
+                     "regression": change < -threshold})
+    return rows
+
+
+# Reporting
+def format_record(record: dict) -> str:
+    """Return one aligned table line for a result record."""
+    return (f"{record['case']:<24} {record['operation']:<18} {record['ops_per_sec']:>14,.1f} ops/s "
+            f"{record['peak_bytes'] / 1024:>12,.1f} KiB")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Unification benchmark suite")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="problem sizes to run")
+    parser.add_argument("--only", nargs="+", metavar="FAMILY", help="restrict to these term families")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS),
+                        help="operations to time")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timing round")
+    parser.add_argument("--repeat", type=int, default=3, help="timing rounds per measurement (best is kept)")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON report to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a previous JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the suite; exit status 1 when `--compare` finds regressions."""
+    args = parse_args(argv)
+    report = run_suite(args.profile, args.only, args.operations, args.min_time, args.repeat,
+                       progress=lambda record: print(format_record(record), flush=True))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if not args.compare:
+        return 0
+
+    with open(args.compare, encoding="utf-8") as handle:
+        rows = compare(report, json.load(handle), args.threshold)
+    print()
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['case']:<24} {row['operation']:<18} {row['change']:>+8.1%}{flag}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
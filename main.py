@@ -1,15 +1,62 @@
+import argparse
+import sys
+
+from src.io.batch import FORMATS, run_batch
 from src.io.input_handler import InputHandler
 from src.logic.parser import ParserAIMA
 from src.logic.unifier import Unifier
 from src.models.errors import InputError, UnificationError
 from src.utils.printer import Printer
+from tests.test_unification import run_all_tests
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options; without options the interactive menu is started."""
+    parser = argparse.ArgumentParser(description="Unification Algorithm - KRPS Project")
+    parser.add_argument("--batch", metavar="FILE", nargs="?", const="-",
+                        help="non-interactive mode: unify every 'expr1 ; expr2' line of FILE "
+                             "(or stdin when FILE is omitted or '-') and print one result per line")
+    parser.add_argument("--format", choices=FORMATS, default="text",
+                        help="record format for --batch: tab-separated text or JSON Lines (default: text)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes for --batch (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=1000,
+                        help="pairs sent to a worker at a time in --batch mode (default: 1000)")
+    parser.add_argument("--engine", choices=Unifier.ENGINES, default="recursive",
+                        help="unification backend (default: recursive)")
+    parser.add_argument("--tests", action="store_true",
+                        help="run the predefined tests once, without prompts, colors or delays")
+    parser.add_argument("--no-color", action="store_true", help="disable ANSI colors in interactive mode")
+    parser.add_argument("--no-delay", action="store_true", help="disable the cosmetic processing delays")
+    return parser.parse_args(argv)
+
+
+def run_batch_mode(args: argparse.Namespace) -> int:
+    """Run the non-interactive batch mode; the exit status is 1 if any pair failed."""
+    if args.batch == "-":
+        failures = run_batch(sys.stdin, sys.stdout, engine=args.engine, workers=args.workers,
+                             chunk_size=args.chunk_size, fmt=args.format)
+    else:
+        with open(args.batch, "r", encoding="utf-8") as stream:
+            failures = run_batch(stream, sys.stdout, engine=args.engine, workers=args.workers,
+                                 chunk_size=args.chunk_size, fmt=args.format)
+    return 1 if failures else 0
 
 
 def main():
     """CLI entry point for running the unification playground."""
+    args = parse_args()
+    if args.batch or args.tests:
+        # Non-interactive modes: no banners, colors or sleeps
+        Printer.configure(color=False, delays=False)
+        if args.tests:
+            run_all_tests()
+            return
+        sys.exit(run_batch_mode(args))
 
+    Printer.configure(color=not args.no_color, delays=not args.no_delay)
     handler = InputHandler()
-    unifier = Unifier(verbose=False)
+    unifier = Unifier(verbose=False, engine=args.engine)
 
     while True:
         Printer.print_menu()
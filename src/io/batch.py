@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from functools import partial
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+from src.utils.parallel import ordered_chunk_map
+
+PAIR_SEPARATOR = ";"
+FORMATS = ("text", "jsonl")
+
+
+def read_pair_lines(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """Yield `(line_number, text)` for every non-blank, non-comment line of a pairs file."""
+    for line_no, line in enumerate(stream, start=1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield line_no, text
+
+
+def unify_line(unifier: Unifier, text: str):
+    """Split an `expr1 ; expr2` line and unify both sides, returning the MGU or a `UnificationError`."""
+    left, sep, right = text.partition(PAIR_SEPARATOR)
+    if not sep or not left.strip() or not right.strip():
+        return UnificationError(f"Expected 'expr1 {PAIR_SEPARATOR} expr2', got '{text}'")
+    return unifier.unify_pair(left.strip(), right.strip())
+
+
+def format_outcome(line_no: int, outcome, fmt: str = "text") -> str:
+    """
+    Render one outcome as a single-line record:
+    - text:  tab-separated `line  OK|FAIL  detail`
+    - jsonl: `{"line": n, "ok": true, "mgu": {"x": "A"}}` or `{"line": n, "ok": false, "error": "..."}`
+    """
+    failed = isinstance(outcome, UnificationError)
+    if fmt == "jsonl":
+        if failed:
+            record = {"line": line_no, "ok": False, "error": str(outcome)}
+        else:
+            record = {"line": line_no, "ok": True,
+                      "mgu": {var: str(term) for var, term in outcome.mapping.items()}}
+        return json.dumps(record, ensure_ascii=False)
+    if failed:
+        return f"{line_no}\tFAIL\t{outcome}"
+    return f"{line_no}\tOK\t{outcome}"
+
+
+def _process_lines(engine: str, fmt: str, lines: List[Tuple[int, str]]) -> List[Tuple[bool, str]]:
+    """Worker entry point: parse, unify and format one chunk of lines as `(failed, record)` pairs."""
+    unifier = Unifier(engine=engine)
+    results = []
+    for line_no, text in lines:
+        outcome = unify_line(unifier, text)
+        results.append((isinstance(outcome, UnificationError), format_outcome(line_no, outcome, fmt)))
+    return results
+
+
+def run_batch(stream: TextIO, out: TextIO, engine: str = "recursive", workers: Optional[int] = None,
+              chunk_size: int = 1000, fmt: str = "text") -> int:
+    """
+    Unify every `expr1 ; expr2` line of `stream` across `workers` processes and write one
+    `fmt` record per line to `out`, in input order. Returns the number of failed pairs.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'. Expected one of: {', '.join(FORMATS)}")
+    failures = 0
+    for failed, record in ordered_chunk_map(partial(_process_lines, engine, fmt), read_pair_lines(stream),
+                                            workers, chunk_size):
+        failures += failed
+        out.write(record + "\n")
+    return failures
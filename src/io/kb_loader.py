@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import contextlib
+import os
+from typing import Callable, Iterator, List, NamedTuple, Optional, TextIO, Union
+
+from src.logic.parser import ParserAIMA
+from src.models.literal import Literal
+
+Source = Union[str, os.PathLike, TextIO]
+ProgressCallback = Callable[[int, int, int], None]
+
+
+class LoadError(NamedTuple):
+    """A statement that could not be parsed: 1-based `line` where it ends, its `text` and the parser `message`."""
+
+    line: int
+    text: str
+    message: str
+
+
+class KnowledgeBaseLoader:
+    """
+    Streams a knowledge-base file into parsed clauses without reading it into memory.
+
+    Statements are AIMA literals or disjunctions (`¬P(x) ∨ Q(x)`), one per line or terminated
+    by `.` (a statement may span several lines while a parenthesis is open or a line ends with `∨`).
+    Blank lines and lines starting with `#` or `%` are ignored. Malformed statements are
+    recorded in `errors` (at most `max_errors` of them, `error_count` keeps the total) and
+    loading continues with the next statement.
+    """
+
+    COMMENT_PREFIXES = ("#", "%")
+
+    def __init__(self, source: Source, progress: Optional[ProgressCallback] = None,
+                 progress_every: int = 100_000, max_errors: int = 1000,
+                 max_statement_length: int = 1_000_000):
+        """
+        Parameters:
+        - source: path to the file or an already opened text stream
+        - progress: optional callback `progress(lines_read, statements_loaded, error_count)`
+        - progress_every: number of lines between two progress reports
+        - max_errors: maximum number of `LoadError` records kept in memory
+        - max_statement_length: statements longer than this are rejected so a missing
+          `.` or `)` cannot make the buffer grow without bound
+        """
+        self.source = source
+        self.progress = progress
+        self.progress_every = progress_every
+        self.max_errors = max_errors
+        self.max_statement_length = max_statement_length
+        self.errors: List[LoadError] = []
+        self.error_count = 0
+        self.lines_read = 0
+        self.statements_loaded = 0
+
+    # Public generators
+    def clauses(self) -> Iterator[List[Literal]]:
+        """Yield every statement as a list of literals (a unit clause for a single literal)."""
+        for _, _, clause in self._parsed():
+            self.statements_loaded += 1
+            yield clause
+
+    def literals(self) -> Iterator[Literal]:
+        """Yield facts one by one; disjunctive statements are reported as errors."""
+        for line_no, statement, clause in self._parsed():
+            if len(clause) != 1:
+                self._record_error(line_no, statement, "Expected a single literal, found a disjunction")
+                continue
+            self.statements_loaded += 1
+            yield clause[0]
+
+    def _parsed(self) -> Iterator[tuple]:
+        """Yield `(line_number, statement_text, clause)` for every statement that parses."""
+        for line_no, statement in self._statements():
+            try:
+                clause = ParserAIMA.parse_clause(statement)
+            except ValueError as e:
+                self._record_error(line_no, statement, str(e))
+                continue
+            yield line_no, statement, clause
+
+    # Statement splitting
+    def _statements(self) -> Iterator[tuple]:
+        """Yield `(line_number, statement_text)` pairs from the underlying stream."""
+        self.errors, self.error_count = [], 0
+        self.lines_read = self.statements_loaded = 0
+        with self._open() as stream:
+            pending = ""
+            for line_no, line in enumerate(stream, start=1):
+                self.lines_read = line_no
+                if self.progress is not None and line_no % self.progress_every == 0:
+                    self.progress(line_no, self.statements_loaded, self.error_count)
+
+                stripped = line.strip()
+                if not stripped or stripped.startswith(self.COMMENT_PREFIXES):
+                    continue
+
+                pieces = (pending + " " + stripped if pending else stripped).split(".")
+                pending = pieces.pop()
+                for piece in pieces:
+                    if piece.strip():
+                        yield line_no, piece.strip()
+
+                # A line break ends the statement unless it is visibly incomplete
+                if not self._is_incomplete(pending):
+                    if pending.strip():
+                        yield line_no, pending.strip()
+                    pending = ""
+                elif len(pending) > self.max_statement_length:
+                    self._record_error(line_no, pending[:80] + "...", "Statement exceeds maximum length")
+                    pending = ""
+
+            if pending.strip():
+                self._record_error(self.lines_read, pending.strip(), "Unterminated statement at end of input")
+
+        if self.progress is not None:
+            self.progress(self.lines_read, self.statements_loaded, self.error_count)
+
+    @staticmethod
+    def _is_incomplete(statement: str) -> bool:
+        """Return True if a parenthesis is still open or the text ends with a `∨` connective."""
+        return statement.count("(") > statement.count(")") or statement.rstrip().endswith(("∨", "|"))
+
+    def _open(self):
+        """Return a context manager over the text stream (caller-owned streams are not closed)."""
+        if hasattr(self.source, "read"):
+            return contextlib.nullcontext(self.source)
+        return open(self.source, "r", encoding="utf-8")
+
+    def _record_error(self, line_no: int, text: str, message: str):
+        """Count an error and keep its details while under `max_errors`."""
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(LoadError(line_no, text, message))
+
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.models.literal import Literal
+from src.models.rule import Rule
+from src.models.symbols import CONSTANT, SYMBOLS
+from src.models.term import Constant, Variable
+
+FactLike = Union[str, Literal]
+RuleLike = Union[str, Rule]
+
+# A row of a relation: symbol ids of interned constants
+Row = Tuple[int, ...]
+# Compiled argument: ("var", slot) or ("const", symbol id)
+Arg = Tuple[str, int]
+
+
+def _row_getter(indices: Sequence[int]) -> Callable[[Sequence[int]], Row]:
+    """Return a function picking `indices` out of a sequence, always as a tuple."""
+    if not indices:
+        return lambda _: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda values: (values[index],)
+    return itemgetter(*indices)
+
+
+def _key_getter(indices: Sequence[int]) -> Callable[[Sequence[int]], Hashable]:
+    """Return a function picking the hash key `indices` out of a sequence (a bare value for one index)."""
+    return itemgetter(*indices) if indices else lambda _: ()
+
+
+class _Relation:
+    """Set of rows of one predicate, with hash indexes on the argument positions that joins look up."""
+
+    __slots__ = ("rows", "indexes")
+
+    def __init__(self):
+        self.rows: Set[Row] = set()
+        # positions -> (key function, key -> rows)
+        self.indexes: Dict[Tuple[int, ...], Tuple[Callable[[Row], Hashable], Dict[Hashable, List[Row]]]] = {}
+
+    def add(self, row: Row) -> bool:
+        """Insert `row`; return False if it was already present."""
+        if row in self.rows:
+            return False
+        self.rows.add(row)
+        for key_of, index in self.indexes.values():
+            key = key_of(row)
+            bucket = index.get(key)
+            if bucket is None:
+                index[key] = [row]
+            else:
+                bucket.append(row)
+        return True
+
+    def add_all(self, rows: Iterable[Row]) -> Set[Row]:
+        """Insert `rows` in bulk; return the ones that were new."""
+        fresh = set(rows)
+        fresh.difference_update(self.rows)
+        self.rows |= fresh
+        for key_of, index in self.indexes.values():
+            for row in fresh:
+                key = key_of(row)
+                bucket = index.get(key)
+                if bucket is None:
+                    index[key] = [row]
+                else:
+                    bucket.append(row)
+        return fresh
+
+    def index(self, positions: Tuple[int, ...]) -> Dict[Hashable, List[Row]]:
+        """Return the index on `positions`, building it on first use (it is maintained by `add`)."""
+        entry = self.indexes.get(positions)
+        if entry is None:
+            key_of = _key_getter(positions)
+            index: Dict[Hashable, List[Row]] = {}
+            for row in self.rows:
+                key = key_of(row)
+                bucket = index.get(key)
+                if bucket is None:
+                    index[key] = [row]
+                else:
+                    bucket.append(row)
+            entry = self.indexes[positions] = (key_of, index)
+        return entry[1]
+
+
+class _Step:
+    """
+    One body literal of a join plan. The slots of constants and of variables bound by earlier
+    literals form the lookup key (`key_positions` in the row, `key_of` over the bindings);
+    `checks` compare repeated new variables and `out_positions` bind the new ones.
+    """
+
+    __slots__ = ("predicate", "key_positions", "key_of", "tests", "checks", "out")
+
+    def __init__(self, predicate: int, slots: Sequence[int], bound: Set[int], template: List[int]):
+        self.predicate = predicate
+        key_positions: List[int] = []
+        key_slots: List[int] = []
+        checks: List[Tuple[int, int]] = []       # (position, earlier position of the same new variable)
+        out: List[Tuple[int, int]] = []          # (position, slot)
+        first: Dict[int, int] = {}
+        for position, slot in enumerate(slots):
+            if slot in bound:
+                key_positions.append(position)
+                key_slots.append(slot)
+            elif slot in first:
+                checks.append((position, first[slot]))
+            else:
+                first[slot] = position
+                out.append((position, slot))
+        bound.update(first)
+        self.key_positions = tuple(key_positions)
+        self.key_of = _key_getter(key_slots)
+        # Seed literals are scanned, not looked up: their key slots can only hold constants
+        self.tests = tuple((position, template[slot]) for position, slot in zip(key_positions, key_slots))
+        self.checks = tuple(checks)
+        self.out = tuple(out)
+
+
+class _CompiledRule:
+    """
+    A range-restricted rule over numbered slots: variables first, then one slot per constant
+    (pre-filled in `template`), with one join plan per body literal.
+    """
+
+    __slots__ = ("rule", "head", "head_of", "body", "template", "plans")
+
+    def __init__(self, rule: Rule, head: int, head_args: Tuple[Arg, ...],
+                 body: Tuple[Tuple[int, Tuple[Arg, ...]], ...], variables: int):
+        self.rule = rule
+        self.head = head
+        self.body = body
+        self.template = [0] * variables
+        constants: Dict[int, int] = {}
+
+        def slots_of(args: Tuple[Arg, ...]) -> Tuple[int, ...]:
+            result = []
+            for kind, value in args:
+                if kind == "const" and value not in constants:
+                    constants[value] = len(self.template)
+                    self.template.append(value)
+                result.append(constants[value] if kind == "const" else value)
+            return tuple(result)
+
+        body_slots = [(predicate, slots_of(args)) for predicate, args in body]
+        self.head_of = _row_getter(slots_of(head_args))
+        # Plan j starts from the delta of body literal j and joins the others in rule order
+        self.plans: List[Tuple[_Step, Tuple[_Step, ...]]] = []
+        for j, (predicate, slots) in enumerate(body_slots):
+            bound = set(constants.values())
+            seed = _Step(predicate, slots, bound, self.template)
+            rest = tuple(_Step(p, a, bound, self.template) for i, (p, a) in enumerate(body_slots) if i != j)
+            self.plans.append((seed, rest))
+
+
+class DatalogEngine:
+    """
+    Bottom-up evaluation of function-free definite rules (Datalog) over ground facts.
+
+    Relations are sets of tuples of interned constant ids (the `SYMBOLS` ids of the constants),
+    hash-indexed on the argument positions that rule bodies look up. `run` computes the least
+    fixpoint semi-naively: each round only joins the facts derived in the previous round (the
+    delta relations) with the full relations, so no derivation is repeated across rounds.
+    Joins are hash joins on the index of the bound positions of each body literal.
+
+    Rules and facts use the AIMA syntax of `ParserAIMA.parse_rule`. Facts added after a
+    fixpoint become the delta of the next `run`, so the closure is extended incrementally.
+    """
+
+    def __init__(self, rules: Iterable[RuleLike] = (), facts: Iterable[FactLike] = ()):
+        """Create an engine holding `rules` and `facts` (evaluated by `run` or the first query)."""
+        self._rules: List[_CompiledRule] = []
+        self._by_body: Dict[int, List[Tuple[_CompiledRule, int]]] = {}
+        self._relations: Dict[int, _Relation] = {}
+        self._delta: Dict[int, Set[Row]] = {}
+        self._stale: List[_CompiledRule] = []   # rules added since the last run, to be fired on everything
+        for rule in rules:
+            self.add_rule(rule)
+        for fact in facts:
+            self.add_fact(fact)
+
+    # Rules and facts
+    def add_rule(self, rule: RuleLike):
+        """Compile a function-free, range-restricted rule (a bodiless rule is added as a fact)."""
+        if isinstance(rule, str):
+            rule = ParserAIMA.parse_rule(rule)
+        if rule.is_fact:
+            self.add_fact(rule.head)
+            return
+        compiled = self._compile(rule)
+        self._rules.append(compiled)
+        for j, (predicate, _) in enumerate(compiled.body):
+            self._by_body.setdefault(predicate, []).append((compiled, j))
+        self._stale.append(compiled)
+
+    def _compile(self, rule: Rule) -> _CompiledRule:
+        """Number the variables of a function-free rule and build its join plans."""
+        slots: Dict[str, int] = {}
+        body = tuple((lit.symbol_id, self._compile_args(lit, slots, rule)) for lit in rule.body)
+        body_slots = len(slots)
+        head_args = self._compile_args(rule.head, slots, rule)
+        if len(slots) > body_slots:
+            raise ValueError(f"Rule is not range-restricted, head variables must occur in the body: {rule}")
+        return _CompiledRule(rule, rule.head.symbol_id, head_args, body, body_slots)
+
+    @staticmethod
+    def _compile_args(literal: Literal, slots: Dict[str, int], rule: Rule) -> Tuple[Arg, ...]:
+        """Return the compiled arguments of a rule literal, numbering new variables in `slots`."""
+        args: List[Arg] = []
+        for arg in literal.arguments:
+            if isinstance(arg, Variable):
+                args.append(("var", slots.setdefault(arg.name, len(slots))))
+            elif isinstance(arg, Constant):
+                args.append(("const", arg.symbol_id))
+            else:
+                raise ValueError(f"Datalog rules are function-free, found {arg} in: {rule}")
+        return tuple(args)
+
+    def add_fact(self, fact: FactLike) -> bool:
+        """Add a ground, function-free fact; return False if it is already known."""
+        if isinstance(fact, str):
+            fact = ParserAIMA.parse_literal(fact)
+        if fact.negated or not all(isinstance(arg, Constant) for arg in fact.arguments):
+            raise ValueError(f"Datalog facts must be positive and made of constants: {fact}")
+        return self._add_row(fact.symbol_id, tuple(arg.symbol_id for arg in fact.arguments))
+
+    def add_rows(self, predicate: str, rows: Iterable[Sequence[Hashable]]) -> int:
+        """
+        Bulk-load rows of constant symbols (e.g. `("Tom", "Bob")`) into `predicate`, without
+        building literals; return the number of new rows.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        predicate_id = Literal(predicate, [Constant(symbol) for symbol in first]).symbol_id
+        intern = SYMBOLS.intern
+        return self._add_rows(predicate_id, (tuple(intern(symbol, CONSTANT) for symbol in row)
+                                             for row in chain((first,), rows)))
+
+    def _add_row(self, predicate: int, row: Row) -> bool:
+        """Insert a row and queue it in the delta of its relation."""
+        relation = self._relations.get(predicate)
+        if relation is None:
+            relation = self._relations[predicate] = _Relation()
+        if not relation.add(row):
+            return False
+        self._delta.setdefault(predicate, set()).add(row)
+        return True
+
+    def _add_rows(self, predicate: int, rows: Iterable[Row]) -> int:
+        """Insert rows in bulk and queue the new ones in the delta of their relation; return how many."""
+        relation = self._relations.get(predicate)
+        if relation is None:
+            relation = self._relations[predicate] = _Relation()
+        fresh = relation.add_all(rows)
+        if fresh:
+            delta = self._delta.get(predicate)
+            if delta is None:
+                self._delta[predicate] = fresh
+            else:
+                delta |= fresh
+        return len(fresh)
+
+    # Evaluation
+    def run(self) -> int:
+        """Extend the relations to the fixpoint of the rules; return the number of derived rows."""
+        derived = 0
+        stale, self._stale = self._stale, []
+        while self._delta or stale:
+            delta, self._delta = self._delta, {}
+            new: Dict[int, Set[Row]] = {}
+            # A new rule is joined once over the full relations, pending delta included, so it
+            # skips that delta and only sees the deltas of later rounds
+            for compiled in stale:
+                relation = self._relations.get(compiled.body[0][0])
+                if relation is not None:
+                    self._join(compiled, 0, relation.rows, new)
+            fired = set(stale)
+            for predicate, rows in delta.items():
+                for compiled, j in self._by_body.get(predicate, ()):
+                    if compiled not in fired:
+                        self._join(compiled, j, rows, new, delta)
+            derived += self._insert(new)
+            stale = []
+        return derived
+
+    def _insert(self, new: Dict[int, Set[Row]]) -> int:
+        """Add derived rows (they form the next delta); return how many were new."""
+        return sum(self._add_rows(predicate, rows) for predicate, rows in new.items())
+
+    def _join(self, compiled: _CompiledRule, j: int, rows: Iterable[Row], new: Dict[int, Set[Row]],
+              delta: Optional[Dict[int, Set[Row]]] = None) -> Dict[int, Set[Row]]:
+        """
+        Join `rows` of body literal `j` with the relations of the other literals and collect the
+        head rows not yet known in `new`. With `delta`, the literals before `j` skip delta rows,
+        so a match built from several delta rows is found by one plan only.
+        """
+        seed, rest = compiled.plans[j]
+        # Each literal is a generator over the previous one, so partial matches stream through
+        partial = self._scan(seed, rows, compiled.template)
+        for k, step in enumerate(rest):
+            relation = self._relations.get(step.predicate)
+            if relation is None:
+                return new
+            skip = delta.get(step.predicate) if delta is not None and k < j else None
+            if skip is not None and len(skip) == len(relation.rows):
+                return new  # the relation has no rows older than the delta
+            partial = self._probe(step, relation.index(step.key_positions), partial, skip)
+        head = self._relations.get(compiled.head)
+        known = head.rows if head is not None else ()
+        head_of = compiled.head_of
+        target = new.setdefault(compiled.head, set())
+        for bindings in partial:
+            row = head_of(bindings)
+            if row not in known:
+                target.add(row)
+        return new
+
+    @staticmethod
+    def _scan(step: _Step, rows: Iterable[Row], template: List[int]) -> Iterator[List[int]]:
+        """Yield the bindings of the rows passing the constant and repeated-variable tests of `step`."""
+        tests, checks, out = step.tests, step.checks, step.out
+        for row in rows:
+            if tests and any(row[p] != value for p, value in tests):
+                continue
+            if checks and any(row[p] != row[q] for p, q in checks):
+                continue
+            bindings = template[:]
+            for position, slot in out:
+                bindings[slot] = row[position]
+            yield bindings
+
+    @staticmethod
+    def _probe(step: _Step, index: Dict[Hashable, List[Row]], partial: Iterable[List[int]],
+               skip: Optional[Set[Row]]) -> Iterator[List[int]]:
+        """Yield every extension of the `partial` bindings by a row of `index` matching `step` (hash join)."""
+        key_of, checks, out = step.key_of, step.checks, step.out
+        for bindings in partial:
+            for row in index.get(key_of(bindings), ()):
+                if checks and any(row[p] != row[q] for p, q in checks):
+                    continue
+                if skip and row in skip:
+                    continue
+                if out:
+                    extension = bindings[:]
+                    for position, slot in out:
+                        extension[slot] = row[position]
+                    yield extension
+                else:
+                    yield bindings
+
+    # Queries
+    def ask(self, query: Union[str, Literal, Sequence[Literal]]) -> Iterator[Substitution]:
+        """
+        Run to the fixpoint, then yield one substitution over the query variables per distinct
+        answer to the conjunctive `query` (strings are parsed as `L1 ∧ L2 ∧ ...`).
+        """
+        if isinstance(query, str):
+            literals = ParserAIMA.parse_conjunction(query)
+        elif isinstance(query, Literal):
+            literals = [query]
+        else:
+            literals = list(query)
+        self.run()
+        names: Dict[str, None] = {}
+        for lit in literals:
+            for name in lit.variables():
+                names.setdefault(name)
+        goal = Literal("?-", [Variable(name) for name in names])
+        compiled = self._compile(Rule(goal, tuple(literals)))
+        relation = self._relations.get(compiled.body[0][0])
+        if relation is None:
+            return
+        symbols = SYMBOLS.names
+        for row in self._join(compiled, 0, relation.rows, {}).get(goal.symbol_id, ()):
+            yield Substitution({name: Constant(symbols[value]) for name, value in zip(names, row)})
+
+    def facts(self, predicate: Optional[str] = None) -> Iterator[Literal]:
+        """Run to the fixpoint, then yield every fact, or only those of `predicate`."""
+        self.run()
+        names = SYMBOLS.names
+        for predicate_id, relation in self._relations.items():
+            name = names[predicate_id]
+            if predicate is None or name == predicate:
+                for row in relation.rows:
+                    yield Literal(name, [Constant(names[value]) for value in row])
+
+    def __contains__(self, fact: FactLike) -> bool:
+        """Return True if `fact` holds (after running to the fixpoint)."""
+        if isinstance(fact, str):
+            fact = ParserAIMA.parse_literal(fact)
+        if not all(isinstance(arg, Constant) for arg in fact.arguments):
+            return False
+        self.run()
+        relation = self._relations.get(fact.symbol_id)
+        return relation is not None and tuple(arg.symbol_id for arg in fact.arguments) in relation.rows
+
+    def __len__(self) -> int:
+        """Return the number of rows over all relations (after running to the fixpoint)."""
+        self.run()
+        return sum(len(relation.rows) for relation in self._relations.values())
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.logic.substitution import Substitution
+from src.models.flatterm import FlatTerm
+from src.models.symbols import VARIABLE
+
+# A binding points at a subterm of some flatterm: (term, position)
+Position = Tuple[FlatTerm, int]
+FlatBindings = Dict[int, FlatTerm]
+
+
+def flat_unify(left: FlatTerm, right: FlatTerm, occurs_check: bool = True) -> Optional[FlatBindings]:
+    """
+    Unify two flatterms directly on their arrays; return `{variable id: FlatTerm}` or None.
+
+    Variables are bound to positions inside the input arrays (no copying while solving), and
+    functor, arity and kind are checked with a single integer comparison. Bindings are fully
+    resolved at the end, so the result matches the MGU returned by `Unifier.unify`.
+    Both sides must use the same symbol table. Without `occurs_check` the bindings may be
+    cyclic; they come back as rational trees (`x` / `f(x)`), like the union-find engine's.
+    """
+    if left.table is not right.table:
+        raise ValueError("Flatterms must share a symbol table to be unified")
+    kinds, arities = left.table.kinds, left.table.arities
+    bindings: Dict[int, Position] = {}
+    # Compound pairs already decomposed; cyclic bindings would otherwise repeat them forever
+    solved: Set[Tuple[int, int, int, int]] = set()
+    stack = [(left, 0, right, 0)]
+    while stack:
+        t1, i1, t2, i2 = stack.pop()
+        t1, i1 = _deref(t1, i1, bindings, kinds)
+        t2, i2 = _deref(t2, i2, bindings, kinds)
+        if t1 is t2 and i1 == i2:
+            continue
+        s1 = t1.symbols[i1]
+        s2 = t2.symbols[i2]
+        if kinds[s1] == VARIABLE:
+            if s1 == s2:
+                continue
+            if occurs_check and _occurs(s1, t2, i2, bindings, kinds):
+                return None
+            bindings[s1] = (t2, i2)
+            continue
+        if kinds[s2] == VARIABLE:
+            if occurs_check and _occurs(s2, t1, i1, bindings, kinds):
+                return None
+            bindings[s2] = (t1, i1)
+            continue
+        if s1 != s2:
+            return None
+        key = (id(t1), i1, id(t2), i2)
+        if key in solved:
+            continue
+        solved.add(key)
+        # Same functor and arity: queue argument pairs so the first one is solved first
+        c1, c2 = i1 + 1, i2 + 1
+        pairs = []
+        for _ in range(arities[s1]):
+            pairs.append((t1, c1, t2, c2))
+            c1, c2 = t1.skips[c1], t2.skips[c2]
+        pairs.reverse()
+        stack.extend(pairs)
+    return {var: _resolve(term, position, bindings, kinds, var) for var, (term, position) in bindings.items()}
+
+
+def flat_match(pattern: FlatTerm, instance: FlatTerm) -> Optional[FlatBindings]:
+    """
+    One-way matching on flatterms: bind only pattern variables so that `pattern` becomes
+    `instance`. Both terms are walked in a single left-to-right pass over their arrays.
+    """
+    if pattern.table is not instance.table:
+        raise ValueError("Flatterms must share a symbol table to be matched")
+    kinds = pattern.table.kinds
+    p_symbols, i_symbols, i_skips = pattern.symbols, instance.symbols, instance.skips
+    spans: Dict[int, Tuple[int, int]] = {}
+    i = j = 0
+    while i < len(p_symbols):
+        symbol = p_symbols[i]
+        if kinds[symbol] == VARIABLE:
+            end = i_skips[j]
+            bound = spans.get(symbol)
+            if bound is None:
+                spans[symbol] = (j, end)
+            elif i_symbols[bound[0]:bound[1]] != i_symbols[j:end]:
+                return None
+            i, j = i + 1, end
+        elif symbol == i_symbols[j]:
+            i, j = i + 1, j + 1
+        else:
+            return None
+    return {var: instance.subterm(start) for var, (start, _) in spans.items()}
+
+
+def to_substitution(bindings: FlatBindings) -> Substitution:
+    """Convert flat bindings into a regular `Substitution` keyed by variable name."""
+    mapping = {}
+    for var, term in bindings.items():
+        mapping[term.table.names[var]] = term.to_term()
+    return Substitution(mapping)
+
+
+def _deref(term: FlatTerm, position: int, bindings: Dict[int, Position], kinds) -> Position:
+    """
+    Follow variable bindings until reaching an unbound variable or a non-variable.
+    Variables are only bound to dereferenced positions other than themselves, so variable
+    chains cannot loop; cycles can only pass through a function symbol (see `_resolve`).
+    """
+    while True:
+        symbol = term.symbols[position]
+        if kinds[symbol] != VARIABLE:
+            return term, position
+        target = bindings.get(symbol)
+        if target is None:
+            return term, position
+        term, position = target
+
+
+def _occurs(var: int, term: FlatTerm, position: int, bindings: Dict[int, Position], kinds) -> bool:
+    """Return True if `var` occurs in the subterm at `position`, looking through bindings."""
+    stack = [(term, position)]
+    while stack:
+        term, position = stack.pop()
+        symbols = term.symbols
+        for k in range(position, term.skips[position]):
+            symbol = symbols[k]
+            if kinds[symbol] == VARIABLE:
+                if symbol == var:
+                    return True
+                target = bindings.get(symbol)
+                if target is not None:
+                    stack.append(target)
+    return False
+
+
+def _resolve(term: FlatTerm, position: int, bindings: Dict[int, Position], kinds, var: int) -> FlatTerm:
+    """
+    Copy the subterm at `position` (the value of `var`), replacing bound variables by their
+    resolved values. A variable met again inside its own value (only possible without the
+    occurs check) is left in place, so the rational tree x = f(x) comes back as `f(x)`.
+    """
+    table = term.table
+    symbols = array("i")
+    expanding = {var}
+    # Entries are positions to copy, or (None, variable) once that variable's value is copied
+    stack: List[Tuple[Optional[FlatTerm], int]] = [(term, position)]
+    while stack:
+        term, position = stack.pop()
+        if term is None:
+            expanding.discard(position)
+            continue
+        end = term.skips[position]
+        source = term.symbols
+        # Copy maximal runs that contain no variable to expand in one slice
+        k = position
+        while k < end:
+            symbol = source[k]
+            if kinds[symbol] == VARIABLE and symbol in bindings and symbol not in expanding:
+                break
+            k += 1
+        if k == end:
+            symbols.extend(source[position:end])
+            continue
+        symbols.extend(source[position:k])
+        # Defer the rest: the bound variable's value, then every sibling after it
+        rest = []
+        symbol = source[k]
+        after = k + 1
+        while after < end:
+            rest.append((term, after))
+            after = term.skips[after]
+        rest.reverse()
+        stack.extend(rest)
+        expanding.add(symbol)
+        stack.append((None, symbol))
+        stack.append(bindings[symbol])
+    return FlatTerm.from_symbols(symbols, table)
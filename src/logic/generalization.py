@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.models.errors import ParseError
+from src.models.literal import Literal
+from src.models.term import Function, Term, Variable
+
+Generalizable = Union[Term, Literal]
+GeneralizableLike = Union[str, Term, Literal]
+
+# Disagreement table: the subterms found at one position of every input -> their variable
+DisagreementTable = Dict[Tuple[Term, ...], Variable]
+
+
+def generalize(t1: GeneralizableLike, t2: GeneralizableLike) -> Optional[Tuple[Generalizable, Substitution, Substitution]]:
+    """
+    Anti-unification: return the least general generalization `g` of two terms or literals,
+    with θ1 and θ2 such that `g`θ1 == t1 and `g`θ2 == t2, or None if there is none (literals
+    with different predicates or signs, or a term and a literal). See `generalize_all`.
+    """
+    result = generalize_all([t1, t2])
+    if result is None:
+        return None
+    general, (theta1, theta2) = result
+    return general, theta1, theta2
+
+
+def generalize_all(items: Sequence[GeneralizableLike]) -> Optional[Tuple[Generalizable, List[Substitution]]]:
+    """
+    Return the least general generalization of n terms or literals and one substitution per
+    input mapping it back to that input, or None if there is none.
+
+    The inputs are traversed once, side by side: positions where all inputs agree are kept
+    (equal subterms are reused as they are), positions with the same function symbol are
+    descended into, and every other position becomes a variable. The disagreement table maps
+    the tuple of subterms at such a position to its variable, so equal disagreements share
+    one variable and `f(a, a)`, `f(b, b)` generalize to `f(z1, z1)`. Fresh variables are
+    named `z1`, `z2`, ..., skipping the names used by the inputs. Strings are parsed as
+    literals, or as terms when they are not literals.
+    """
+    inputs = [_parse(item) if isinstance(item, str) else item for item in items]
+    if not inputs:
+        raise ValueError("Cannot generalize an empty sequence")
+    first = inputs[0]
+    table: DisagreementTable = {}
+    names = _fresh_names(inputs)
+    if isinstance(first, Literal):
+        if any(not isinstance(lit, Literal) or lit.symbol_id != first.symbol_id or lit.negated != first.negated
+               for lit in inputs):
+            return None
+        arguments = [_generalize(tuple(lit.arguments[i] for lit in inputs), table, names)
+                     for i in range(len(first.arguments))]
+        if all(new is old for new, old in zip(arguments, first.arguments)):
+            general: Generalizable = first
+        else:
+            general = Literal(first.name, arguments, first.negated)
+    elif any(isinstance(term, Literal) for term in inputs):
+        return None
+    else:
+        general = _generalize(tuple(inputs), table, names)
+    return general, _substitutions(table, len(inputs))
+
+
+def _parse(text: str) -> Generalizable:
+    """Parse a literal, or a term when `text` is not a literal."""
+    try:
+        return ParserAIMA.parse_literal(text)
+    except ParseError:
+        return ParserAIMA.parse_term(text)
+
+
+def _fresh_names(inputs: Sequence[Generalizable]) -> Iterator[str]:
+    """Yield `z1`, `z2`, ... skipping the variable names of the inputs."""
+    used: Set[str] = set()
+    for item in inputs:
+        used.update(item.variables())
+    return (name for name in (f"z{n}" for n in count(1)) if name not in used)
+
+
+def _substitutions(table: DisagreementTable, size: int) -> List[Substitution]:
+    """Return, for each input, the substitution binding every table variable to that input's subterm."""
+    mappings: List[Dict[str, Term]] = [{} for _ in range(size)]
+    for column, var in table.items():
+        for mapping, term in zip(mappings, column):
+            mapping[var.name] = term
+    return [Substitution(mapping) for mapping in mappings]
+
+
+def _leaf(column: Tuple[Term, ...], table: DisagreementTable, names: Iterator[str]) -> Optional[Term]:
+    """Return the generalization of a column that needs no descent, or None if it must be descended into."""
+    first = column[0]
+    if all(term is first or term == first for term in column):
+        return first
+    if isinstance(first, Function):
+        symbol_id = first.symbol_id
+        if all(term.symbol_id == symbol_id for term in column):
+            return None   # symbol ids encode kind and arity, so these are all functions f/n
+    var = table.get(column)
+    if var is None:
+        var = table[column] = Variable(next(names))
+    return var
+
+
+def _generalize(column: Tuple[Term, ...], table: DisagreementTable, names: Iterator[str]) -> Term:
+    """Return the least general generalization of the terms in `column` (explicit stack, no recursion)."""
+    leaf = _leaf(column, table, names)
+    if leaf is not None:
+        return leaf
+    # Frames: (column of functions sharing a symbol, generalized arguments so far)
+    stack: List[Tuple[Tuple[Term, ...], List[Term]]] = [(column, [])]
+    while True:
+        column, arguments = stack[-1]
+        first = column[0]
+        if len(arguments) == len(first.arguments):
+            stack.pop()
+            term = Function(first.name, arguments)
+            if not stack:
+                return term
+            stack[-1][1].append(term)
+            continue
+        i = len(arguments)
+        child = tuple(term.arguments[i] for term in column)
+        leaf = _leaf(child, table, names)
+        if leaf is None:
+            stack.append((child, []))
+        else:
+            arguments.append(leaf)
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.models.literal import Literal
+from src.models.symbols import SYMBOLS
+from src.models.term import Function, Term, Variable
+
+# Every variable is indexed under the same symbol (an "imperfect" discrimination tree):
+# retrieval returns a superset of the real matches that callers confirm with the Unifier.
+STAR = "*"
+
+Entry = Tuple[Literal, Any]
+
+
+class _TreeNode:
+    """Trie node: children keyed by preorder symbol, `entries` holds literals whose path ends here."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[Any, _TreeNode] = {}
+        self.entries: Dict[Entry, None] = {}
+
+
+def _symbol(term: Term):
+    """Return the index symbol for the root of `term`: its symbol id, or STAR for variables."""
+    if isinstance(term, Variable):
+        return STAR
+    return term.symbol_id
+
+
+def _arity(symbol) -> int:
+    """Number of subterms that follow `symbol` in a preorder traversal."""
+    return 0 if symbol == STAR else SYMBOLS.arities[symbol]
+
+
+def _flatten(arguments) -> List[Tuple[Any, int]]:
+    """
+    Return the preorder symbols of `arguments` as `(symbol, end)` pairs, where `end` is the
+    position right after the subterm rooted at that symbol (used to skip whole subterms).
+    """
+    symbols: List[Any] = []
+    pending = list(reversed(arguments))   # explicit stack, so deep terms are fine
+    ends: List[int] = []
+    parents: List[Tuple[int, int]] = []   # (flat index of an open function, subterms still to emit)
+    while pending:
+        term = pending.pop()
+        index = len(symbols)
+        symbols.append(_symbol(term))
+        ends.append(index + 1)
+        if isinstance(term, Function) and term.arguments:
+            parents.append((index, len(term.arguments)))
+            pending.extend(reversed(term.arguments))
+            continue
+        # Close every parent whose last subterm has just been emitted
+        end = index + 1
+        while parents:
+            parent_index, remaining = parents[-1]
+            if remaining > 1:
+                parents[-1] = (parent_index, remaining - 1)
+                break
+            parents.pop()
+            ends[parent_index] = end
+    return list(zip(symbols, ends))
+
+
+class DiscriminationTree:
+    """
+    Discrimination-tree index over literals for fast candidate retrieval.
+
+    Literals are keyed on (predicate name, negation, arity) and then on the preorder
+    sequence of their argument symbols, with every variable mapped to `*`. Retrieval walks
+    only the branches compatible with the query, so its cost depends on the number of
+    compatible paths rather than on the number of stored literals. Results are candidates:
+    since variables are not distinguished, confirm them with `Unifier` when exactness matters.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self._roots: Dict[Tuple[int, bool], _TreeNode] = {}
+        self._size = 0
+
+    @staticmethod
+    def _root_key(literal: Literal) -> Tuple[int, bool]:
+        """Return the top-level key of a literal: predicate symbol id (name and arity) and sign."""
+        return literal.symbol_id, literal.negated
+
+    # Updates
+    def insert(self, literal: Literal, value: Any = None) -> bool:
+        """Store `(literal, value)`; return False if that exact entry was already present."""
+        node = self._roots.setdefault(self._root_key(literal), _TreeNode())
+        for symbol, _ in _flatten(literal.arguments):
+            child = node.children.get(symbol)
+            if child is None:
+                child = node.children[symbol] = _TreeNode()
+            node = child
+        entry = (literal, value)
+        if entry in node.entries:
+            return False
+        node.entries[entry] = None
+        self._size += 1
+        return True
+
+    def delete(self, literal: Literal, value: Any = None) -> bool:
+        """Remove `(literal, value)` and prune emptied branches; return False if it was not stored."""
+        root_key = self._root_key(literal)
+        node = self._roots.get(root_key)
+        if node is None:
+            return False
+        path: List[Tuple[_TreeNode, Any]] = []
+        for symbol, _ in _flatten(literal.arguments):
+            child = node.children.get(symbol)
+            if child is None:
+                return False
+            path.append((node, symbol))
+            node = child
+        entry = (literal, value)
+        if entry not in node.entries:
+            return False
+        del node.entries[entry]
+        self._size -= 1
+
+        # Prune nodes that no longer lead to any entry
+        while path and not node.entries and not node.children:
+            parent, symbol = path.pop()
+            del parent.children[symbol]
+            node = parent
+        if not path and not node.entries and not node.children:
+            del self._roots[root_key]
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return self._size
+
+    def entries(self) -> Iterator[Entry]:
+        """Yield every stored `(literal, value)` entry."""
+        stack = list(self._roots.values())
+        while stack:
+            node = stack.pop()
+            yield from node.entries
+            stack.extend(node.children.values())
+
+    # Retrieval
+    def unifiable(self, query: Literal) -> List[Entry]:
+        """Return entries that may unify with `query` (same name, sign and arity)."""
+        return self._retrieve(query, query_vars_skip=True, stored_vars_match=True)
+
+    def instances(self, query: Literal) -> List[Entry]:
+        """Return entries that may be instances of `query` (query variables match any subterm)."""
+        return self._retrieve(query, query_vars_skip=True, stored_vars_match=False)
+
+    def generalizations(self, query: Literal) -> List[Entry]:
+        """Return entries that may be generalizations of `query` (stored variables match any subterm)."""
+        return self._retrieve(query, query_vars_skip=False, stored_vars_match=True)
+
+    def _retrieve(self, query: Literal, query_vars_skip: bool, stored_vars_match: bool) -> List[Entry]:
+        """Walk the compatible branches for `query` with an explicit stack."""
+        root = self._roots.get(self._root_key(query))
+        if root is None:
+            return []
+        flat = _flatten(query.arguments)
+        results: List[Entry] = []
+        stack = [(root, 0)]
+        while stack:
+            node, i = stack.pop()
+            if i == len(flat):
+                results.extend(node.entries)
+                continue
+            symbol, end = flat[i]
+            if symbol == STAR:
+                if query_vars_skip:
+                    # A query variable stands for any complete stored subterm
+                    stack.extend((after, end) for after in self._skip_subterm(node))
+                else:
+                    child = node.children.get(STAR)
+                    if child is not None:
+                        stack.append((child, end))
+                continue
+            child = node.children.get(symbol)
+            if child is not None:
+                stack.append((child, i + 1))
+            if stored_vars_match:
+                star = node.children.get(STAR)
+                if star is not None:
+                    # A stored variable stands for the whole query subterm
+                    stack.append((star, end))
+        return results
+
+    @staticmethod
+    def _skip_subterm(node: _TreeNode) -> Iterator[_TreeNode]:
+        """Yield every node reached from `node` by consuming exactly one complete stored subterm."""
+        stack = [(node, 1)]
+        while stack:
+            current, remaining = stack.pop()
+            for symbol, child in current.children.items():
+                left = remaining - 1 + _arity(symbol)
+                if left == 0:
+                    yield child
+                else:
+                    stack.append((child, left))
+
+
+# Feature vectors map feature keys to tuples of counts:
+# - (0, predicate id, negated) -> (literal count, symbol count, max depth) for each predicate and sign
+# - (1, symbol id)             -> (occurrences,) for each constant and function symbol
+FeatureKey = tuple
+FeatureValue = Tuple[int, ...]
+FeatureVector = Tuple[Tuple[FeatureKey, FeatureValue], ...]
+
+
+def feature_vector(literals) -> FeatureVector:
+    """
+    Return the sparse feature vector of a clause, sorted by feature key.
+
+    Every feature can only grow under substitution and under adding literals, so a clause C
+    can subsume a clause D only if each feature of C is present in D with values <= D's.
+    """
+    predicates: Dict[FeatureKey, List[int]] = {}
+    symbols: Dict[FeatureKey, int] = {}
+    for literal in literals:
+        key = (0, literal.symbol_id, literal.negated)
+        depth = 1 + max((arg.depth for arg in literal.arguments), default=0)
+        value = predicates.get(key)
+        if value is None:
+            predicates[key] = [1, literal.size, depth]
+        else:
+            value[0] += 1
+            value[1] += literal.size
+            value[2] = max(value[2], depth)
+        stack = list(literal.arguments)
+        while stack:
+            term = stack.pop()
+            if isinstance(term, Variable):
+                continue
+            if isinstance(term, Function):
+                stack.extend(term.arguments)
+            symbol = (1, term.symbol_id)
+            symbols[symbol] = symbols.get(symbol, 0) + 1
+    features = [(key, tuple(value)) for key, value in predicates.items()]
+    features.extend((key, (count,)) for key, count in symbols.items())
+    features.sort()
+    return tuple(features)
+
+
+def _dominates(big: FeatureValue, small: FeatureValue) -> bool:
+    """Return True if every component of `big` is >= the matching component of `small`."""
+    return all(b >= s for b, s in zip(big, small))
+
+
+class _VectorNode:
+    """Trie node keyed by feature key, then by feature value; `entries` end at this node."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[FeatureKey, Dict[FeatureValue, _VectorNode]] = {}
+        self.entries: Dict[Tuple[Any, Any], None] = {}
+
+
+class FeatureVectorIndex:
+    """
+    Feature-vector index over clauses for subsumption candidate retrieval.
+
+    Each clause is reduced to `feature_vector(clause)`. Stored vectors live in a trie (for
+    "which stored clauses may subsume this one?") and in per-feature posting lists (for
+    "which stored clauses may be subsumed by this one?"). Both lookups discard clauses whose
+    features rule subsumption out, so only the returned candidates need a real `subsumes` check.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self._root = _VectorNode()
+        self._postings: Dict[FeatureKey, Dict[Tuple[Any, Any], FeatureVector]] = {}
+        self._size = 0
+        self._last: Tuple[Any, FeatureVector] = (None, ())   # callers usually query, then insert
+
+    def _vector(self, clause) -> FeatureVector:
+        """Return `feature_vector(clause)`, reusing the result for repeated calls on the same clause."""
+        if self._last[0] is not clause:
+            self._last = (clause, feature_vector(clause))
+        return self._last[1]
+
+    # Updates
+    def insert(self, clause, value: Any = None) -> bool:
+        """Store `(clause, value)`; return False if that exact entry was already present."""
+        vector = self._vector(clause)
+        node = self._root
+        for key, feature in vector:
+            by_value = node.children.setdefault(key, {})
+            child = by_value.get(feature)
+            if child is None:
+                child = by_value[feature] = _VectorNode()
+            node = child
+        entry = (clause, value)
+        if entry in node.entries:
+            return False
+        node.entries[entry] = None
+        for key, _ in vector:
+            self._postings.setdefault(key, {})[entry] = vector
+        self._size += 1
+        return True
+
+    def delete(self, clause, value: Any = None) -> bool:
+        """Remove `(clause, value)` and prune emptied branches; return False if it was not stored."""
+        vector = self._vector(clause)
+        node = self._root
+        path: List[Tuple[_VectorNode, FeatureKey, FeatureValue]] = []
+        for key, feature in vector:
+            child = node.children.get(key, {}).get(feature)
+            if child is None:
+                return False
+            path.append((node, key, feature))
+            node = child
+        entry = (clause, value)
+        if entry not in node.entries:
+            return False
+        del node.entries[entry]
+        for key, _ in vector:
+            postings = self._postings[key]
+            del postings[entry]
+            if not postings:
+                del self._postings[key]
+        self._size -= 1
+
+        while path and not node.entries and not node.children:
+            parent, key, feature = path.pop()
+            by_value = parent.children[key]
+            del by_value[feature]
+            if not by_value:
+                del parent.children[key]
+            node = parent
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return self._size
+
+    # Retrieval
+    def generalizations(self, clause) -> List[Tuple[Any, Any]]:
+        """Return entries whose features allow them to subsume `clause` (forward subsumption)."""
+        query = self._vector(clause)
+        results: List[Tuple[Any, Any]] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, start = stack.pop()
+            results.extend(node.entries)
+            if not node.children:
+                continue
+            # A stored vector may use any later query feature, with values no larger than the query's
+            for i in range(start, len(query)):
+                key, limit = query[i]
+                by_value = node.children.get(key)
+                if by_value is None:
+                    continue
+                for feature, child in by_value.items():
+                    if _dominates(limit, feature):
+                        stack.append((child, i + 1))
+        return results
+
+    def instances(self, clause) -> List[Tuple[Any, Any]]:
+        """Return entries whose features allow `clause` to subsume them (backward subsumption)."""
+        query = self._vector(clause)
+        if not query:
+            # The empty clause subsumes every clause
+            everything = dict.fromkeys(self._root.entries)
+            for postings in self._postings.values():
+                everything.update(dict.fromkeys(postings))
+            return list(everything)
+        # Every candidate must contain every query feature: scan the shortest posting list
+        postings = min((self._postings.get(key, {}) for key, _ in query), key=len)
+        results = []
+        for entry, vector in postings.items():
+            stored = dict(vector)
+            if all(key in stored and _dominates(stored[key], feature) for key, feature in query):
+                results.append(entry)
+        return results
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Tuple
+
+# Failure causes recorded in `UnifyStats.failures` (and carried by `UnificationError.cause`)
+CLASH = "clash"                          # different functors or constants
+ARITY = "arity"                          # same functor name, different number of arguments
+OCCURS = "occurs"                        # occurs check failed
+NOT_COMPLEMENTARY = "not_complementary"  # unify_literals on literals that cannot resolve
+
+# Callback signature: callback(event, data) with events "bind", "fail" and "span"
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+
+@dataclass
+class UnifyStats:
+    """
+    Counters collected by an instrumented `Unifier` (see `Unifier.instrument`).
+
+    - calls: top-level `unify` / `unify_literals` calls
+    - steps: equations taken off the work stack (one per call of the textbook recursion)
+    - bindings: variables bound
+    - occurs_checks / occurs_nodes: occurs checks run and term nodes they visited
+    - applications: substitutions applied to a term (each variable binding attempt and the final
+      normalization in the recursive engine, each resolved binding in union_find)
+    - failures: failed calls by cause
+    - spans: `{name: (count, total seconds)}` when timing is enabled
+    """
+
+    calls: int = 0
+    steps: int = 0
+    bindings: int = 0
+    occurs_checks: int = 0
+    occurs_nodes: int = 0
+    applications: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    spans: Dict[str, Tuple[int, float]] = field(default_factory=dict)
+
+    def record_failure(self, cause: str):
+        """Count one failure of the given cause."""
+        self.failures[cause] = self.failures.get(cause, 0) + 1
+
+    def record_span(self, name: str, seconds: float):
+        """Add one timed span."""
+        count, total = self.spans.get(name, (0, 0.0))
+        self.spans[name] = (count + 1, total + seconds)
+
+    def reset(self):
+        """Zero every counter."""
+        self.calls = self.steps = self.bindings = 0
+        self.occurs_checks = self.occurs_nodes = self.applications = 0
+        self.failures.clear()
+        self.spans.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-friendly snapshot."""
+        return {
+            "calls": self.calls, "steps": self.steps, "bindings": self.bindings,
+            "occurs_checks": self.occurs_checks, "occurs_nodes": self.occurs_nodes,
+            "applications": self.applications, "failures": dict(self.failures),
+            "spans": {name: {"count": count, "seconds": total} for name, (count, total) in self.spans.items()},
+        }
+
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+from typing import List, NamedTuple
+
+from src.models.errors import ParseError
+
+
+class Token(NamedTuple):
+    """Lexical unit: token `kind`, its source `text`, and the 0-based `position` in the input."""
+
+    kind: str
+    text: str
+    position: int
+
+
+# Token kinds
+NAME = "NAME"
+LPAREN = "LPAREN"
+RPAREN = "RPAREN"
+COMMA = "COMMA"
+NOT = "NOT"
+OR = "OR"
+AND = "AND"
+IMPLIES = "IMPLIES"
+EOF = "EOF"
+
+_PUNCTUATION = {
+    "(": LPAREN,
+    ")": RPAREN,
+    ",": COMMA,
+    "¬": NOT,
+    "~": NOT,
+    "∨": OR,
+    "|": OR,
+    "∧": AND,
+    "&": AND,
+    "⇒": IMPLIES,
+    "=>": IMPLIES,
+}
+
+# One master pattern scanned once over the input: skip whitespace, then either an identifier,
+# the two-character arrow `=>`, or a single character.
+_SCANNER = re.compile(r"\s*(?:(\w+)|(=>|\S))")
+
+
+class Lexer:
+    """Single-pass tokenizer for AIMA expressions; runs in time linear in the input length."""
+
+    @staticmethod
+    def tokenize(text: str) -> List[Token]:
+        """Split `text` into tokens terminated by an EOF token, raising `ParseError` on unknown characters."""
+        tokens: List[Token] = []
+        append = tokens.append
+        for match in _SCANNER.finditer(text):
+            name, char = match.group(1), match.group(2)
+            if name is not None:
+                append(Token(NAME, name, match.start(1)))
+                continue
+            kind = _PUNCTUATION.get(char)
+            if kind is None:
+                raise ParseError(f"Unexpected character '{char}'", text, match.start(2))
+            append(Token(kind, char, match.start(2)))
+        append(Token(EOF, "", len(text)))
+        return tokens
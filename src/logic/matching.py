@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Union
+
+from src.logic.substitution import Substitution
+from src.models.literal import Literal
+from src.models.term import Term, Variable
+
+Matchable = Union[Term, Literal]
+
+
+def match(pattern: Matchable, instance: Matchable, subst: Optional[Substitution] = None) -> Optional[Substitution]:
+    """
+    One-way matching: return θ with `pattern`θ == `instance`, or None if there is none.
+
+    Only variables of `pattern` are bound; variables of `instance` are treated as constants.
+    There is no occurs check and no substitution is applied while matching, and the first
+    functor, arity, sign or constant mismatch ends the search. Bindings already present in
+    `subst` must be respected. Keep both sides variable-disjoint before applying θ.
+    """
+    bindings: Dict[str, Term] = dict(subst.mapping) if subst is not None else {}
+    if isinstance(pattern, Literal):
+        if not isinstance(instance, Literal) or not match_literal(pattern, instance, bindings, []):
+            return None
+    elif isinstance(instance, Literal) or not match_term(pattern, instance, bindings, []):
+        return None
+    # `x` matched against `x` stays bound while matching (a later `x` must still equal it),
+    # but the self-binding is left out of θ, where it would read as a cycle
+    return Substitution({name: term for name, term in bindings.items()
+                         if not (isinstance(term, Variable) and term.name == name)})
+
+
+def match_term(pattern: Term, instance: Term, bindings: Dict[str, Term], trail: List[str]) -> bool:
+    """
+    Extend `bindings` in place so that `pattern` becomes `instance`; return False on mismatch.
+    Names bound here are appended to `trail` so callers can undo them on backtracking
+    (bindings made before a failure are left in place).
+    """
+    stack = [(pattern, instance)]
+    while stack:
+        p, t = stack.pop()
+        if isinstance(p, Variable):
+            bound = bindings.get(p.name)
+            if bound is None:
+                bindings[p.name] = t
+                trail.append(p.name)
+            elif bound != t:
+                return False
+        elif p.ground:
+            # Cached hashes make this a quick rejection; hash-consed terms compare by identity
+            if p != t:
+                return False
+        elif p.symbol_id == t.symbol_id:
+            # Ids differ across kinds, so `t` is a function with the same name and arity
+            stack.extend(zip(p.arguments, t.arguments))
+        else:
+            return False
+    return True
+
+
+def match_literal(pattern: Literal, instance: Literal, bindings: Dict[str, Term], trail: List[str]) -> bool:
+    """Match two literals argument by argument; predicate name, sign and arity must agree."""
+    if pattern.symbol_id != instance.symbol_id or pattern.negated != instance.negated:
+        return False
+    for p, t in zip(pattern.arguments, instance.arguments):
+        if not match_term(p, t, bindings, trail):
+            return False
+    return True
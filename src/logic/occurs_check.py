@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Mapping, Optional
+
+from src.logic.instrumentation import UnifyStats
+from src.models.term import Function, Term, Variable
+
+# Occurs-check policies accepted by `Unifier(occurs_check=...)`
+ALWAYS = "always"            # walk the bound term on every binding (ground subterms are skipped)
+INCREMENTAL = "incremental"  # like ALWAYS, but subterms whose `variable_mask` excludes the variable are skipped
+NEVER = "never"              # no check: cyclic bindings describe rational trees (Prolog-style)
+DEFERRED = "deferred"        # no check while solving; one cycle search over the final bindings
+
+POLICIES = (ALWAYS, INCREMENTAL, NEVER, DEFERRED)
+
+# Dereferences a variable to its binding (or returns the term unchanged when unbound)
+Resolver = Callable[[Term], Term]
+
+
+def occurs(var: Variable, term: Term, stats: Optional[UnifyStats] = None) -> bool:
+    """Return True if `var` occurs in `term`, skipping ground subterms."""
+    if stats is not None:
+        stats.occurs_checks += 1
+    name = var.name
+    stack = [term]
+    while stack:
+        node = stack.pop()
+        if stats is not None:
+            stats.occurs_nodes += 1
+        if isinstance(node, Variable):
+            if node.name == name:
+                return True
+        elif isinstance(node, Function) and not node.ground:
+            stack.extend(node.arguments)
+    return False
+
+
+def occurs_incremental(var: Variable, term: Term, stats: Optional[UnifyStats] = None,
+                       find: Optional[Resolver] = None, bound_mask: int = 0) -> bool:
+    """
+    Return True if `var` occurs in `term`, using the cached `variable_mask` of each subterm
+    to skip the ones that cannot contain it.
+
+    When bindings are followed lazily (`find` dereferences variables), a subterm may also
+    reach `var` through a bound variable, so it is only skipped if its mask excludes both
+    `var` and every bound variable (`bound_mask`); shared subterms are then visited once.
+    """
+    if stats is not None:
+        stats.occurs_checks += 1
+    name = var.name
+    relevant = var.variable_mask | bound_mask
+    visited = set() if find is not None else None
+    stack = [term]
+    while stack:
+        node = stack.pop()
+        if find is not None:
+            node = find(node)
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+        if not node.variable_mask & relevant:
+            continue
+        if stats is not None:
+            stats.occurs_nodes += 1
+        if isinstance(node, Variable):
+            if node.name == name:
+                return True
+        elif isinstance(node, Function):
+            stack.extend(node.arguments)
+    return False
+
+
+def find_cycle(bindings: Mapping[str, Term]) -> Optional[str]:
+    """
+    Return a variable that reaches itself through `bindings` (x -> f(y), y -> g(x), ...),
+    or None when the bindings are acyclic. Runs in time linear in the size of the bindings.
+    """
+    state: Dict[str, int] = {}  # 1 = on the current path, 2 = finished
+    # Bindings often share terms (x -> t, y -> t): collect each term's variables once
+    variables: Dict[int, List[str]] = {}
+
+    def children(name: str):
+        term = bindings[name]
+        names = variables.get(id(term))
+        if names is None:
+            names = variables[id(term)] = term.variables()
+        return iter(names)
+
+    for start in bindings:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, children(start))]
+        while stack:
+            name, pending = stack[-1]
+            for child in pending:
+                if child not in bindings:
+                    continue
+                mark = state.get(child)
+                if mark == 1:
+                    return child
+                if mark is None:
+                    state[child] = 1
+                    stack.append((child, children(child)))
+                    break
+            else:
+                state[name] = 2
+                stack.pop()
+    return None
@@ -1,7 +1,22 @@
 import re
+from typing import List, Tuple
 
+from src.logic.lexer import AND, COMMA, EOF, IMPLIES, LPAREN, NAME, NOT, OR, RPAREN, Lexer, Token
+from src.models.errors import ParseError
 from src.models.literal import Literal
-from src.models.term import Constant, Function, Term, Variable
+from src.models.rule import Rule
+from src.models.term import Term
+from src.models.term_store import TERMS
+
+
+def _is_lower_name(name: str) -> bool:
+    """AIMA variables and functors start with a lowercase ASCII letter."""
+    return "a" <= name[0] <= "z"
+
+
+def _is_upper_name(name: str) -> bool:
+    """AIMA constants and predicates start with an uppercase ASCII letter."""
+    return "A" <= name[0] <= "Z"
 
 
 class ParserAIMA:
@@ -41,67 +56,168 @@ class ParserAIMA:
 
         return "unknown"
 
-    @staticmethod
-    def _split_arguments(args_str: str):
-        """Return a list of argument substrings while respecting nested parentheses."""
-        args, current, depth = [], "", 0
-        for char in args_str:
-            if char == ',' and depth == 0:
-                args.append(current.strip())
-                current = ""
-            else:
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-                current += char
-        if current.strip():
-            args.append(current.strip())
-        return args
-
     @staticmethod
     def parse_term(text: str) -> Term:
-        """Parse a textual representation into a `Term` instance (variable, constant, or function)."""
-        text = text.strip()
+        """
+        Parse a textual representation into a `Term` instance (variable, constant, or function).
+        Terms are hash-consed through the shared `TERMS` store, so equal subterms are shared objects.
+        """
+        tokens = Lexer.tokenize(text)
+        term, i = ParserAIMA._parse_term_tokens(tokens, 0, text)
+        ParserAIMA._expect(tokens, i, EOF, text, "end of input")
+        return term
 
-        # Variable
-        if re.fullmatch(r'[a-z]\w*', text):
-            return Variable(text)
-
-        # Constant (also numbers)
-        elif re.fullmatch(r'[A-Z]\w*', text) or re.fullmatch(r'\d+', text):
-            return Constant(text)
+    @staticmethod
+    def parse_literal(text: str) -> Literal:
+        """Parse a predicate string (optionally negated) into a `Literal`."""
+        tokens = Lexer.tokenize(text)
+        literal, i = ParserAIMA._parse_literal_tokens(tokens, 0, text)
+        ParserAIMA._expect(tokens, i, EOF, text, "end of input")
+        return literal
 
-        # Function: lowercase letter followed by parentheses
-        match = re.match(r'([a-z]\w*)\((.*)\)', text)
-        if match:
-            name, args_str = match.groups()
-            args = [ParserAIMA.parse_term(
-                arg) for arg in ParserAIMA._split_arguments(args_str)]
-            return Function(name, args)
+    @staticmethod
+    def parse_clause(text: str) -> List[Literal]:
+        """Parse a disjunction of literals separated by `∨` or `|` (a single literal is a unit clause)."""
+        tokens = Lexer.tokenize(text)
+        literal, i = ParserAIMA._parse_literal_tokens(tokens, 0, text)
+        literals = [literal]
+        while tokens[i].kind == OR:
+            literal, i = ParserAIMA._parse_literal_tokens(tokens, i + 1, text)
+            literals.append(literal)
+        ParserAIMA._expect(tokens, i, EOF, text, "'∨' or end of input")
+        return literals
 
-        raise ValueError(f"Invalid term format (AIMA): {text}")
+    @staticmethod
+    def parse_rule(text: str) -> Rule:
+        """
+        Parse a definite clause `B1 ∧ B2 ⇒ H` (`&` and `=>` are accepted too) or a fact `H`.
+        Literals must be positive; a negated one raises `ParseError`.
+        """
+        tokens = Lexer.tokenize(text)
+        literals, i = ParserAIMA._parse_conjunction_tokens(tokens, 0, text)
+        if tokens[i].kind != IMPLIES:
+            ParserAIMA._expect(tokens, i, EOF, text, "'∧', '⇒' or end of input")
+            if len(literals) > 1:
+                raise ParseError("Expected '⇒' after a conjunction", text, tokens[i].position)
+            return Rule(literals[0])
+        start = tokens[i + 1].position
+        head, i = ParserAIMA._parse_literal_tokens(tokens, i + 1, text)
+        if head.negated:
+            raise ParseError("Definite clauses only contain positive literals", text, start)
+        ParserAIMA._expect(tokens, i, EOF, text, "end of input")
+        return Rule(head, literals)
 
     @staticmethod
-    def parse_literal(text: str) -> Literal:
-        """Parse a predicate string (optionally negated) into a `Literal`."""
-        text = text.strip()
+    def parse_conjunction(text: str) -> List[Literal]:
+        """Parse a conjunction of positive literals `L1 ∧ L2 ∧ ...` (e.g. a query)."""
+        tokens = Lexer.tokenize(text)
+        literals, i = ParserAIMA._parse_conjunction_tokens(tokens, 0, text)
+        ParserAIMA._expect(tokens, i, EOF, text, "'∧' or end of input")
+        return literals
+
+    # Recursive-descent helpers working on the token list (single left-to-right pass)
+    @staticmethod
+    def _parse_literal_tokens(tokens: List[Token], i: int, text: str) -> Tuple[Literal, int]:
+        """Parse `[¬|~] Predicate(args...)` starting at token `i`; return the literal and the next index."""
         negated = False
 
         # Find out negation
-        if text.startswith(("¬", "~")):
+        if tokens[i].kind == NOT:
             negated = True
-            text = text[1:].strip()
+            i += 1
 
         # Predicate: uppercase letter followed by parentheses
-        match = re.match(r'([A-Z]\w*)\((.*)\)', text)
-        if not match:
-            raise ValueError(f"Invalid literal format (AIMA): {text}")
-
-        name, args_str = match.groups()
-        args = [ParserAIMA.parse_term(arg)
-                for arg in ParserAIMA._split_arguments(args_str)]
-        return Literal(name, args, negated)
+        token = tokens[i]
+        if token.kind != NAME or not _is_upper_name(token.text):
+            raise ParseError("Invalid literal format (AIMA): expected an uppercase predicate name",
+                             text, token.position)
+        name = token.text
+        ParserAIMA._expect(tokens, i + 1, LPAREN, text, f"'(' after predicate '{name}'")
+        i += 2
+
+        args: List[Term] = []
+        if tokens[i].kind == RPAREN:
+            return Literal(name, args, negated), i + 1
+        while True:
+            arg, i = ParserAIMA._parse_term_tokens(tokens, i, text)
+            args.append(arg)
+            if tokens[i].kind == COMMA:
+                i += 1
+            elif tokens[i].kind == RPAREN:
+                return Literal(name, args, negated), i + 1
+            else:
+                raise ParseError("Invalid literal format (AIMA): expected ',' or ')'", text, tokens[i].position)
+
+    @staticmethod
+    def _parse_conjunction_tokens(tokens: List[Token], i: int, text: str) -> Tuple[List[Literal], int]:
+        """Parse positive literals separated by `∧` / `&` starting at token `i`."""
+        literals: List[Literal] = []
+        while True:
+            start = tokens[i].position
+            literal, i = ParserAIMA._parse_literal_tokens(tokens, i, text)
+            if literal.negated:
+                raise ParseError("Definite clauses only contain positive literals", text, start)
+            literals.append(literal)
+            if tokens[i].kind != AND:
+                return literals, i
+            i += 1
+
+    @staticmethod
+    def _parse_term_tokens(tokens: List[Token], i: int, text: str) -> Tuple[Term, int]:
+        """
+        Parse one term starting at token `i`; return the term and the next token index.
+        Open function applications are kept on an explicit stack, so nesting depth is unbounded.
+        """
+        # Each frame is (functor name, collected arguments)
+        frames: List[Tuple[str, List[Term]]] = []
+        while True:
+            token = tokens[i]
+            if token.kind != NAME:
+                raise ParseError("Invalid term format (AIMA): expected a variable, constant or function",
+                                 text, token.position)
+
+            if tokens[i + 1].kind == LPAREN:
+                # Function: lowercase letter followed by parentheses
+                if not _is_lower_name(token.text):
+                    raise ParseError(f"Invalid term format (AIMA): function name '{token.text}' must be lowercase",
+                                     text, token.position)
+                if tokens[i + 2].kind != RPAREN:
+                    frames.append((token.text, []))
+                    i += 2
+                    continue
+                value = TERMS.function(token.text, ())
+                i += 3
+            elif _is_lower_name(token.text):
+                value = TERMS.variable(token.text)
+                i += 1
+            elif _is_upper_name(token.text) or token.text.isdigit():
+                value = TERMS.constant(token.text)
+                i += 1
+            else:
+                raise ParseError(f"Invalid term format (AIMA): unexpected symbol '{token.text}'",
+                                 text, token.position)
+
+            # Close every function application completed by this value
+            while frames:
+                frames[-1][1].append(value)
+                token = tokens[i]
+                if token.kind == COMMA:
+                    i += 1
+                    break
+                if token.kind != RPAREN:
+                    raise ParseError("Invalid term format (AIMA): expected ',' or ')'", text, token.position)
+                name, args = frames.pop()
+                value = TERMS.function(name, args)
+                i += 1
+            else:
+                return value, i
+
+    @staticmethod
+    def _expect(tokens: List[Token], i: int, kind: str, text: str, what: str):
+        """Raise `ParseError` unless token `i` has the given kind."""
+        if tokens[i].kind != kind:
+            found = tokens[i].text or "end of input"
+            raise ParseError(f"Expected {what} but found '{found}'", text, tokens[i].position)
 
     @staticmethod
     def parse_expression(text: str):
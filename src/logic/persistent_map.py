@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple
+
+_BITS = 5
+_FANOUT_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+
+
+class _Node:
+    """Bitmap-compressed trie node; `entries` holds `(key, value)` pairs, child nodes or collision buckets."""
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _Collision:
+    """Bucket of `(key, value)` pairs whose keys share the same full 64-bit hash."""
+
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, key_hash: int, pairs: tuple):
+        self.hash = key_hash
+        self.pairs = pairs
+
+
+_EMPTY_NODE = _Node(0, ())
+_MISSING = object()
+
+
+class PersistentMap:
+    """
+    Immutable hash array mapped trie (HAMT) with insertion-ordered iteration.
+
+    `set` returns a new map in O(log32 n) time by copying only the path from the root
+    to the changed slot; every other node is shared with the original map.
+    Insertion order is tracked with a persistent cons chain so iteration mirrors `dict`.
+    """
+
+    __slots__ = ("_root", "_order", "_size")
+
+    def __init__(self, items: Optional[Iterable[Tuple[Hashable, Any]]] = None):
+        """Create a map, optionally populated from `(key, value)` pairs."""
+        self._root = _EMPTY_NODE
+        self._order = None
+        self._size = 0
+        if items is not None:
+            current = self
+            for key, value in items:
+                current = current.set(key, value)
+            self._root, self._order, self._size = current._root, current._order, current._size
+
+    @classmethod
+    def _make(cls, root: _Node, order, size: int) -> PersistentMap:
+        """Build a map directly from its internal parts."""
+        instance = object.__new__(cls)
+        instance._root = root
+        instance._order = order
+        instance._size = size
+        return instance
+
+    def __reduce__(self):
+        """Pickle as an item list: trie positions depend on hashes that differ between processes."""
+        return PersistentMap, (list(self.items()),)
+
+    # Lookups
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value mapped to `key` or `default` when absent."""
+        key_hash = hash(key) & _HASH_MASK
+        node = self._root
+        shift = 0
+        while True:
+            bit = 1 << ((key_hash >> shift) & _FANOUT_MASK)
+            if not node.bitmap & bit:
+                return default
+            entry = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if isinstance(entry, _Node):
+                node = entry
+                shift += _BITS
+                continue
+            if isinstance(entry, _Collision):
+                if entry.hash == key_hash:
+                    for k, v in entry.pairs:
+                        if k == key:
+                            return v
+                return default
+            return entry[1] if entry[0] == key else default
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if `key` is mapped."""
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        """Return the number of mapped keys."""
+        return self._size
+
+    # Updates
+    def set(self, key: Hashable, value: Any) -> PersistentMap:
+        """Return a new map where `key` is mapped to `value`; the receiver is left untouched."""
+        key_hash = hash(key) & _HASH_MASK
+        root, added = self._set(self._root, 0, key_hash, key, value)
+        if root is self._root:
+            return self
+        if added:
+            return PersistentMap._make(root, (key, self._order), self._size + 1)
+        return PersistentMap._make(root, self._order, self._size)
+
+    def _set(self, node: _Node, shift: int, key_hash: int, key, value) -> Tuple[_Node, bool]:
+        """Path-copying insertion; returns the new node and whether a new key was added."""
+        bit = 1 << ((key_hash >> shift) & _FANOUT_MASK)
+        idx = (node.bitmap & (bit - 1)).bit_count()
+        entries = node.entries
+
+        if not node.bitmap & bit:
+            return _Node(node.bitmap | bit, entries[:idx] + ((key, value),) + entries[idx:]), True
+
+        entry = entries[idx]
+        if isinstance(entry, _Node):
+            child, added = self._set(entry, shift + _BITS, key_hash, key, value)
+            if child is entry:
+                return node, False
+        elif isinstance(entry, _Collision):
+            if entry.hash == key_hash:
+                pairs = tuple(p for p in entry.pairs if p[0] != key)
+                added = len(pairs) == len(entry.pairs)
+                child = _Collision(key_hash, pairs + ((key, value),))
+            else:
+                child = self._merge(shift + _BITS, entry.hash, entry, key_hash, (key, value))
+                added = True
+        else:
+            old_key, old_value = entry
+            if old_key == key:
+                if old_value is value:
+                    return node, False
+                child, added = (key, value), False
+            else:
+                old_hash = hash(old_key) & _HASH_MASK
+                if old_hash == key_hash:
+                    child = _Collision(key_hash, (entry, (key, value)))
+                else:
+                    child = self._merge(shift + _BITS, old_hash, entry, key_hash, (key, value))
+                added = True
+
+        return _Node(node.bitmap, entries[:idx] + (child,) + entries[idx + 1:]), added
+
+    def _merge(self, shift: int, hash1: int, entry1, hash2: int, entry2) -> _Node:
+        """Create the smallest subtree that separates two entries with different hashes."""
+        if shift >= _MAX_SHIFT:
+            raise AssertionError("distinct hashes must diverge before the hash is exhausted")
+        frag1 = (hash1 >> shift) & _FANOUT_MASK
+        frag2 = (hash2 >> shift) & _FANOUT_MASK
+        if frag1 == frag2:
+            return _Node(1 << frag1, (self._merge(shift + _BITS, hash1, entry1, hash2, entry2),))
+        if frag1 < frag2:
+            return _Node((1 << frag1) | (1 << frag2), (entry1, entry2))
+        return _Node((1 << frag1) | (1 << frag2), (entry2, entry1))
+
+    # Iteration (insertion order)
+    def keys(self) -> Iterator[Hashable]:
+        """Yield keys in the order they were first inserted."""
+        chain = []
+        link = self._order
+        while link is not None:
+            chain.append(link[0])
+            link = link[1]
+        return reversed(chain)
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Yield `(key, value)` pairs in insertion order."""
+        for key in self.keys():
+            yield key, self.get(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over keys in insertion order."""
+        return iter(self.keys())
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from typing import Optional
+import heapq
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
+from src.logic.indexing import DiscriminationTree, FeatureVectorIndex
 from src.logic.substitution import Substitution
+from src.logic.subsumption import subsumes
 from src.logic.unifier import Unifier
+from src.models.clause import Clause
 from src.models.errors import UnificationError
 from src.models.literal import Literal
 
+# Prover outcomes
+PROOF = "proof"
+SATURATED = "saturated"
+TIMEOUT = "timeout"
+CLAUSE_LIMIT = "clause_limit"
+
 
 class Resolution:
     """Minimal resolution helper showcasing how literal unification is orchestrated through the Unifier."""
@@ -28,3 +41,273 @@ class Resolution:
         for a1, a2 in zip(l1.arguments, l2.arguments):
             subst = self.unifier.unify(a1, a2, subst)
         return subst
+
+
+@dataclass(frozen=True)
+class ProofStep:
+    """One derived (or input) clause: `rule` is "input", "resolution" or "factoring"."""
+
+    id: int
+    clause: Clause
+    rule: str
+    parents: Tuple[int, ...] = ()
+
+    def __str__(self) -> str:
+        """Return `id. clause  [rule parents]`."""
+        origin = self.rule if not self.parents else f"{self.rule} {', '.join(map(str, self.parents))}"
+        return f"{self.id}. {self.clause}  [{origin}]"
+
+
+@dataclass(frozen=True)
+class ProofResult:
+    """Outcome of a prover run: `status` is one of PROOF, SATURATED, TIMEOUT or CLAUSE_LIMIT."""
+
+    status: str
+    proof: List[ProofStep] = field(default_factory=list)
+    stats: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def proved(self) -> bool:
+        """Return True if the empty clause was derived."""
+        return self.status == PROOF
+
+    def __str__(self) -> str:
+        """Return the proof trace, one step per line, or just the status."""
+        if not self.proof:
+            return self.status
+        return "\n".join(str(step) for step in self.proof)
+
+
+ClauseLike = Union[Clause, Sequence[Literal]]
+
+
+class ResolutionProver:
+    """
+    Refutation prover: saturates a clause set with binary resolution and factoring using
+    the given-clause loop, until the empty clause is derived or a limit is hit.
+
+    - Passive clauses wait in two queues, one ordered by weight (symbol count) and one by age;
+      `pick_ratio` weight picks are made for every age pick, so small clauses go first without
+      starving old ones.
+    - Active literals are stored in a `DiscriminationTree`, so resolution partners of the given
+      clause are found by index lookup instead of scanning the active set.
+    - Every kept clause is standardized apart by suffixing its variables with its id.
+    - Tautologies are discarded on arrival, and so are variants of kept clauses.
+    - With `subsumption` enabled, new clauses subsumed by a kept clause are discarded (forward)
+      and kept clauses subsumed by a new clause are retired (backward); candidates come from a
+      `FeatureVectorIndex`, so only clauses with compatible features are matched.
+    """
+
+    def __init__(self, max_seconds: float = 10.0, max_clauses: int = 100_000, pick_ratio: int = 5,
+                 engine: str = "union_find", subsumption: bool = True):
+        """Configure run limits, the weight/age pick ratio, the unification engine and redundancy checks."""
+        self.max_seconds = max_seconds
+        self.max_clauses = max_clauses
+        self.pick_ratio = pick_ratio
+        self.subsumption = subsumption
+        self.unifier = Unifier(engine=engine)
+
+    def prove(self, clauses: Iterable[ClauseLike]) -> ProofResult:
+        """Search for a refutation of `clauses` (the negated goal must already be included)."""
+        return _ProverRun(self).run(clauses)
+
+
+class _ProverRun:
+    """State of a single `ResolutionProver.prove` call."""
+
+    def __init__(self, prover: ResolutionProver):
+        self.prover = prover
+        self.unifier = prover.unifier
+        self.steps: Dict[int, ProofStep] = {}
+        self.seen: Set = set()                      # variant keys of kept clauses
+        self.by_weight: List[Tuple[int, int]] = []  # heap of (weight, id)
+        self.by_age: deque = deque()
+        self.selected: Set[int] = set()
+        self.active = DiscriminationTree()
+        self.kept = FeatureVectorIndex() if prover.subsumption else None
+        self.retired: Set[int] = set()             # kept clauses removed by backward subsumption
+        self.next_id = 1
+        self.stats: Dict[str, float] = {"input": 0, "generated": 0, "kept": 0, "tautologies": 0,
+                                        "duplicates": 0, "forward_subsumed": 0, "backward_subsumed": 0,
+                                        "given": 0, "seconds": 0.0}
+
+    def run(self, clauses: Iterable[ClauseLike]) -> ProofResult:
+        """Add the input clauses, then run the given-clause loop."""
+        start = time.perf_counter()
+        deadline = start + self.prover.max_seconds
+        try:
+            for clause in clauses:
+                if not isinstance(clause, Clause):
+                    clause = Clause(clause)
+                self.stats["input"] += 1
+                empty = self._add(clause, "input", ())
+                if empty is not None:
+                    return self._result(PROOF, start, empty)
+
+            picks = 0
+            while True:
+                given_id = self._select(picks)
+                if given_id is None:
+                    return self._result(SATURATED, start)
+                picks += 1
+                self.stats["given"] += 1
+                empty = self._process(given_id, deadline)
+                if empty is not None:
+                    return self._result(PROOF, start, empty)
+                if time.perf_counter() > deadline:
+                    return self._result(TIMEOUT, start)
+        except _LimitReached as limit:
+            return self._result(limit.status, start)
+
+    # Passive set
+    def _add(self, clause: Clause, rule: str, parents: Tuple[int, ...]) -> Optional[int]:
+        """Keep `clause` as passive unless redundant; return its id if it is the empty clause."""
+        if clause.is_tautology():
+            self.stats["tautologies"] += 1
+            return None
+        # Standardize apart under the id the clause receives if kept
+        clause = clause.rename_apart(self.next_id)
+        if self.kept is None:
+            key = clause.variant_key()
+            if key in self.seen:
+                self.stats["duplicates"] += 1
+                return None
+            self.seen.add(key)
+        else:
+            # Forward subsumption also catches variants of kept clauses
+            if self._forward_subsumed(clause):
+                self.stats["forward_subsumed"] += 1
+                return None
+        if self.stats["kept"] >= self.prover.max_clauses:
+            raise _LimitReached(CLAUSE_LIMIT)
+
+        clause_id = self._fresh_id()
+        self.steps[clause_id] = ProofStep(clause_id, clause, rule, parents)
+        self.stats["kept"] += 1
+        if clause.is_empty():
+            return clause_id
+        if self.kept is not None:
+            self._backward_subsume(clause)
+            self.kept.insert(clause, clause_id)
+        heapq.heappush(self.by_weight, (clause.weight, clause_id))
+        self.by_age.append(clause_id)
+        return None
+
+    def _select(self, picks: int) -> Optional[int]:
+        """Pop the next unselected passive clause, alternating weight and age picks."""
+        queue_by_age = picks % (self.prover.pick_ratio + 1) == self.prover.pick_ratio
+        while self.by_weight or self.by_age:
+            if (queue_by_age and self.by_age) or not self.by_weight:
+                clause_id = self.by_age.popleft()
+            else:
+                clause_id = heapq.heappop(self.by_weight)[1]
+            if clause_id not in self.selected and clause_id not in self.retired:
+                self.selected.add(clause_id)
+                return clause_id
+        return None
+
+    # Subsumption
+    def _forward_subsumed(self, clause: Clause) -> bool:
+        """Return True if some kept clause subsumes `clause`."""
+        return any(subsumes(candidate, clause) is not None for candidate, _ in self.kept.generalizations(clause))
+
+    def _backward_subsume(self, clause: Clause):
+        """Retire every kept clause subsumed by `clause`, removing active ones from the literal index."""
+        for candidate, candidate_id in self.kept.instances(clause):
+            if subsumes(clause, candidate) is None:
+                continue
+            self.kept.delete(candidate, candidate_id)
+            self.retired.add(candidate_id)
+            self.stats["backward_subsumed"] += 1
+            if candidate_id in self.selected:
+                for position, literal in enumerate(candidate.literals):
+                    self.active.delete(literal, (candidate_id, position))
+
+    def _fresh_id(self) -> int:
+        """Return the next unused clause id."""
+        clause_id = self.next_id
+        self.next_id += 1
+        return clause_id
+
+    # Inferences
+    def _process(self, given_id: int, deadline: float) -> Optional[int]:
+        """Activate the given clause and add all its factors and resolvents with active clauses."""
+        given = self.steps[given_id].clause
+        for position, literal in enumerate(given.literals):
+            self.active.insert(literal, (given_id, position))
+
+        for factor in self._factors(given):
+            empty = self._add(factor, "factoring", (given_id,))
+            if empty is not None:
+                return empty
+
+        for position, literal in enumerate(given.literals):
+            for _, (partner_id, partner_position) in self.active.unifiable(literal.negate()):
+                partner = self.steps[partner_id].clause
+                if partner_id == given_id:
+                    # Self-resolution needs a variable-disjoint copy; ids start at 1, so suffix 0 is free
+                    partner = partner.rename_apart(0)
+                resolvent = self._resolve(given, position, partner, partner_position)
+                if resolvent is None:
+                    continue
+                self.stats["generated"] += 1
+                empty = self._add(resolvent, "resolution", (given_id, partner_id))
+                if empty is not None:
+                    return empty
+                if self.stats["generated"] % 1000 == 0 and time.perf_counter() > deadline:
+                    raise _LimitReached(TIMEOUT)
+        return None
+
+    def _resolve(self, c1: Clause, i: int, c2: Clause, j: int) -> Optional[Clause]:
+        """Return the binary resolvent of `c1` on literal `i` and `c2` on literal `j`, or None."""
+        try:
+            subst = self.unifier.unify_literals(c1.literals[i], c2.literals[j])
+        except (UnificationError, ValueError):
+            return None
+        if subst is None:
+            return None
+        rest = [lit for k, lit in enumerate(c1.literals) if k != i]
+        rest.extend(lit for k, lit in enumerate(c2.literals) if k != j)
+        if subst.is_empty():
+            return Clause(rest)
+        return Clause(lit.apply_substitution(subst) for lit in rest)
+
+    def _factors(self, clause: Clause) -> Iterable[Clause]:
+        """Yield the binary factors of `clause` (two same-sign literals merged by their MGU)."""
+        literals = clause.literals
+        for i, first in enumerate(literals):
+            for j in range(i + 1, len(literals)):
+                second = literals[j]
+                if first.negated != second.negated or first.name != second.name:
+                    continue
+                try:
+                    subst = self.unifier.unify_literals(first, second.negate())
+                except (UnificationError, ValueError):
+                    continue
+                if subst is not None:
+                    yield Clause(lit.apply_substitution(subst) for k, lit in enumerate(literals) if k != j)
+
+    # Result
+    def _result(self, status: str, start: float, empty_id: Optional[int] = None) -> ProofResult:
+        """Build the `ProofResult`, tracing the ancestors of the empty clause if one was found."""
+        self.stats["seconds"] = time.perf_counter() - start
+        self.stats["active"] = len(self.selected - self.retired)
+        proof: List[ProofStep] = []
+        if empty_id is not None:
+            needed = {empty_id}
+            stack = [empty_id]
+            while stack:
+                for parent in self.steps[stack.pop()].parents:
+                    if parent not in needed:
+                        needed.add(parent)
+                        stack.append(parent)
+            proof = [self.steps[step_id] for step_id in sorted(needed)]
+        return ProofResult(status, proof, dict(self.stats))
+
+
+class _LimitReached(Exception):
+    """Internal signal used to unwind the main loop when a run limit is hit."""
+
+    def __init__(self, status: str):
+        super().__init__(status)
+        self.status = status
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from src.logic.matching import match_literal
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.logic.unify_cache import canonical_names
+from src.models.literal import Literal
+from src.models.rule import Rule
+from src.models.term import Term
+
+FactLike = Union[str, Literal]
+RuleLike = Union[str, Rule]
+
+# Join key: values of a node's join variables, in a fixed order
+JoinKey = Tuple[Term, ...]
+
+
+class _AlphaMemory:
+    """Facts passing the constant tests of one pattern (shared by every variant of that pattern)."""
+
+    __slots__ = ("pattern", "entries", "successors")
+
+    def __init__(self, pattern: Literal):
+        self.pattern = pattern                              # canonical variables `_0`, `_1`, ...
+        self.entries: Dict[Literal, Dict[str, Term]] = {}   # fact -> bindings of the canonical variables
+        self.successors: List['_JoinNode'] = []
+
+
+class _Token:
+    """Partial match of a rule: the facts matched so far and the resulting bindings."""
+
+    __slots__ = ("facts", "bindings", "parent", "children", "node", "key")
+
+    def __init__(self, facts: Tuple[Literal, ...], bindings: Substitution, parent: Optional['_Token'],
+                 node: '_JoinNode', key: JoinKey):
+        self.facts = facts
+        self.bindings = bindings
+        self.parent = parent
+        self.children: Dict[int, _Token] = {}
+        self.node = node
+        self.key = key
+
+
+class _JoinNode:
+    """
+    Adds pattern `level` of a rule to the partial matches of the previous patterns.
+    Both sides are hash-indexed on the join variables: `left` holds the tokens of the previous
+    level, `right` the entries of the pattern's alpha memory.
+    """
+
+    __slots__ = ("rule", "level", "alpha", "renaming", "join_vars", "alpha_join_vars", "left", "right", "next", "head")
+
+    def __init__(self, rule: Rule, level: int, alpha: _AlphaMemory, renaming: Dict[str, str],
+                 join_vars: Tuple[str, ...]):
+        self.rule = rule
+        self.level = level
+        self.alpha = alpha
+        self.renaming = renaming                  # canonical alpha variable -> rule variable
+        self.join_vars = join_vars                # rule variables shared with earlier patterns
+        canonical = {name: var for var, name in renaming.items()}
+        self.alpha_join_vars = tuple(canonical[name] for name in join_vars)
+        self.left: Dict[JoinKey, Dict[int, _Token]] = {}
+        self.right: Dict[JoinKey, Dict[Literal, Dict[str, Term]]] = {}
+        self.next: Optional[_JoinNode] = None     # None for the last pattern (terminal)
+        self.head = rule.head
+
+    def right_key(self, bindings: Dict[str, Term]) -> JoinKey:
+        """Join key of an alpha entry."""
+        return tuple(bindings[var] for var in self.alpha_join_vars)
+
+
+class ReteNetwork:
+    """
+    Forward-chaining engine that compiles rules into a Rete network and maintains the closure
+    of a fact set incrementally, under both assertions and retractions.
+
+    - Alpha memories hold the facts that pass a pattern's constant tests (predicate, constants,
+      repeated variables); variants of a pattern share one memory.
+    - Each rule is a chain of join nodes; a node joins the partial matches (tokens carrying
+      a `Substitution`) of the previous patterns with an alpha memory on their shared variables,
+      through hash indexes on both sides.
+    - Asserting a fact only activates the memories and joins it passes, and only new matches
+      fire rules. Derived facts flow through the same network until the closure is reached.
+    - Retraction uses delete-and-rederive: the tokens built on the fact are removed, every fact
+      derived through them is over-deleted, and over-deleted facts that still have another
+      derivation (or were asserted) are added back. This stays exact with recursive rules.
+
+    Facts must be ground and rules range-restricted (head variables occur in the body).
+    """
+
+    def __init__(self, rules: Iterable[RuleLike] = ()):
+        """Create a network compiled from `rules`."""
+        self._rules: List[Rule] = []
+        self._alphas: Dict[Literal, _AlphaMemory] = {}
+        self._alphas_by_predicate: Dict[int, List[_AlphaMemory]] = {}
+        self._facts: Set[Literal] = set()
+        self._asserted: Set[Literal] = set()
+        self._support: Dict[Literal, int] = {}              # derived fact -> number of rule matches producing it
+        # Tokens by the fact they added; tokens holding a fact are these and their descendants
+        self._tokens_by_fact: Dict[Literal, Dict[int, _Token]] = {}
+        for rule in rules:
+            self.add_rule(rule)
+
+    # Rules
+    def add_rule(self, rule: RuleLike):
+        """Compile `rule` into the network and fire it on the facts already present."""
+        if isinstance(rule, str):
+            rule = ParserAIMA.parse_rule(rule)
+        if rule.is_fact:
+            self.assert_fact(rule.head)
+            return
+        bound: Set[str] = set()
+        nodes: List[_JoinNode] = []
+        for level, pattern in enumerate(rule.body):
+            mapping = canonical_names(pattern)
+            alpha = self._alpha_memory(pattern.rename_variables(mapping))
+            variables = pattern.variables()
+            join_vars = tuple(name for name in variables if name in bound)
+            node = _JoinNode(rule, level, alpha, {canonical: name for name, canonical in mapping.items()}, join_vars)
+            bound.update(variables)
+            if nodes:
+                nodes[-1].next = node
+            nodes.append(node)
+        missing = [name for name in rule.head.variables() if name not in bound]
+        if missing:
+            raise ValueError(f"Rule is not range-restricted, head variables {missing} do not occur in the body: {rule}")
+        self._rules.append(rule)
+
+        for node in nodes:
+            node.alpha.successors.append(node)
+            if node.level > 0:
+                for fact, bindings in node.alpha.entries.items():
+                    node.right.setdefault(node.right_key(bindings), {})[fact] = bindings
+        pending: List[Literal] = []
+        for fact, bindings in list(nodes[0].alpha.entries.items()):
+            self._activate(self._token(None, fact, bindings, nodes[0]), pending)
+        self._insert_all(pending)
+
+    def _alpha_memory(self, pattern: Literal) -> _AlphaMemory:
+        """Return the alpha memory of a canonical pattern, filled with the matching facts."""
+        alpha = self._alphas.get(pattern)
+        if alpha is None:
+            alpha = self._alphas[pattern] = _AlphaMemory(pattern)
+            self._alphas_by_predicate.setdefault(pattern.symbol_id, []).append(alpha)
+            for fact in self._facts:
+                if fact.symbol_id == pattern.symbol_id:
+                    bindings: Dict[str, Term] = {}
+                    if match_literal(pattern, fact, bindings, []):
+                        alpha.entries[fact] = bindings
+        return alpha
+
+    # Facts
+    def assert_fact(self, fact: FactLike) -> bool:
+        """Assert a ground fact and derive its consequences; return False if it was already asserted."""
+        fact = self._fact(fact)
+        if fact in self._asserted:
+            return False
+        self._asserted.add(fact)
+        if fact not in self._facts:
+            self._insert_all([fact])
+        return True
+
+    def retract_fact(self, fact: FactLike) -> bool:
+        """Retract an asserted fact and everything that no longer follows; return False if not asserted."""
+        fact = self._fact(fact)
+        if fact not in self._asserted:
+            return False
+        self._asserted.discard(fact)
+
+        # Delete: remove the fact and, transitively, every fact derived through it (even if it
+        # has other derivations: those may be cyclic and depend on the fact being retracted)
+        deleted: List[Literal] = []
+        stack = [fact]
+        while stack:
+            current = stack.pop()
+            if current not in self._facts:
+                continue
+            self._facts.discard(current)
+            deleted.append(current)
+            for head in self._remove(current):
+                if head in self._facts and head not in self._asserted:
+                    stack.append(head)
+        # Rederive: facts that kept a derivation from the remaining facts come back
+        self._insert_all([lit for lit in deleted if lit in self._asserted or self._support.get(lit, 0) > 0])
+        return True
+
+    def _fact(self, fact: FactLike) -> Literal:
+        """Parse and validate a fact."""
+        if isinstance(fact, str):
+            fact = ParserAIMA.parse_literal(fact)
+        if fact.negated or any(not arg.ground for arg in fact.arguments):
+            raise ValueError(f"Facts must be positive and ground: {fact}")
+        return fact
+
+    def __contains__(self, fact: FactLike) -> bool:
+        """Return True if `fact` is asserted or derived."""
+        if isinstance(fact, str):
+            fact = ParserAIMA.parse_literal(fact)
+        return fact in self._facts
+
+    def __len__(self) -> int:
+        """Return the number of facts (asserted and derived)."""
+        return len(self._facts)
+
+    def facts(self, predicate: Optional[str] = None) -> Iterator[Literal]:
+        """Yield every fact, or only those of `predicate`."""
+        for fact in self._facts:
+            if predicate is None or fact.name == predicate:
+                yield fact
+
+    def derived(self) -> Set[Literal]:
+        """Return the facts that hold only because some rule derives them."""
+        return self._facts - self._asserted
+
+    # Propagation
+    def _insert_all(self, pending: List[Literal]):
+        """Add facts to the network until no rule derives anything new (explicit worklist)."""
+        while pending:
+            fact = pending.pop()
+            if fact in self._facts:
+                continue
+            self._facts.add(fact)
+            for alpha in self._alphas_by_predicate.get(fact.symbol_id, ()):
+                bindings: Dict[str, Term] = {}
+                if not match_literal(alpha.pattern, fact, bindings, []):
+                    continue
+                alpha.entries[fact] = bindings
+                for node in alpha.successors:
+                    if node.level == 0:
+                        self._activate(self._token(None, fact, bindings, node), pending)
+                        continue
+                    key = node.right_key(bindings)
+                    node.right.setdefault(key, {})[fact] = bindings
+                    for token in list(node.left.get(key, {}).values()):
+                        self._activate(self._token(token, fact, bindings, node), pending)
+
+    def _token(self, parent: Optional[_Token], fact: Literal, bindings: Dict[str, Term], node: _JoinNode) -> _Token:
+        """Extend `parent` (None at the first pattern) with `fact`, whose alpha bindings are `bindings`."""
+        subst = parent.bindings if parent is not None else Substitution()
+        for canonical, value in bindings.items():
+            name = node.renaming[canonical]
+            if not subst.contains(name):
+                subst = subst.extend(name, value)
+        facts = (parent.facts if parent is not None else ()) + (fact,)
+        key = tuple(subst.get(name) for name in node.next.join_vars) if node.next is not None else ()
+        token = _Token(facts, subst, parent, node, key)
+        if parent is not None:
+            parent.children[id(token)] = token
+        self._tokens_by_fact.setdefault(fact, {})[id(token)] = token
+        return token
+
+    def _activate(self, token: _Token, pending: List[Literal]):
+        """Propagate a new token down its rule, firing the rule on every complete match."""
+        stack = [token]
+        while stack:
+            token = stack.pop()
+            node = token.node.next
+            if node is None:
+                head = token.node.head.apply_substitution(token.bindings)
+                self._support[head] = self._support.get(head, 0) + 1
+                if head not in self._facts:
+                    pending.append(head)
+                continue
+            node.left.setdefault(token.key, {})[id(token)] = token
+            for fact, bindings in node.right.get(token.key, {}).items():
+                stack.append(self._token(token, fact, bindings, node))
+
+    def _remove(self, fact: Literal) -> List[Literal]:
+        """Remove `fact` from alpha memories and every token built on it; return the heads that lost support."""
+        for alpha in self._alphas_by_predicate.get(fact.symbol_id, ()):
+            bindings = alpha.entries.pop(fact, None)
+            if bindings is None:
+                continue
+            for node in alpha.successors:
+                if node.level > 0:
+                    bucket = node.right.get(node.right_key(bindings))
+                    if bucket is not None:
+                        bucket.pop(fact, None)
+        heads: List[Literal] = []
+        stack = list(self._tokens_by_fact.pop(fact, {}).values())
+        while stack:
+            token = stack.pop()
+            added = self._tokens_by_fact.get(token.facts[-1])
+            if added is not None:
+                added.pop(id(token), None)
+            if token.parent is not None:
+                token.parent.children.pop(id(token), None)
+            node = token.node.next
+            if node is None:
+                head = token.node.head.apply_substitution(token.bindings)
+                self._support[head] -= 1
+                if not self._support[head]:
+                    del self._support[head]
+                heads.append(head)
+            else:
+                bucket = node.left.get(token.key)
+                if bucket is not None:
+                    bucket.pop(id(token), None)
+            stack.extend(token.children.values())
+            token.children = {}
+        return heads
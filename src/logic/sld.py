@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.models.literal import Literal
+from src.models.rule import Rule
+from src.models.symbols import SYMBOLS
+from src.models.term import Function, Term, Variable
+
+# Compiled terms used by the engine (structure sharing):
+# - int: variable slot, relative to the frame the term is used in
+# - Term: ground subterm (Constant or ground Function), shared with the source clause
+# - tuple: non-ground compound `(symbol_id, arg1, ..., argN)` with compiled arguments
+Compiled = Union[int, Term, tuple]
+
+# Goal list as a linked list: (predicate symbol id, compiled arguments, frame, rest) or None
+Goals = Optional[tuple]
+
+QueryLike = Union[str, Literal, Sequence[Literal]]
+ClauseLike = Union[str, Rule, Literal]
+
+
+def _compile(term: Term, slots: Dict[str, int]) -> Compiled:
+    """Compile `term`, numbering its variables through `slots` (explicit post-order stack)."""
+    if term.ground:
+        return term
+    if isinstance(term, Variable):
+        return slots.setdefault(term.name, len(slots))
+    results: List[Compiled] = []
+    stack = [(term, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            arity = len(node.arguments)
+            args = results[len(results) - arity:]
+            del results[len(results) - arity:]
+            results.append((node.symbol_id, *args))
+        elif node.ground:
+            results.append(node)
+        elif isinstance(node, Variable):
+            results.append(slots.setdefault(node.name, len(slots)))
+        else:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in reversed(node.arguments))
+    return results[0]
+
+
+def _index_key(arg: Compiled) -> Optional[int]:
+    """Return the first-argument index key (symbol id), or None for a variable."""
+    if type(arg) is int:
+        return None
+    if type(arg) is tuple:
+        return arg[0]
+    return arg.symbol_id
+
+
+class _CompiledClause:
+    """A rule compiled once: head and body arguments refer to variable slots `0..size-1`."""
+
+    __slots__ = ("rule", "head", "body", "blank")
+
+    def __init__(self, rule: Rule):
+        slots: Dict[str, int] = {}
+        self.rule = rule
+        self.head = tuple(_compile(arg, slots) for arg in rule.head.arguments)
+        self.body = tuple((lit.symbol_id, tuple(_compile(arg, slots) for arg in lit.arguments))
+                          for lit in rule.body)
+        # Fresh, unbound frame for one use of the clause
+        self.blank = [None] * len(slots)
+
+
+class _Predicate:
+    """Clauses of one predicate, in insertion order, indexed by their first argument."""
+
+    __slots__ = ("clauses", "by_first", "variable_first")
+
+    def __init__(self):
+        self.clauses: List[_CompiledClause] = []
+        # Each keyed list also holds the clauses whose first argument is a variable, in order
+        self.by_first: Dict[int, List[_CompiledClause]] = {}
+        self.variable_first: List[_CompiledClause] = []
+
+    def add(self, clause: _CompiledClause):
+        """Append `clause` to the full list and to every index list it can match."""
+        self.clauses.append(clause)
+        key = _index_key(clause.head[0]) if clause.head else None
+        if key is None:
+            self.variable_first.append(clause)
+            for bucket in self.by_first.values():
+                bucket.append(clause)
+            return
+        bucket = self.by_first.get(key)
+        if bucket is None:
+            bucket = self.by_first[key] = list(self.variable_first)
+        bucket.append(clause)
+
+
+class SLDEngine:
+    """
+    Horn-clause query engine: depth-first SLD resolution over definite rules and facts,
+    enumerating answer substitutions lazily (Prolog search order, without cut or negation).
+
+    - Clauses are compiled once; variables become slots of a frame, and using a clause only
+      reserves a fresh frame (an offset into one shared binding array), so renaming apart
+      never builds new variable names or terms.
+    - Bindings are undone on backtracking through a trail; choice points are kept on an
+      explicit stack, so deep derivations never exhaust the Python call stack.
+    - Candidate clauses are looked up by predicate and, when the goal's first argument is
+      bound, by its symbol (first-argument indexing).
+    - `occurs_check` (on by default) rejects cyclic bindings; without it, answers that would
+      contain a cyclic term raise ValueError when they are built.
+
+    Left-recursive rules do not terminate under plain SLD resolution.
+    """
+
+    def __init__(self, clauses: Iterable[ClauseLike] = (), occurs_check: bool = True):
+        """Create an engine holding `clauses` (rules, facts or their AIMA text)."""
+        self.occurs_check = occurs_check
+        self._predicates: Dict[int, _Predicate] = {}
+        self._size = 0
+        self.add_all(clauses)
+
+    # Knowledge base
+    def add(self, clause: ClauseLike):
+        """Add a rule or fact; strings are parsed with `ParserAIMA.parse_rule`."""
+        if isinstance(clause, str):
+            clause = ParserAIMA.parse_rule(clause)
+        elif isinstance(clause, Literal):
+            clause = Rule(clause)
+        predicate = self._predicates.get(clause.head.symbol_id)
+        if predicate is None:
+            predicate = self._predicates[clause.head.symbol_id] = _Predicate()
+        predicate.add(_CompiledClause(clause))
+        self._size += 1
+
+    def add_all(self, clauses: Iterable[ClauseLike]):
+        """Add every clause of `clauses`."""
+        for clause in clauses:
+            self.add(clause)
+
+    def __len__(self) -> int:
+        """Return the number of stored clauses."""
+        return self._size
+
+    # Queries
+    def ask(self, query: QueryLike) -> Iterator[Substitution]:
+        """
+        Yield one substitution over the query variables per proof of the conjunctive `query`,
+        in SLD (depth-first, left-to-right) order. Strings are parsed as `L1 ∧ L2 ∧ ...`.
+        Variables left unbound by a proof appear as fresh `_G<n>` variables.
+        """
+        goals = self._query_literals(query)
+        slots: Dict[str, int] = {}
+        compiled = [(lit.symbol_id, tuple(_compile(arg, slots) for arg in lit.arguments)) for lit in goals]
+        node: Goals = None
+        for symbol_id, args in reversed(compiled):
+            node = (symbol_id, args, 0, node)
+        bindings: List = [None] * len(slots)
+        for _ in self._solve(node, bindings):
+            yield Substitution({name: self._to_term(slot, 0, bindings) for name, slot in slots.items()})
+
+    def ask_one(self, query: QueryLike) -> Optional[Substitution]:
+        """Return the first answer to `query`, or None if it has no proof."""
+        return next(iter(self.ask(query)), None)
+
+    @staticmethod
+    def _query_literals(query: QueryLike) -> List[Literal]:
+        """Normalize a query into a list of positive literals."""
+        if isinstance(query, str):
+            literals = ParserAIMA.parse_conjunction(query)
+        elif isinstance(query, Literal):
+            literals = [query]
+        else:
+            literals = list(query)
+        for lit in literals:
+            if lit.negated:
+                raise ValueError(f"Query literals must be positive: {lit}")
+        return literals
+
+    # Resolution
+    def _solve(self, goals: Goals, bindings: List) -> Iterator[None]:
+        """Yield once per proof of `goals`, with `bindings` holding the answer at that point."""
+        if goals is None:
+            yield
+            return
+        trail: List[int] = []
+        # Choice point: [goal node, candidate clauses, next candidate, trail length, frame top]
+        choices = [self._choice_point(goals, bindings, trail)]
+        while choices:
+            point = choices[-1]
+            node, candidates, index, trail_mark, top = point
+            self._undo(bindings, trail, trail_mark, top)
+            _, args, frame, rest = node
+
+            resolved = None
+            while index < len(candidates):
+                clause = candidates[index]
+                index += 1
+                base = len(bindings)
+                bindings.extend(clause.blank)
+                if self._unify_args(clause.head, base, args, frame, bindings, trail):
+                    resolved = (clause, base)
+                    break
+                self._undo(bindings, trail, trail_mark, top)
+            if resolved is None:
+                choices.pop()
+                continue
+            if index < len(candidates):
+                point[2] = index
+            else:
+                # No alternatives left: drop the choice point before going deeper
+                choices.pop()
+
+            clause, base = resolved
+            for symbol_id, body_args in reversed(clause.body):
+                rest = (symbol_id, body_args, base, rest)
+            if rest is None:
+                yield
+                continue
+            choices.append(self._choice_point(rest, bindings, trail))
+
+    def _choice_point(self, node: tuple, bindings: List, trail: List[int]) -> list:
+        """Create the choice point for the first goal of `node`."""
+        symbol_id, args, frame, _ = node
+        predicate = self._predicates.get(symbol_id)
+        if predicate is None:
+            candidates: List[_CompiledClause] = []
+        elif not args:
+            candidates = predicate.clauses
+        else:
+            first, first_frame = self._deref(args[0], frame, bindings)
+            key = _index_key(first) if type(first) is not int else None
+            if key is None:
+                candidates = predicate.clauses
+            else:
+                candidates = predicate.by_first.get(key, predicate.variable_first)
+        return [node, candidates, 0, len(trail), len(bindings)]
+
+    @staticmethod
+    def _undo(bindings: List, trail: List[int], trail_mark: int, top: int):
+        """Unbind the variables bound since `trail_mark` and release frames above `top`."""
+        while len(trail) > trail_mark:
+            slot = trail.pop()
+            if slot < top:
+                bindings[slot] = None
+        del bindings[top:]
+
+    @staticmethod
+    def _deref(term: Compiled, frame: int, bindings: List) -> Tuple[Compiled, int]:
+        """Follow variable bindings to an unbound slot or a non-variable term."""
+        while type(term) is int:
+            cell = bindings[frame + term]
+            if cell is None:
+                break
+            term, frame = cell
+        return term, frame
+
+    def _unify_args(self, left: tuple, left_frame: int, right: tuple, right_frame: int,
+                    bindings: List, trail: List[int]) -> bool:
+        """Unify two compiled argument tuples under their frames, trailing every binding."""
+        stack = [(a, left_frame, b, right_frame) for a, b in zip(left, right)]
+        stack.reverse()
+        while stack:
+            a, fa, b, fb = stack.pop()
+            while type(a) is int:
+                cell = bindings[fa + a]
+                if cell is None:
+                    break
+                a, fa = cell
+            while type(b) is int:
+                cell = bindings[fb + b]
+                if cell is None:
+                    break
+                b, fb = cell
+
+            if type(a) is int:
+                if type(b) is int and fa + a == fb + b:
+                    continue
+                if not self._bind(fa + a, b, fb, bindings, trail):
+                    return False
+            elif type(b) is int:
+                if not self._bind(fb + b, a, fa, bindings, trail):
+                    return False
+            elif type(a) is tuple:
+                if type(b) is tuple:
+                    if a[0] != b[0]:
+                        return False
+                    stack.extend((x, fa, y, fb) for x, y in zip(reversed(a[1:]), reversed(b[1:])))
+                elif isinstance(b, Function) and b.symbol_id == a[0]:
+                    stack.extend((x, fa, y, 0) for x, y in zip(reversed(a[1:]), reversed(b.arguments)))
+                else:
+                    return False
+            elif type(b) is tuple:
+                if not (isinstance(a, Function) and a.symbol_id == b[0]):
+                    return False
+                stack.extend((x, fa, y, fb) for x, y in zip(reversed(a.arguments), reversed(b[1:])))
+            elif a is not b and a != b:
+                return False
+        return True
+
+    def _bind(self, slot: int, term: Compiled, frame: int, bindings: List, trail: List[int]) -> bool:
+        """Bind `slot` to `term` in `frame` unless the occurs check fails."""
+        if self.occurs_check and type(term) is tuple and self._occurs(slot, term, frame, bindings):
+            return False
+        bindings[slot] = (term, frame)
+        trail.append(slot)
+        return True
+
+    @staticmethod
+    def _occurs(slot: int, term: tuple, frame: int, bindings: List) -> bool:
+        """Return True if the variable in `slot` occurs in `term` under `frame`."""
+        stack = [(term, frame)]
+        while stack:
+            node, node_frame = stack.pop()
+            while type(node) is int:
+                if node_frame + node == slot:
+                    return True
+                cell = bindings[node_frame + node]
+                if cell is None:
+                    break
+                node, node_frame = cell
+            if type(node) is tuple:
+                stack.extend((arg, node_frame) for arg in node[1:])
+        return False
+
+    # Answers
+    @staticmethod
+    def _to_term(term: Compiled, frame: int, bindings: List) -> Term:
+        """Build the `Term` denoted by `term` under `frame` (explicit stack; raises ValueError if cyclic)."""
+        results: List[Term] = []
+        active = set()
+        stack = [(term, frame, False)]
+        while stack:
+            node, node_frame, expanded = stack.pop()
+            if expanded:
+                arity = len(node) - 1
+                args = results[len(results) - arity:]
+                del results[len(results) - arity:]
+                active.discard((id(node), node_frame))
+                results.append(Function(SYMBOLS.names[node[0]], args))
+                continue
+            while type(node) is int:
+                cell = bindings[node_frame + node]
+                if cell is None:
+                    break
+                node, node_frame = cell
+            if type(node) is int:
+                results.append(Variable(f"_G{node_frame + node}"))
+            elif type(node) is tuple:
+                key = (id(node), node_frame)
+                if key in active:
+                    raise ValueError("Cyclic answer: a variable is bound to a term containing itself")
+                active.add(key)
+                stack.append((node, node_frame, True))
+                stack.extend((arg, node_frame, False) for arg in reversed(node[1:]))
+            else:
+                results.append(node)
+        return results[0]
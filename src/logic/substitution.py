@@ -1,33 +1,67 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable
 
-from src.models.term import Term, Variable
+from src.logic.persistent_map import PersistentMap
+from src.models.term import Term, Variable, _apply_substitution, _variable_bit
 
 
-@dataclass(frozen=True)
 class Substitution:
-    """Immutable mapping from variable names to replacement terms used to build most-general unifiers."""
+    """
+    Immutable mapping from variable names to replacement terms used to build most-general unifiers.
 
-    mapping: Dict[str, Term]
+    Bindings live in a persistent hash trie, so `extend` shares structure with the original
+    substitution instead of copying it (O(log n) time and allocations per binding).
+    `variable_mask` folds the bound variables like `Term.variable_mask` does, so terms whose
+    mask does not intersect it are returned by `apply` without being walked.
+    """
+
+    __slots__ = ("_bindings", "_mapping", "variable_mask")
 
     def __init__(self, mapping: Dict[str, Term] | None = None):
-        """Create a substitution; copies `mapping` to keep instances immutable."""
-        object.__setattr__(self, "mapping", dict(mapping or {}))
+        """Create a substitution from a plain `{var_name: term}` dict (the dict is not retained)."""
+        self._bindings = PersistentMap((mapping or {}).items())
+        self._mapping = None
+        mask = 0
+        for var_name in self._bindings.keys():
+            mask |= _variable_bit(var_name)
+        self.variable_mask = mask
+
+    @classmethod
+    def _from_bindings(cls, bindings: PersistentMap, mask: int) -> Substitution:
+        """Wrap an existing persistent map (whose bound variables fold into `mask`) without copying it."""
+        instance = object.__new__(cls)
+        instance._bindings = bindings
+        instance._mapping = None
+        instance.variable_mask = mask
+        return instance
+
+    def __reduce__(self):
+        """Pickle through the plain mapping so the bindings trie is rebuilt in the target process."""
+        return Substitution, (self.mapping,)
+
+    @property
+    def mapping(self) -> Dict[str, Term]:
+        """Return the bindings as an insertion-ordered dict (built lazily, read-only by convention)."""
+        if self._mapping is None:
+            self._mapping = dict(self._bindings.items())
+        return self._mapping
 
     # Basic accessors
     def contains(self, var_name: str) -> bool:
         """Return True if the variable name exists in the substitution."""
-        return var_name in self.mapping
+        return var_name in self._bindings
 
     def get(self, var_name: str) -> Term:
         """Return the term currently mapped to `var_name`."""
-        return self.mapping[var_name]
+        term = self._bindings.get(var_name)
+        if term is None:
+            raise KeyError(var_name)
+        return term
 
     def is_empty(self) -> bool:
         """Return True if the substitution contains no mappings."""
-        return len(self.mapping) == 0
+        return len(self._bindings) == 0
 
     # Core operations
     def extend(self, var_name: str, term: Term) -> Substitution:
@@ -37,14 +71,61 @@ class Substitution:
         """
         if isinstance(term, Variable) and term.name == var_name:
             return self  # no change
-        new_map = dict(self.mapping)
-        new_map[var_name] = term
-        return Substitution(new_map)
+        return Substitution._from_bindings(self._bindings.set(var_name, term),
+                                           self.variable_mask | _variable_bit(var_name))
 
     def apply(self, term: Term) -> Term:
         """Apply this substitution to a term."""
+        if not term.variable_mask & self.variable_mask:
+            return term
         return term.apply_substitution(self)
 
+    def dereference(self, term: Term) -> Term:
+        """
+        Follow variable-to-term bindings from `term` until an unbound variable or a non-variable
+        term is reached, without applying the substitution inside compound terms.
+        A chain longer than the number of bindings must revisit a variable, so cyclic
+        bindings (x -> y, y -> x) raise ValueError instead of looping forever.
+        """
+        bindings = self._bindings
+        remaining = len(bindings)
+        while isinstance(term, Variable):
+            bound = bindings.get(term.name)
+            if bound is None:
+                return term
+            if remaining == 0:
+                raise ValueError(f"Cyclic substitution: variable '{term.name}' is bound to itself through a chain")
+            remaining -= 1
+            term = bound
+        return term
+
+    def is_idempotent(self) -> bool:
+        """Return True if no bound variable occurs in any binding, so one `apply` step is final."""
+        mask = self.variable_mask
+        return all(not term.variable_mask & mask or not any(self.contains(name) for name in term.variables())
+                   for _, term in self._bindings.items())
+
+    def normalize(self) -> Substitution:
+        """
+        Return the equivalent idempotent substitution: chains such as {x / y, y / f(z), z / A}
+        become {x / f(A), y / f(A), z / A}. All bindings are resolved in one pass over the
+        binding graph with a shared memo, so each binding is expanded once.
+        Returns `self` when already idempotent; raises ValueError on cyclic bindings.
+        """
+        mask = self.variable_mask
+        if all(not term.variable_mask & mask for _, term in self._bindings.items()):
+            return self
+        results: Dict = {}
+        resolved = PersistentMap((name, _apply_substitution(term, self, results))
+                                 for name, term in self._bindings.items())
+        return Substitution._from_bindings(resolved, mask)
+
+    def restrict(self, variables: Iterable[str]) -> Substitution:
+        """Project onto `variables`: keep only their bindings (normalize first to keep their full values)."""
+        bindings = self._bindings
+        kept = {name: bindings.get(name) for name in variables if name in bindings}
+        return Substitution(kept)
+
     def apply_to_literal(self, literal: 'Literal') -> 'Literal':
         """Apply substitution to a literal."""
         return literal.apply_substitution(self)
@@ -55,11 +136,19 @@ class Substitution:
         apply self, then apply other to the result.
         """
         # Apply self to all terms in other
-        composed = {v: self.apply(t) for v, t in other.mapping.items()}
+        composed = PersistentMap((v, self.apply(t)) for v, t in other._bindings.items())
         # Add mappings from self
-        for v, t in self.mapping.items():
-            composed[v] = t
-        return Substitution(composed)
+        for v, t in self._bindings.items():
+            composed = composed.set(v, t)
+        return Substitution._from_bindings(composed, self.variable_mask | other.variable_mask)
+
+    def __eq__(self, other) -> bool:
+        """Two substitutions are equal when they bind the same variables to equal terms."""
+        if not isinstance(other, Substitution):
+            return NotImplemented
+        return self.mapping == other.mapping
+
+    __hash__ = None
 
     # String representation
     def __str__(self) -> str:
@@ -75,3 +164,4 @@ class Substitution:
     def __repr__(self):
         """Return the developer representation mirroring `__str__`."""
         return str(self)
+
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from src.logic.matching import match_literal
+from src.logic.substitution import Substitution
+from src.models.literal import Literal
+from src.models.term import Term
+
+
+def _undo(bindings: Dict[str, Term], trail: List[str], mark: int):
+    """Remove the bindings recorded on `trail` after position `mark`."""
+    while len(trail) > mark:
+        del bindings[trail.pop()]
+
+
+def subsumes(general: Sequence[Literal], specific: Sequence[Literal]) -> Optional[Substitution]:
+    """
+    Return θ such that every literal of `general`θ is a distinct literal of `specific`, or None.
+
+    This is multiset subsumption: `general` can never have more literals than `specific`,
+    so a clause never subsumes its own factors. Literals are matched most-constrained first,
+    with chronological backtracking over the candidate literals of `specific`.
+    """
+    general = list(general)
+    specific = list(specific)
+    if len(general) > len(specific):
+        return None
+
+    by_signature: Dict[tuple, List[int]] = {}
+    for j, literal in enumerate(specific):
+        by_signature.setdefault((literal.symbol_id, literal.negated), []).append(j)
+    candidates = []
+    for literal in general:
+        options = by_signature.get((literal.symbol_id, literal.negated))
+        if not options:
+            return None
+        candidates.append((literal, options))
+    # Fewest options first, then the largest literal: failures surface early
+    candidates.sort(key=lambda item: (len(item[1]), -item[0].size))
+
+    bindings: Dict[str, Term] = {}
+    trail: List[str] = []
+    used = [False] * len(specific)
+    count = len(candidates)
+    next_option = [0] * count
+    chosen = [0] * count
+    marks = [0] * count
+    level = 0
+    while level < count:
+        literal, options = candidates[level]
+        advanced = False
+        while next_option[level] < len(options):
+            j = options[next_option[level]]
+            next_option[level] += 1
+            if used[j]:
+                continue
+            mark = len(trail)
+            if match_literal(literal, specific[j], bindings, trail):
+                used[j] = True
+                chosen[level], marks[level] = j, mark
+                advanced = True
+                break
+            _undo(bindings, trail, mark)
+        if advanced:
+            level += 1
+            if level < count:
+                next_option[level] = 0
+            continue
+        # Backtrack to the previous literal and try its next option
+        if level == 0:
+            return None
+        level -= 1
+        used[chosen[level]] = False
+        _undo(bindings, trail, marks[level])
+    return Substitution(bindings)
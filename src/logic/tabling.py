@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import sys
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from src.logic.indexing import DiscriminationTree
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.logic.unifier import Unifier
+from src.logic.unify_cache import canonical_names
+from src.models.errors import UnificationError
+from src.models.literal import Literal
+from src.models.rule import Rule
+from src.models.term import Variable
+
+QueryLike = Union[str, Literal, Sequence[Literal]]
+ClauseLike = Union[str, Rule, Literal]
+
+# Predicate of the internal goal that collects the answers of a (conjunctive) query
+_QUERY = "?-"
+
+
+def variant_key(literal: Literal) -> Literal:
+    """Return `literal` with its variables renamed `_0`, `_1`, ... in order of first occurrence."""
+    if not literal.variables():
+        return literal
+    return literal.rename_variables(canonical_names(literal))
+
+
+class _Table:
+    """Answer table of one subgoal (kept in variant form) and the consumers waiting on it."""
+
+    __slots__ = ("goal", "answers", "negated", "seen", "waiting", "complete")
+
+    def __init__(self, goal: Literal):
+        self.goal = goal
+        self.answers: List[Literal] = []
+        self.negated: List[Literal] = []    # answers negated once, ready for `unify_literals`
+        self.seen: Set[Literal] = set()
+        # Suspended consumers: (consumer table, remaining body, substitution so far)
+        self.waiting: List[Tuple['_Table', Tuple[Literal, ...], Substitution]] = []
+        self.complete = False
+
+
+class TabledEngine:
+    """
+    Backward chaining with tabling (SLG-style memoization) over definite rules and facts.
+
+    Every subgoal gets an answer table keyed on its variant (variables renamed canonically),
+    so a call that repeats an earlier one, up to variable names, consumes the existing table
+    instead of re-deriving it. That makes left-recursive and cyclic rules such as
+    `Ancestor(x, z) ∧ Parent(z, y) ⇒ Ancestor(x, y)` terminate whenever the answer set is finite.
+
+    Evaluation is incremental: a rule body that calls a table is suspended on it and resumed
+    once per answer, when the answer is found; no join is ever recomputed. Work items live on
+    an agenda, so evaluation never recurses. Tables are complete once the agenda is empty and
+    are reused by later queries until the knowledge base changes.
+    """
+
+    def __init__(self, clauses: Iterable[ClauseLike] = (), engine: str = "union_find"):
+        """Create an engine holding `clauses`, unifying with the given `Unifier` engine."""
+        self.unifier = Unifier(engine=engine)
+        self._rules: List[Tuple[Rule, List[str]]] = []
+        self._heads = DiscriminationTree()
+        self._tables: Dict[Literal, _Table] = {}
+        self._renamings = 0
+        for clause in clauses:
+            self.add(clause)
+
+    # Knowledge base
+    def add(self, clause: ClauseLike):
+        """Add a rule or fact (strings are parsed with `ParserAIMA.parse_rule`); clears the tables."""
+        if isinstance(clause, str):
+            clause = ParserAIMA.parse_rule(clause)
+        elif isinstance(clause, Literal):
+            clause = Rule(clause)
+        self._heads.insert(clause.head, len(self._rules))
+        self._rules.append((clause, clause.variables()))
+        self._tables.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored clauses."""
+        return len(self._rules)
+
+    # Queries
+    def ask(self, query: QueryLike) -> Iterator[Substitution]:
+        """
+        Yield one substitution over the query variables per distinct answer to the conjunctive
+        `query`, as answers are found. Strings are parsed as `L1 ∧ L2 ∧ ...`.
+        Variables left unbound by an answer appear as `_0`, `_1`, ...
+        """
+        if isinstance(query, str):
+            literals = tuple(ParserAIMA.parse_conjunction(query))
+        elif isinstance(query, Literal):
+            literals = (query,)
+        else:
+            literals = tuple(query)
+        names: Dict[str, None] = {}
+        for lit in literals:
+            for name in lit.variables():
+                names.setdefault(name)
+        root = _Table(Literal(_QUERY, [Variable(name) for name in names]))
+        agenda: Deque[tuple] = deque()
+        self._resume(root, literals, Substitution(), agenda)
+        try:
+            reported = 0
+            while True:
+                while reported < len(root.answers):
+                    values = root.answers[reported].arguments
+                    reported += 1
+                    yield Substitution(dict(zip(names, values)))
+                if not agenda:
+                    break
+                self._step(agenda.popleft(), agenda)
+        finally:
+            if agenda:
+                # Abandoned before the fixpoint: drop the tables that may be missing answers
+                self._tables = {key: table for key, table in self._tables.items() if table.complete}
+            else:
+                for table in self._tables.values():
+                    # A complete table gets no new answers, so nobody needs to wait on it
+                    table.complete = True
+                    table.waiting.clear()
+
+    def ask_one(self, query: QueryLike) -> Optional[Substitution]:
+        """Return the first answer to `query`, or None if it has none."""
+        answers = self.ask(query)
+        try:
+            return next(answers, None)
+        finally:
+            answers.close()
+
+    def clear_tables(self):
+        """Forget every answer table."""
+        self._tables.clear()
+
+    def table_stats(self) -> Dict[str, int]:
+        """
+        Return the number of tables, stored answers and suspended consumers, plus an estimate
+        of the table memory in bytes (containers and answer literals; shared terms excluded).
+        """
+        answers = waiting = size = 0
+        for key, table in self._tables.items():
+            answers += len(table.answers)
+            waiting += len(table.waiting)
+            size += sys.getsizeof(table) + sys.getsizeof(key)
+            size += sys.getsizeof(table.answers) + sys.getsizeof(table.negated) + sys.getsizeof(table.seen)
+            size += sys.getsizeof(table.waiting)
+            size += sum(2 * (sys.getsizeof(a) + sys.getsizeof(a.arguments)) for a in table.answers)
+        return {"tables": len(self._tables), "answers": answers, "waiting": waiting,
+                "bytes": size + sys.getsizeof(self._tables)}
+
+    # Evaluation
+    def _step(self, item: tuple, agenda: Deque[tuple]):
+        """Process one agenda item: evaluate a new table, or feed one answer to one consumer."""
+        if item[0] == "eval":
+            table = item[1]
+            for _, index in self._heads.unifiable(table.goal):
+                head, body = self._renamed(index)
+                try:
+                    subst = self.unifier.unify_literals(table.goal, head)
+                except (UnificationError, ValueError):
+                    continue
+                if subst is not None:
+                    self._resume(table, body, subst, agenda)
+        else:
+            _, consumer, body, subst, answer = item
+            if answer.variables():
+                answer = self._rename_apart(answer)
+            try:
+                subst = self.unifier.unify_literals(body[0], answer, subst)
+            except (UnificationError, ValueError):
+                return
+            if subst is not None:
+                self._resume(consumer, body[1:], subst, agenda)
+
+    def _resume(self, table: _Table, body: Tuple[Literal, ...], subst: Substitution, agenda: Deque[tuple]):
+        """Continue a rule body: record an answer when it is empty, else suspend on its first call."""
+        if not body:
+            self._add_answer(table, table.goal.apply_substitution(subst), agenda)
+            return
+        call = variant_key(body[0].apply_substitution(subst))
+        callee = self._tables.get(call)
+        if callee is None:
+            callee = self._tables[call] = _Table(call)
+            agenda.append(("eval", callee))
+        if not callee.complete:
+            callee.waiting.append((table, body, subst))
+        for answer in callee.negated:
+            agenda.append(("answer", table, body, subst, answer))
+
+    def _add_answer(self, table: _Table, answer: Literal, agenda: Deque[tuple]):
+        """Store `answer` unless a variant is already in `table`, and wake up its consumers."""
+        answer = variant_key(answer)
+        if answer in table.seen:
+            return
+        table.seen.add(answer)
+        table.answers.append(answer)
+        negated = answer.negate()
+        table.negated.append(negated)
+        for consumer, body, subst in table.waiting:
+            agenda.append(("answer", consumer, body, subst, negated))
+
+    # Renaming apart
+    def _renamed(self, index: int) -> Tuple[Literal, Tuple[Literal, ...]]:
+        """Return the negated head and the body of rule `index` with fresh variables."""
+        rule, variables = self._rules[index]
+        if not variables:
+            return rule.head.negate(), rule.body
+        self._renamings += 1
+        mapping = {name: f"{name}#{self._renamings}" for name in variables}
+        return (rule.head.negate().rename_variables(mapping),
+                tuple(lit.rename_variables(mapping) for lit in rule.body))
+
+    def _rename_apart(self, answer: Literal) -> Literal:
+        """Return a copy of a (canonical) answer with fresh variables."""
+        self._renamings += 1
+        return answer.rename_variables({name: f"{name}#{self._renamings}" for name in answer.variables()})
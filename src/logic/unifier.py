@@ -1,101 +1,367 @@
 from __future__ import annotations
 
-from typing import Optional
+import time
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from src.logic.instrumentation import ARITY, CLASH, NOT_COMPLEMENTARY, OCCURS, EventCallback, UnifyStats
+from src.logic.matching import Matchable, match
+from src.logic.occurs_check import ALWAYS, DEFERRED, INCREMENTAL, POLICIES, find_cycle, occurs, occurs_incremental
+from src.logic.parser import ParserAIMA
 from src.logic.substitution import Substitution
+from src.logic.union_find import UnionFindEngine
+from src.logic.unify_cache import UnificationCache, canonical_names, restore_outcome, store_outcome
 from src.models.errors import UnificationError
 from src.models.literal import Literal
 from src.models.term import Function, Term, Variable
+from src.utils.parallel import ordered_chunk_map
 from src.utils.printer import Printer
 
+Expression = Union[Term, Literal, str]
+UnifyOutcome = Union[Substitution, UnificationError]
+
 
 class Unifier:
     """Deterministic implementation of the AIMA unification procedure for both terms and literals."""
 
-    def __init__(self, verbose: bool = False):
-        """Initialize the unifier; enable verbose printing when `verbose` is True."""
+    ENGINES = ("recursive", "union_find")
+
+    def __init__(self, verbose: bool = False, engine: str = "recursive", cache_size: int = 0,
+                 occurs_check: str = INCREMENTAL):
+        """
+        Initialize the unifier; enable verbose printing when `verbose` is True.
+        `engine` selects the backend: "recursive" (AIMA textbook procedure) or
+        "union_find" (in-place bindings with path compression, faster on large terms).
+        `cache_size` > 0 memoizes `unify` / `unify_literals` outcomes in an LRU `UnificationCache`.
+        `occurs_check` is one of `occurs_check.POLICIES`: "incremental" (default) and "always"
+        check every binding, "deferred" searches the final bindings for a cycle once, and
+        "never" accepts cyclic bindings (rational trees).
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown unification engine '{engine}'. Expected one of: {', '.join(self.ENGINES)}")
+        if occurs_check not in POLICIES:
+            raise ValueError(
+                f"Unknown occurs check policy '{occurs_check}'. Expected one of: {', '.join(POLICIES)}")
         self.verbose = verbose
+        self.engine = engine
+        self.occurs_check = occurs_check
+        self._union_find = UnionFindEngine(occurs_check) if engine == "union_find" else None
+        self.cache = UnificationCache(cache_size) if cache_size > 0 else None
+        # Instrumentation (off by default; see `instrument`)
+        self._stats: Optional[UnifyStats] = None
+        self._callback: Optional[EventCallback] = None
+        self._timing = False
+
+    # Instrumentation
+    def instrument(self, stats: Optional[UnifyStats] = None, callback: Optional[EventCallback] = None,
+                   timing: bool = False) -> UnifyStats:
+        """
+        Start collecting counters into `stats` (a fresh `UnifyStats` by default) and return it.
+        `callback(event, data)` is called on every binding ("bind"), failed call ("fail") and,
+        with `timing`, every timed `unify` / `unify_literals` call ("span").
+        Uninstrumented unifiers only pay one `is None` test per call and per equation.
+        """
+        self._stats = stats if stats is not None else UnifyStats()
+        self._callback = callback
+        self._timing = timing
+        if self._union_find is not None:
+            self._union_find.stats = self._stats
+            self._union_find.callback = callback
+        return self._stats
+
+    def uninstrument(self):
+        """Stop collecting counters and detach the callback."""
+        self._stats = None
+        self._callback = None
+        self._timing = False
+        if self._union_find is not None:
+            self._union_find.stats = None
+            self._union_find.callback = None
+
+    @property
+    def stats(self) -> Optional[UnifyStats]:
+        """Counters of the current instrumentation, or None when disabled."""
+        return self._stats
+
+    def _observe(self, span: str, func: Callable, *args) -> Any:
+        """Run one top-level call under instrumentation: count it, time it and classify failures."""
+        stats = self._stats
+        stats.calls += 1
+        start = time.perf_counter() if self._timing else None
+        try:
+            result = func(*args)
+        except UnificationError as error:
+            self._record_failure(error.cause or CLASH, error.message)
+            raise
+        finally:
+            if start is not None:
+                elapsed = time.perf_counter() - start
+                stats.record_span(span, elapsed)
+                if self._callback is not None:
+                    self._callback("span", {"name": span, "seconds": elapsed})
+        if result is None:
+            self._record_failure(NOT_COMPLEMENTARY, f"Literals {args[0]} and {args[1]} are not complementary")
+        return result
+
+    def _record_failure(self, cause: str, message: str):
+        """Count a failed call and notify the callback."""
+        self._stats.record_failure(cause)
+        if self._callback is not None:
+            self._callback("fail", {"cause": cause, "message": message})
 
     # UNIFY for Terms
     def unify(self, t1: Term, t2: Term, subst: Optional[Substitution] = None) -> Substitution:
-        """Main unification entry point for terms."""
+        """
+        Main unification entry point for terms.
+        Pending argument pairs live on an explicit work stack (processed depth-first, left to
+        right, like the textbook recursion), so arbitrarily deep terms never exhaust the call stack.
+        The substitution is applied lazily: each side is only dereferenced through variable
+        bindings, and whole terms are substituted once, when a variable gets bound.
+        """
+        if self._stats is not None:
+            return self._observe("unify", self._unify_entry, t1, t2, subst)
+        return self._unify_entry(t1, t2, subst)
+
+    def _unify_entry(self, t1: Term, t2: Term, subst: Optional[Substitution]) -> Substitution:
+        """Route a term problem through the cache when enabled."""
+        if self.cache is not None and (subst is None or subst.is_empty()):
+            return self._cached("term", t1, t2)
+        return self._unify(t1, t2, subst)
+
+    def _unify(self, t1: Term, t2: Term, subst: Optional[Substitution] = None) -> Substitution:
+        """Uncached term unification (see `unify`)."""
+        if self._union_find is not None:
+            return self._union_find.unify_pairs([(t1, t2)], subst)
+        return self._solve([(t1, t2)], subst)
+
+    def _solve(self, pairs: List[Tuple[Term, Term]], subst: Optional[Substitution]) -> Substitution:
+        """Recursive engine: solve the equations in `pairs` left to right, threading `subst`."""
         if subst is None:
             subst = Substitution()
 
-        # Always apply current substitution to both sides
-        t1 = subst.apply(t1)
-        t2 = subst.apply(t2)
+        stats = self._stats
+        # Pairs of compound terms already decomposed (by identity): without the occurs check,
+        # cyclic bindings would otherwise feed the same pairs back onto the stack forever
+        solved: Set[Tuple[int, int]] = set()
+        stack = list(reversed(pairs))
+        while stack:
+            t1, t2 = stack.pop()
+            if stats is not None:
+                stats.steps += 1
 
-        # Equal terms => done
-        if t1 == t2:
-            return subst
+            # Dereference bound variables; compound terms are left as they are
+            t1 = subst.dereference(t1)
+            t2 = subst.dereference(t2)
+
+            # Equal terms => done
+            if t1 == t2:
+                continue
 
-        # Case: Variable
-        if isinstance(t1, Variable):
-            return self._unify_var(t1, t2, subst)
-        if isinstance(t2, Variable):
-            return self._unify_var(t2, t1, subst)
+            # Case: Variable
+            if isinstance(t1, Variable):
+                subst = self._unify_var(t1, t2, subst, stack)
+                continue
+            if isinstance(t2, Variable):
+                subst = self._unify_var(t2, t1, subst, stack)
+                continue
 
-        # Case: Function or compound term
-        if isinstance(t1, Function) and isinstance(t2, Function):
-            if t1.name != t2.name or len(t1.arguments) != len(t2.arguments):
+            # Case: Function or compound term
+            if isinstance(t1, Function) and isinstance(t2, Function):
+                # Symbol ids encode name and arity, so one integer comparison checks both
+                if t1.symbol_id != t2.symbol_id:
+                    raise UnificationError(
+                        f"Cannot unify {_show(subst, t1)} and {_show(subst, t2)}: different function symbols or arity",
+                        cause=ARITY if t1.name == t2.name else CLASH
+                    )
+                key = (id(t1), id(t2))
+                if key in solved:
+                    continue
+                solved.add(key)
+                # 🔹 Arguments are pushed in reverse so the leftmost pair is solved first
+                stack.extend(reversed(list(zip(t1.arguments, t2.arguments))))
+                continue
+
+            # Otherwise → failure
+            raise UnificationError(f"Cannot unify {_show(subst, t1)} with {_show(subst, t2)}", cause=CLASH)
+
+        if self.occurs_check == DEFERRED:
+            cyclic = find_cycle(subst.mapping)
+            if cyclic is not None:
                 raise UnificationError(
-                    f"Cannot unify {t1} and {t2}: different function symbols or arity"
-                )
-
-            for a1, a2 in zip(t1.arguments, t2.arguments):
-                # 🔹 Propagate substitutions at each step
-                a1 = subst.apply(a1)
-                a2 = subst.apply(a2)
-                subst = self.unify(a1, a2, subst)
+                    f"Occurs check failed: variable '{cyclic}' occurs in its own binding", cause=OCCURS)
+        # Resolve binding chains once, so the MGU is idempotent like the union-find engine's
+        if self._stats is not None:
+            self._stats.applications += 1
+        try:
+            return subst.normalize()
+        except ValueError:
+            # Rational-tree bindings (occurs_check="never") have no idempotent form
             return subst
 
-        # Otherwise → failure
-        raise UnificationError(f"Cannot unify {t1} with {t2}")
-
     # UNIFY for Literals (with negation)
     def unify_literals(self, l1: Literal, l2: Literal, subst: Optional[Substitution] = None) -> Optional[Substitution]:
         """Unify two complementary literals."""
+        if self._stats is not None:
+            return self._observe("unify_literals", self._unify_literals_entry, l1, l2, subst)
+        return self._unify_literals_entry(l1, l2, subst)
+
+    def _unify_literals_entry(self, l1: Literal, l2: Literal, subst: Optional[Substitution]) -> Optional[Substitution]:
+        """Check complementarity, then route through the cache when enabled."""
         if subst is None:
             subst = Substitution()
 
         # Must be complementary
-        if l1.name != l2.name or len(l1.arguments) != len(l2.arguments):
+        if l1.symbol_id != l2.symbol_id:
             return None
         if l1.negated == l2.negated:
             return None
+        if self.cache is not None and subst.is_empty():
+            return self._cached("literal", l1, l2)
+        return self._unify_arguments(l1, l2, subst)
+
+    def _unify_arguments(self, l1: Literal, l2: Literal, subst: Substitution) -> Substitution:
+        """Unify the arguments of two literals pairwise, threading `subst`."""
+        if self._union_find is not None:
+            return self._union_find.unify_pairs(zip(l1.arguments, l2.arguments), subst)
+        return self._solve(list(zip(l1.arguments, l2.arguments)), subst)
+
+    def _cached(self, kind: str, e1: Union[Term, Literal], e2: Union[Term, Literal]) -> Substitution:
+        """
+        Answer a unification problem from the cache. Problems are keyed on variable-renamed
+        (canonical) inputs, so `f(x, y)` vs `f(A, z)` and `f(u, v)` vs `f(A, w)` share an entry;
+        cached MGUs and failure messages are renamed back to the caller's variables.
+        """
+        mapping = canonical_names(e1, e2)
+        c1, c2 = e1.rename_variables(mapping), e2.rename_variables(mapping)
+        key = (kind, c1, c2)
+        outcome = self.cache.get(key)
+        if outcome is None:
+            try:
+                if kind == "term":
+                    result = self._unify(c1, c2)
+                else:
+                    result = self._unify_arguments(c1, c2, Substitution())
+            except UnificationError as error:
+                result = error
+            outcome = store_outcome(result)
+            self.cache.put(key, outcome)
+        return restore_outcome(outcome, mapping)
+
+    # One-way matching
+    def match(self, pattern: Matchable, instance: Matchable,
+              subst: Optional[Substitution] = None) -> Optional[Substitution]:
+        """Match `pattern` against `instance` without binding instance variables (see `matching.match`)."""
+        result = match(pattern, instance, subst)
+        if self.verbose:
+            self.debug(f"Match {pattern} against {instance}: {result if result is not None else 'no match'}")
+        return result
+
+    # Batch unification
+    def unify_pair(self, e1: Expression, e2: Expression) -> UnifyOutcome:
+        """
+        Unify two terms or two complementary literals and return the outcome as a value:
+        the MGU on success, otherwise the `UnificationError` describing the failure.
+        String operands are parsed with `ParserAIMA.parse_expression` first.
+        """
+        try:
+            if isinstance(e1, str):
+                e1 = ParserAIMA.parse_expression(e1)
+            if isinstance(e2, str):
+                e2 = ParserAIMA.parse_expression(e2)
+            if isinstance(e1, Literal) and isinstance(e2, Literal):
+                result = self.unify_literals(e1, e2)
+                if result is None:
+                    return UnificationError(f"Literals {e1} and {e2} are not complementary")
+                return result
+            if isinstance(e1, Literal) or isinstance(e2, Literal):
+                return UnificationError(f"Cannot unify a term with a literal: {e1}, {e2}")
+            return self.unify(e1, e2)
+        except UnificationError as ue:
+            return ue
+        except ValueError as ve:
+            return UnificationError(str(ve))
+
+    def unify_many(self, pairs: Iterable[Tuple[Expression, Expression]], workers: Optional[int] = None,
+                   chunk_size: int = 1000) -> List[UnifyOutcome]:
+        """
+        Unify every pair in `pairs`, fanning chunks out to a process pool of `workers` processes
+        (default: one per CPU). Returns MGUs or `UnificationError`s in input order.
+        """
+        return list(self.iter_unify_many(pairs, workers, chunk_size))
+
+    def iter_unify_many(self, pairs: Iterable[Tuple[Expression, Expression]], workers: Optional[int] = None,
+                        chunk_size: int = 1000) -> Iterator[UnifyOutcome]:
+        """
+        Lazy variant of `unify_many` that yields outcomes in input order as chunks complete.
+        In-process chunks run on this unifier (its cache, instrumentation and verbosity apply);
+        worker processes use a fresh unifier with the same engine and occurs check policy.
+        """
+        return ordered_chunk_map(partial(_unify_chunk, self.engine, self.occurs_check), pairs, workers, chunk_size,
+                                 local=self._unify_chunk_locally)
 
-        # Unify all arguments
-        for a1, a2 in zip(l1.arguments, l2.arguments):
-            a1 = subst.apply(a1)
-            a2 = subst.apply(a2)
-            subst = self.unify(a1, a2, subst)
-        return subst
+    def _unify_chunk_locally(self, pairs: List[Tuple[Expression, Expression]]) -> List[UnifyOutcome]:
+        """Unify one chunk of pairs in the calling process."""
+        return [self.unify_pair(e1, e2) for e1, e2 in pairs]
 
     # Variable handling and occurs check
-    def _unify_var(self, var: Variable, term: Term, subst: Substitution) -> Substitution:
-        """Handle variable unification cases."""
+    def _unify_var(self, var: Variable, term: Term, subst: Substitution, stack: list) -> Substitution:
+        """Handle variable unification cases; pairs that need further work are pushed onto `stack`."""
         if subst.contains(var.name):
-            return self.unify(subst.get(var.name), term, subst)
+            stack.append((subst.get(var.name), term))
+            return subst
         if isinstance(term, Variable) and subst.contains(term.name):
-            return self.unify(var, subst.get(term.name), subst)
+            stack.append((var, subst.get(term.name)))
+            return subst
+
+        # Important: apply substitution to term before extending (and before the occurs check,
+        # since bindings are only dereferenced lazily); unchanged subterms are shared
+        if self._stats is not None:
+            self._stats.applications += 1
+        try:
+            term = subst.apply(term)
+        except ValueError:
+            if self.occurs_check in (ALWAYS, INCREMENTAL):
+                raise
+            # Unchecked policies may already hold cyclic bindings: bind the term as it is
 
         # Occurs check (prevent infinite recursion)
         if self._occurs_check(var, term):
             raise UnificationError(
-                f"Occurs check failed: variable '{var}' occurs in term '{term}'"
+                f"Occurs check failed: variable '{var}' occurs in term '{term}'", cause=OCCURS
             )
 
-        # Important: apply substitution to term before extending
-        term = subst.apply(term)
+        if self._stats is not None:
+            self._stats.bindings += 1
+            if self._callback is not None:
+                self._callback("bind", {"var": var.name, "term": term})
         return subst.extend(var.name, term)
 
     def _occurs_check(self, var: Variable, term: Term) -> bool:
-        """Check if variable occurs in term (prevents self-reference)."""
-        return term.occurs(var.name)
+        """Check if variable occurs in term (prevents self-reference), as the policy dictates."""
+        policy = self.occurs_check
+        if policy == INCREMENTAL:
+            return occurs_incremental(var, term, self._stats)
+        if policy == ALWAYS:
+            return occurs(var, term, self._stats)
+        return False
 
     # Utility and debugging
     def debug(self, msg: str):
         """Print a debug message when verbose mode is enabled."""
         if self.verbose:
-            Printer.print_text_color("cyan", msg)
+            Printer.print_text_color(msg, "cyan")
+
+
+def _show(subst: Substitution, term: Term) -> Term:
+    """Return `term` under `subst` for error messages, or as it is when the bindings are cyclic."""
+    try:
+        return subst.apply(term)
+    except ValueError:
+        return term
+
+
+def _unify_chunk(engine: str, occurs_check: str, pairs: List[Tuple[Expression, Expression]]) -> List[UnifyOutcome]:
+    """Worker entry point for `Unifier.unify_many`: unify one chunk of pairs in a fresh unifier."""
+    unifier = Unifier(engine=engine, occurs_check=occurs_check)
+    return [unifier.unify_pair(e1, e2) for e1, e2 in pairs]
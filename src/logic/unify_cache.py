@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+from src.logic.substitution import Substitution
+from src.models.errors import UnificationError
+from src.models.literal import Literal
+from src.models.term import Term
+
+# Cached outcome: (True, ((var, term), ...)) for an MGU, (False, (message, cause)) for a failure
+Outcome = Tuple[bool, object]
+
+# Canonical variables are `_0`, `_1`, ...: the parser never produces names starting with `_`
+_CANONICAL = re.compile(r"(?<!\w)_\d+(?!\w)")
+
+
+class UnificationCache:
+    """
+    Bounded least-recently-used map from canonical unification problems to their outcomes.
+
+    `hits`, `misses` and `evictions` count lookups that were answered, lookups that were not,
+    and entries dropped to stay within `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Create an empty cache holding at most `maxsize` entries."""
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Outcome] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Outcome]:
+        """Return the cached outcome for `key` (marking it most recently used), or None."""
+        outcome = self._entries.get(key)
+        if outcome is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return outcome
+
+    def put(self, key: Hashable, outcome: Outcome):
+        """Store `outcome`, evicting the least recently used entry when full."""
+        self._entries[key] = outcome
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        """Return the number of cached outcomes."""
+        return len(self._entries)
+
+
+def canonical_names(*items: Union[Term, Literal]) -> Dict[str, str]:
+    """Map each variable of `items` to `_0`, `_1`, ... in order of first occurrence."""
+    mapping: Dict[str, str] = {}
+    for item in items:
+        for name in item.variables():
+            if name not in mapping:
+                mapping[name] = f"_{len(mapping)}"
+    return mapping
+
+
+def store_outcome(result: Union[Substitution, UnificationError]) -> Outcome:
+    """Convert an MGU or a failure on canonical inputs into a cacheable outcome."""
+    if isinstance(result, UnificationError):
+        return False, (result.message, result.cause)
+    return True, tuple(result.mapping.items())
+
+
+def restore_outcome(outcome: Outcome, mapping: Dict[str, str]) -> Substitution:
+    """
+    Rename a cached outcome back to the caller's variables (`mapping` goes caller -> canonical):
+    return the MGU, or raise the cached `UnificationError` with the caller's names.
+    """
+    inverse = {canonical: name for name, canonical in mapping.items()}
+    ok, payload = outcome
+    if not ok:
+        message, cause = payload
+        raise UnificationError(_CANONICAL.sub(lambda m: inverse.get(m.group(0), m.group(0)), message), cause=cause)
+    return Substitution({inverse.get(var, var): term.rename_variables(inverse) for var, term in payload})
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.logic.instrumentation import ARITY, CLASH, OCCURS, EventCallback, UnifyStats
+from src.logic.occurs_check import ALWAYS, DEFERRED, INCREMENTAL, find_cycle, occurs_incremental
+from src.logic.substitution import Substitution
+from src.models.errors import UnificationError
+from src.models.term import Function, Term, Variable, _variable_bit
+
+
+class UnionFindEngine:
+    """
+    Unification backend that binds variables in place using union-find with path compression.
+
+    Unlike the recursive engine, the working substitution is never applied to whole terms:
+    variables are dereferenced on demand through the `parent` table and the final
+    `Substitution` is built once, after every constraint has been solved.
+    Variable-to-variable bindings keep the recursive engine's direction (left to right),
+    so both engines return the same most general unifier.
+
+    `occurs_check` is a policy from `occurs_check.POLICIES` (see `Unifier`).
+    `stats` / `callback` are set by `Unifier.instrument`; both stay None otherwise.
+    """
+
+    def __init__(self, occurs_check: str = INCREMENTAL):
+        """Create an uninstrumented engine using the given occurs-check policy."""
+        self.occurs_check = occurs_check
+        self.stats: Optional[UnifyStats] = None
+        self.callback: Optional[EventCallback] = None
+        self._bound_mask = 0  # union of the variable masks of every bound variable
+
+    def unify_pairs(self, pairs: Iterable[Tuple[Term, Term]],
+                    subst: Optional[Substitution] = None) -> Substitution:
+        """Solve every `(t1, t2)` equation simultaneously and return the resulting MGU."""
+        parent: Dict[str, Term] = {}
+        order: List[str] = []
+        self._bound_mask = 0
+        if subst is not None:
+            for var_name, term in subst.mapping.items():
+                parent[var_name] = term
+                order.append(var_name)
+                self._bound_mask |= _variable_bit(var_name)
+
+        # Pairs of compound nodes that were already decomposed; terms are immutable,
+        # so unifying the same two objects twice can never add new information.
+        solved: Set[Tuple[int, int]] = set()
+        stack = list(pairs)
+        stack.reverse()
+        stats = self.stats
+
+        while stack:
+            t1, t2 = stack.pop()
+            if stats is not None:
+                stats.steps += 1
+            t1 = self._find(t1, parent)
+            t2 = self._find(t2, parent)
+            if t1 is t2:
+                continue
+
+            # Case: Variable
+            if isinstance(t1, Variable):
+                if isinstance(t2, Variable) and t1.name == t2.name:
+                    continue
+                self._bind(t1, t2, parent, order)
+                continue
+            if isinstance(t2, Variable):
+                self._bind(t2, t1, parent, order)
+                continue
+
+            # Case: Function or compound term
+            if isinstance(t1, Function) and isinstance(t2, Function):
+                if t1.symbol_id != t2.symbol_id:
+                    raise UnificationError(
+                        f"Cannot unify {self._resolve(t1, parent)} and {self._resolve(t2, parent)}: "
+                        f"different function symbols or arity",
+                        cause=ARITY if t1.name == t2.name else CLASH
+                    )
+                key = (id(t1), id(t2))
+                if key in solved:
+                    continue
+                solved.add(key)
+                for a1, a2 in reversed(list(zip(t1.arguments, t2.arguments))):
+                    stack.append((a1, a2))
+                continue
+
+            # Constants (or constant vs function)
+            if t1 == t2:
+                continue
+            raise UnificationError(
+                f"Cannot unify {self._resolve(t1, parent)} with {self._resolve(t2, parent)}", cause=CLASH)
+
+        if self.occurs_check == DEFERRED:
+            cyclic = find_cycle(parent)
+            if cyclic is not None:
+                raise UnificationError(
+                    f"Occurs check failed: variable '{cyclic}' occurs in its own binding", cause=OCCURS)
+        cache: Dict[int, Term] = {}
+        return Substitution({name: self._resolve(parent[name], parent, cache) for name in order})
+
+    # Union-find primitives
+    @staticmethod
+    def _find(term: Term, parent: Dict[str, Term]) -> Term:
+        """Return the representative of `term`, compressing the variable chain on the way."""
+        if not isinstance(term, Variable) or term.name not in parent:
+            return term
+        path = []
+        while isinstance(term, Variable) and term.name in parent:
+            path.append(term.name)
+            term = parent[term.name]
+        for name in path[:-1]:
+            parent[name] = term
+        return term
+
+    def _bind(self, var: Variable, term: Term, parent: Dict[str, Term], order: List[str]):
+        """Point the (unbound) variable `var` at `term` after the occurs check."""
+        if isinstance(term, Function) and self.occurs_check in (ALWAYS, INCREMENTAL) \
+                and self._occurs(var, term, parent):
+            raise UnificationError(
+                f"Occurs check failed: variable '{var}' occurs in term '{self._resolve(term, parent)}'",
+                cause=OCCURS
+            )
+        parent[var.name] = term
+        order.append(var.name)
+        self._bound_mask |= var.variable_mask
+        if self.stats is not None:
+            self.stats.bindings += 1
+            if self.callback is not None:
+                self.callback("bind", {"var": var.name, "term": term})
+
+    def _occurs(self, var: Variable, term: Term, parent: Dict[str, Term]) -> bool:
+        """Return True if `var` occurs in `term` once bound variables are dereferenced."""
+        if self.occurs_check == INCREMENTAL:
+            return occurs_incremental(var, term, self.stats, lambda node: self._find(node, parent), self._bound_mask)
+        visited: Set[int] = set()
+        stack = [term]
+        if self.stats is not None:
+            self.stats.occurs_checks += 1
+        while stack:
+            node = self._find(stack.pop(), parent)
+            if self.stats is not None:
+                self.stats.occurs_nodes += 1
+            if isinstance(node, Variable):
+                if node.name == var.name:
+                    return True
+            elif isinstance(node, Function) and not node.ground and id(node) not in visited:
+                visited.add(id(node))
+                stack.extend(node.arguments)
+        return False
+
+    def _resolve(self, term: Term, parent: Dict[str, Term],
+                 cache: Optional[Dict[int, Term]] = None) -> Term:
+        """
+        Return `term` with every bound variable replaced by its fully resolved value (no recursion).
+        Ground and unchanged subterms are shared. A variable whose value contains the subterm being
+        resolved (only possible without the occurs check) is left in place, so the rational tree
+        x = f(x) comes back as the binding x / f(x) instead of looping.
+        """
+        if cache is None:
+            cache = {}
+        if self.stats is not None:
+            self.stats.applications += 1
+        root = self._find(term, parent)
+        expanding: Set[int] = set()
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not isinstance(node, Function) or (not expanded and (id(node) in cache or id(node) in expanding)):
+                continue
+            if node.ground:
+                cache[id(node)] = node
+                continue
+            if not expanded:
+                expanding.add(id(node))
+                stack.append((node, True))
+                for arg in node.arguments:
+                    target = self._find(arg, parent)
+                    if isinstance(target, Function) and id(target) not in cache and id(target) not in expanding:
+                        stack.append((target, False))
+                continue
+            args = []
+            for arg in node.arguments:
+                target = self._find(arg, parent)
+                if isinstance(target, Function):
+                    # Missing from the cache only while still being expanded: a cycle through `arg`
+                    target = cache.get(id(target), arg)
+                args.append(target)
+            expanding.discard(id(node))
+            changed = any(new is not old for new, old in zip(args, node.arguments))
+            cache[id(node)] = Function(node.name, args) if changed else node
+        return cache[id(root)] if isinstance(root, Function) else root
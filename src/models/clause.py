@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from src.models.literal import Literal
+
+_RENAMED_SUFFIX = re.compile(r"_\d+$")
+
+
+class Clause:
+    """
+    Disjunction of literals treated as a set: duplicates are dropped, order is kept for display.
+
+    Clauses are immutable and hashable (equality ignores literal order). The empty clause
+    (□) denotes a contradiction.
+    """
+
+    __slots__ = ("literals", "_key", "_weight")
+
+    def __init__(self, literals: Iterable[Literal] = ()):
+        """Create a clause from literals; repeated literals are merged."""
+        unique = tuple(dict.fromkeys(literals))
+        object.__setattr__(self, "literals", unique)
+        object.__setattr__(self, "_key", frozenset(unique))
+        object.__setattr__(self, "_weight", sum(lit.size for lit in unique))
+
+    def __setattr__(self, name, value):
+        """Clauses are immutable."""
+        raise AttributeError("Clause is immutable")
+
+    def __reduce__(self):
+        """Pickle through the literal tuple."""
+        return Clause, (self.literals,)
+
+    # Basic accessors
+    @property
+    def weight(self) -> int:
+        """Number of symbols in the clause, used for clause selection."""
+        return self._weight
+
+    def is_empty(self) -> bool:
+        """Return True for the empty clause □."""
+        return not self.literals
+
+    def is_tautology(self) -> bool:
+        """Return True if the clause contains a literal and its exact complement."""
+        return any(lit.negate() in self._key for lit in self.literals if not lit.negated)
+
+    def variables(self) -> List[str]:
+        """Return the distinct variable names in order of first occurrence."""
+        seen: Dict[str, None] = {}
+        for lit in self.literals:
+            for name in lit.variables():
+                seen.setdefault(name)
+        return list(seen)
+
+    def __len__(self) -> int:
+        """Return the number of literals."""
+        return len(self.literals)
+
+    def __iter__(self):
+        """Iterate over the literals in insertion order."""
+        return iter(self.literals)
+
+    # Transformations
+    def apply_substitution(self, substitution: 'Substitution') -> Clause:
+        """Apply `substitution` to every literal."""
+        return Clause(lit.apply_substitution(substitution) for lit in self.literals)
+
+    def without(self, *removed: Literal) -> Clause:
+        """Return the clause minus the given literals."""
+        return Clause(lit for lit in self.literals if lit not in removed)
+
+    def rename_apart(self, suffix: int) -> Clause:
+        """
+        Standardize apart: rename every variable `v` to `v_<suffix>` (dropping any previous
+        numeric suffix), so the clause shares no variables with clauses renamed differently.
+        """
+        names = self.variables()
+        if not names:
+            return self
+        bases = [_RENAMED_SUFFIX.sub("", name) for name in names]
+        if len(set(bases)) < len(bases):
+            # Stripping would merge distinct variables (e.g. `x` and `x_1`): keep full names
+            bases = names
+        mapping = {name: f"{base}_{suffix}" for name, base in zip(names, bases)}
+        return Clause(lit.rename_variables(mapping) for lit in self.literals)
+
+    def variant_key(self) -> Tuple[FrozenSet[str], int]:
+        """
+        Return a key shared by clauses that differ only by variable names (best effort):
+        literals are ordered by their variable-blind text and variables numbered by first occurrence.
+        """
+        blind = sorted(self.literals, key=lambda lit: _VARIABLE_BLIND.sub("_", str(lit)))
+        mapping: Dict[str, str] = {}
+        for lit in blind:
+            for name in lit.variables():
+                mapping.setdefault(name, f"v{len(mapping)}")
+        return frozenset(str(lit.rename_variables(mapping)) for lit in blind), len(blind)
+
+    # Equality and display
+    def __eq__(self, other) -> bool:
+        """Clauses are equal when they contain the same literals."""
+        if not isinstance(other, Clause):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        """Hash of the literal set."""
+        return hash(self._key)
+
+    def __str__(self) -> str:
+        """Return `L1 ∨ L2 ∨ ...`, or `□` for the empty clause."""
+        if not self.literals:
+            return "□"
+        return " ∨ ".join(str(lit) for lit in self.literals)
+
+    def __repr__(self):
+        """Return developer-friendly representation identical to `__str__`."""
+        return str(self)
+
+
+# Lowercase identifiers not followed by "(" are variables in AIMA notation
+_VARIABLE_BLIND = re.compile(r"\b[a-z]\w*\b(?!\()")
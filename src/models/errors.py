@@ -1,15 +1,20 @@
+from __future__ import annotations
+
+
 class UnificationError(Exception):
     """Exception capturing the reason and optional offending terms when unification cannot proceed."""
 
-    def __init__(self, message: str, t1=None, t2=None):
+    def __init__(self, message: str, t1=None, t2=None, cause: str | None = None):
         """
         Parameters:
         - message: custom error message
         - t1, t2: optional terms involved in the unification failure
+        - cause: optional failure category ("clash", "arity", "occurs", ...) used by instrumentation
         """
         self.message = message
         self.t1 = t1
         self.t2 = t2
+        self.cause = cause
         super().__init__(self.message)
 
     def __str__(self):
@@ -26,3 +31,28 @@ class InputError(Exception):
     def __init__(self, message="Error in input handling"):
         """Initialize input error with a helpful message."""
         super().__init__(message)
+
+
+class ParseError(ValueError):
+    """Exception raised when text cannot be parsed; carries the character offset of the problem."""
+
+    def __init__(self, message: str, text: str = "", position: int | None = None):
+        """
+        Parameters:
+        - message: description of what was expected or found
+        - text: the full input being parsed
+        - position: 0-based character offset of the offending token (None if unknown)
+        """
+        self.message = message
+        self.text = text
+        self.position = position
+        super().__init__(str(self))
+
+    def __str__(self):
+        """Return the message followed by the offset and the input."""
+        base = self.message
+        if self.position is not None:
+            base += f" at offset {self.position}"
+        if self.text:
+            base += f" in '{self.text}'"
+        return base
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from array import array
+from typing import List, Tuple
+
+from src.models.symbols import CONSTANT, FUNCTION, SYMBOLS, VARIABLE, SymbolTable
+from src.models.term import Constant, Function, Term, Variable
+from src.models.term_store import TERMS
+
+
+class FlatTerm:
+    """
+    Preorder ("flatterm") encoding of a term in two contiguous integer arrays.
+
+    `symbols[i]` is the symbol id (see `SymbolTable`) at preorder position i and `skips[i]` is
+    the position right after the subterm rooted at i, so a whole subterm is skipped in O(1).
+    Each symbol costs 8 bytes instead of a Python object per node, and equal terms have
+    equal arrays. Ids belong to `table`; pickling rebuilds the arrays in the target process.
+    Variables only get ids when a flatterm is encoded (`Variable` itself is not interned), so
+    pass a private `table` to keep short-lived variable names out of `SYMBOLS`.
+    """
+
+    __slots__ = ("symbols", "skips", "table")
+
+    def __init__(self, symbols: array, skips: array, table: SymbolTable = SYMBOLS):
+        """Wrap already-encoded arrays; use `FlatTerm.from_term` to encode a `Term`."""
+        self.symbols = symbols
+        self.skips = skips
+        self.table = table
+
+    @classmethod
+    def from_term(cls, term: Term, table: SymbolTable = SYMBOLS) -> FlatTerm:
+        """Encode `term` in preorder, without recursion."""
+        symbols = array("i")
+        skips = array("i")
+        open_nodes: List[Tuple[int, int]] = []   # (position of an open function, subterms still to emit)
+        shared = table is SYMBOLS   # constants and functions already carry their global symbol ids
+        pending = [term]
+        while pending:
+            node = pending.pop()
+            position = len(symbols)
+            skips.append(position + 1)
+            compound = isinstance(node, Function) and node.arguments
+            if isinstance(node, Variable):
+                symbols.append(table.intern(node.name, VARIABLE))
+            elif shared:
+                symbols.append(node.symbol_id)
+            elif isinstance(node, Function):
+                symbols.append(table.intern(node.name, FUNCTION, len(node.arguments)))
+            else:
+                symbols.append(table.intern(node.symbol, CONSTANT))
+            if compound:
+                open_nodes.append((position, len(node.arguments)))
+                pending.extend(reversed(node.arguments))
+                continue
+            # Close every function whose last subterm has just been emitted
+            while open_nodes:
+                parent, remaining = open_nodes[-1]
+                if remaining > 1:
+                    open_nodes[-1] = (parent, remaining - 1)
+                    break
+                open_nodes.pop()
+                skips[parent] = position + 1
+        return cls(symbols, skips, table)
+
+    @classmethod
+    def from_symbols(cls, symbols: array, table: SymbolTable = SYMBOLS) -> FlatTerm:
+        """Build a flatterm from a preorder symbol array, computing its skip pointers."""
+        arities = table.arities
+        skips = array("i", bytes(4 * len(symbols)))
+        for i in range(len(symbols) - 1, -1, -1):
+            end = i + 1
+            for _ in range(arities[symbols[i]]):
+                end = skips[end]
+            skips[i] = end
+        return cls(symbols, skips, table)
+
+    def __reduce__(self):
+        """Pickle through the `Term` form: symbol ids differ between processes."""
+        return _rebuild, (self.to_term(),)
+
+    def to_term(self) -> Term:
+        """Decode into (hash-consed) `Term` objects, without recursion."""
+        names, kinds, arities = self.table.names, self.table.kinds, self.table.arities
+        built: List[Term] = []
+        # Reverse preorder: the children of a node are on top of the stack, first child last pushed
+        for symbol in reversed(self.symbols):
+            kind = kinds[symbol]
+            if kind == VARIABLE:
+                built.append(TERMS.variable(names[symbol]))
+            elif kind == CONSTANT:
+                built.append(TERMS.constant(names[symbol]))
+            else:
+                arity = arities[symbol]
+                args = built[len(built) - arity:]
+                del built[len(built) - arity:]
+                args.reverse()
+                built.append(TERMS.function(names[symbol], args))
+        return built[0]
+
+    # Queries
+    def subterm(self, position: int) -> FlatTerm:
+        """Return the subterm rooted at `position` as a new flatterm."""
+        end = self.skips[position]
+        if position == 0 and end == len(self.symbols):
+            return self
+        return FlatTerm(self.symbols[position:end], array("i", (s - position for s in self.skips[position:end])),
+                        self.table)
+
+    def occurs(self, var_name: str) -> bool:
+        """Return True if the variable `var_name` occurs in the term (a single array scan)."""
+        var_id = self.table.lookup(var_name, VARIABLE)
+        return var_id is not None and var_id in self.symbols
+
+    @property
+    def ground(self) -> bool:
+        """Return True if the term contains no variables."""
+        kinds = self.table.kinds
+        return all(kinds[symbol] != VARIABLE for symbol in self.symbols)
+
+    def __len__(self) -> int:
+        """Return the number of symbols."""
+        return len(self.symbols)
+
+    def __eq__(self, other) -> bool:
+        """Flatterms over the same table are equal when their symbol arrays are."""
+        if not isinstance(other, FlatTerm):
+            return NotImplemented
+        return self.table is other.table and self.symbols == other.symbols
+
+    def __hash__(self) -> int:
+        """Hash of the symbol array."""
+        return hash(self.symbols.tobytes())
+
+    def __str__(self) -> str:
+        """Return the same text as the decoded `Term`."""
+        return str(self.to_term())
+
+    def __repr__(self):
+        """Return developer-friendly representation identical to `__str__`."""
+        return str(self)
+
+
+def _rebuild(term: Term) -> FlatTerm:
+    """Unpickling helper: re-encode with the receiving process's global table."""
+    return FlatTerm.from_term(term)
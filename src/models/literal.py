@@ -2,19 +2,30 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Sequence
 
+from src.models.symbols import PREDICATE, SYMBOLS
 from src.models.term import Term
 
 
 @dataclass(frozen=True)
 class Literal:
-    """Predicate symbol applied to ordered arguments with an optional negation flag, per AIMA notation."""
+    """
+    Predicate symbol applied to ordered arguments with an optional negation flag, per AIMA notation.
+
+    The predicate is interned in `SYMBOLS`; `symbol_id` identifies its name and arity.
+    """
 
     name: str
-    arguments: List[Term]
+    arguments: Sequence[Term]
     negated: bool = False
 
+    def __post_init__(self):
+        """Freeze the arguments into a tuple (so literals are hashable) and intern the predicate."""
+        args = tuple(self.arguments)
+        symbol_id = SYMBOLS.intern(self.name, PREDICATE, len(args))
+        self.__dict__.update(name=SYMBOLS.names[symbol_id], arguments=args, symbol_id=symbol_id)
+
     @staticmethod
     def from_string(text: str) -> Literal:
         """
@@ -44,18 +55,33 @@ class Literal:
 
     def is_complementary(self, other: Literal) -> bool:
         """Check if this literal and another are complementary (P vs ¬P)."""
-        return (
-            self.name == other.name
-            and len(self.arguments) == len(other.arguments)
-            and self.negated != other.negated
-        )
+        return self.symbol_id == other.symbol_id and self.negated != other.negated
 
     def apply_substitution(self, substitution: 'Substitution') -> Literal:
-        """Apply substitution to each argument term."""
+        """Apply substitution to each argument term; the literal itself is returned when nothing changes."""
         new_args = [arg.apply_substitution(
             substitution) for arg in self.arguments]
+        if all(new is old for new, old in zip(new_args, self.arguments)):
+            return self
         return Literal(self.name, new_args, self.negated)
 
+    def variables(self) -> List[str]:
+        """Return the distinct variable names in left-to-right order of first occurrence."""
+        seen: Dict[str, None] = {}
+        for arg in self.arguments:
+            for name in arg.variables():
+                seen.setdefault(name)
+        return list(seen)
+
+    def rename_variables(self, mapping: Dict[str, str]) -> Literal:
+        """Rename variables simultaneously according to `mapping` (see `Term.rename_variables`)."""
+        return Literal(self.name, [arg.rename_variables(mapping) for arg in self.arguments], self.negated)
+
+    @property
+    def size(self) -> int:
+        """Number of symbols in the literal (predicate plus argument symbols)."""
+        return 1 + sum(arg.size for arg in self.arguments)
+
     def equals(self, other: Literal) -> bool:
         """Check equality of name, negation and arguments."""
         return (
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from src.models.clause import Clause
+from src.models.literal import Literal
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    Definite (Horn) clause `body₁ ∧ ... ∧ bodyₙ ⇒ head` with positive literals only;
+    a fact is a rule with an empty body.
+    """
+
+    head: Literal
+    body: Sequence[Literal] = ()
+
+    def __post_init__(self):
+        """Freeze the body into a tuple and reject negated literals."""
+        body = tuple(self.body)
+        for lit in (self.head, *body):
+            if lit.negated:
+                raise ValueError(f"Definite clauses only contain positive literals: {lit}")
+        self.__dict__["body"] = body
+
+    @property
+    def is_fact(self) -> bool:
+        """Return True when the body is empty."""
+        return not self.body
+
+    def variables(self) -> List[str]:
+        """Return the distinct variable names, head first, in order of first occurrence."""
+        seen: Dict[str, None] = {}
+        for lit in (self.head, *self.body):
+            for name in lit.variables():
+                seen.setdefault(name)
+        return list(seen)
+
+    def to_clause(self) -> Clause:
+        """Return the equivalent disjunction `¬body₁ ∨ ... ∨ ¬bodyₙ ∨ head` (for `ResolutionProver`)."""
+        return Clause([lit.negate() for lit in self.body] + [self.head])
+
+    def __str__(self) -> str:
+        """Return `B1 ∧ B2 ⇒ H`, or just `H` for a fact."""
+        if not self.body:
+            return str(self.head)
+        return " ∧ ".join(str(lit) for lit in self.body) + " ⇒ " + str(self.head)
+
+    def __repr__(self):
+        """Return developer-friendly representation identical to `__str__`."""
+        return str(self)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Symbol kinds
+VARIABLE = 0
+CONSTANT = 1
+FUNCTION = 2
+PREDICATE = 3
+
+KIND_NAMES = ("variable", "constant", "function", "predicate")
+
+
+class SymbolTable:
+    """
+    Bidirectional map between symbols and small integer ids.
+
+    A symbol is identified by its kind, name and arity, so `f/1` and `f/2` get different ids
+    and comparing two ids checks name, kind and arity at once. Ids are dense (0, 1, 2, ...)
+    and are only meaningful inside the process that assigned them.
+    """
+
+    def __init__(self):
+        """Create an empty table."""
+        # One dict per kind: keyed by name for variables and constants, by (name, arity) otherwise
+        self._ids: Tuple[Dict[Hashable, int], ...] = ({}, {}, {}, {})
+        self.names: List[Any] = []
+        self.kinds: List[int] = []
+        self.arities: List[int] = []
+
+    def intern(self, name: Hashable, kind: int, arity: int = 0) -> int:
+        """Return the id of the symbol, registering it on first use."""
+        key = (name, arity) if kind >= FUNCTION else name
+        ids = self._ids[kind]
+        symbol_id = ids.get(key)
+        if symbol_id is None:
+            symbol_id = ids[key] = len(self.names)
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.arities.append(arity)
+        return symbol_id
+
+    def lookup(self, name: Hashable, kind: int, arity: int = 0) -> Optional[int]:
+        """Return the id of the symbol, or None if it was never interned."""
+        return self._ids[kind].get((name, arity) if kind >= FUNCTION else name)
+
+    def name(self, symbol_id: int) -> Any:
+        """Return the name of a symbol id."""
+        return self.names[symbol_id]
+
+    def kind(self, symbol_id: int) -> int:
+        """Return the kind (VARIABLE, CONSTANT, FUNCTION or PREDICATE) of a symbol id."""
+        return self.kinds[symbol_id]
+
+    def arity(self, symbol_id: int) -> int:
+        """Return the arity of a symbol id."""
+        return self.arities[symbol_id]
+
+    def __len__(self) -> int:
+        """Return the number of interned symbols."""
+        return len(self.names)
+
+
+# Process-wide table shared by the flat encodings
+SYMBOLS = SymbolTable()
@@ -1,21 +1,104 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, Dict, List, Sequence
+
+from src.models.symbols import CONSTANT, FUNCTION, SYMBOLS
+
+# `symbol_id` of every variable: variables are not interned (see `Term`)
+VARIABLE_ID = -1
 
 
 class Term:
-    """Abstract base for every syntactic term (variable, constant, or function) handled by the unifier."""
+    """
+    Abstract base for every syntactic term (variable, constant, or function) handled by the unifier.
+
+    Every concrete term caches its hash, `size` (number of symbols), `depth` and `ground`
+    flag at construction time, so these queries are O(1) and terms can be used as dict keys.
+    `variable_mask` folds the variables inside the term into 64 bits (bit `hash(name) % 64` per
+    variable): a clear bit proves the variable is absent, which lets occurs checks skip subterms.
+    Constant and function symbols are interned in the global `SYMBOLS` table: `symbol_id`
+    identifies kind, name and arity at once, and the name string is shared by every term using
+    that symbol. Variables are not interned, since renaming apart keeps creating fresh names
+    that the table would never release; their `symbol_id` is `VARIABLE_ID`.
+    """
+
+    # Cached structural metadata, filled in by each subclass on construction
+    symbol_id: int
+    _hash: int
+    size: int
+    depth: int
+    ground: bool
+    variable_mask: int
+
+    def __eq__(self, other) -> bool:
+        """Identity fast path (hash-consed terms), then cached-hash rejection, then structure."""
+        if self is other:
+            return True
+        if type(self) is not type(other) or self._hash != other._hash:
+            return False
+        return self._same_structure(other)
+
+    def __hash__(self) -> int:
+        """Return the hash cached at construction time."""
+        return self._hash
+
+    def _same_structure(self, other: 'Term') -> bool:
+        """Compare with a term of the same type and hash, field by field."""
+        raise NotImplementedError
 
     def occurs(self, var_name: str) -> bool:
         """Return True if the variable `var_name` occurs anywhere inside the term."""
         raise NotImplementedError
 
     def apply_substitution(self, substitution: 'Substitution') -> 'Term':
-        """Return a copy of the term with `substitution` applied recursively."""
+        """
+        Return the term with `substitution` applied recursively. Subterms without bound
+        variables are shared, and the term itself is returned when nothing changes.
+        """
         raise NotImplementedError
 
+    def variables(self) -> List[str]:
+        """Return the distinct variable names in left-to-right order of first occurrence."""
+        seen: Dict[str, None] = {}
+        stack: List[Term] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Variable):
+                seen.setdefault(node.name)
+            elif isinstance(node, Function) and not node.ground:
+                stack.extend(reversed(node.arguments))
+        return list(seen)
+
+    def rename_variables(self, mapping: Dict[str, str]) -> 'Term':
+        """
+        Rename variables simultaneously in one step ({x -> y, y -> x} swaps them), unlike
+        `apply_substitution`, which keeps applying bindings until a fixpoint is reached.
+        Subterms without renamed variables are shared with the original term.
+        """
+        results: Dict[int, Term] = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            key = id(node)
+            if not expanded and key in results:
+                continue
+            if isinstance(node, Variable):
+                new_name = mapping.get(node.name)
+                results[key] = node if new_name is None else Variable(new_name)
+            elif not isinstance(node, Function) or node.ground:
+                results[key] = node
+            elif not expanded:
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in node.arguments)
+            else:
+                args = [results[id(arg)] for arg in node.arguments]
+                changed = any(new is not old for new, old in zip(args, node.arguments))
+                results[key] = Function(node.name, args) if changed else node
+        return results[id(self)]
+
     @staticmethod
     def from_string(text: str) -> 'Term':
         """
@@ -68,12 +151,27 @@ class Term:
         return str(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False)
 class Variable(Term):
     """First-order logic variable identified by a lowercase symbol and acting as a unification placeholder."""
 
     name: str
 
+    def __post_init__(self):
+        """Share the name string (without keeping it alive) and cache structural metadata."""
+        name = sys.intern(self.name)
+        # Frozen dataclass: write every cached field straight into the instance dict in one call
+        self.__dict__.update(name=name, symbol_id=VARIABLE_ID, _hash=hash(("var", name)),
+                             size=1, depth=1, ground=False, variable_mask=_variable_bit(name))
+
+    def __reduce__(self):
+        """Rebuild through the constructor so cached hashes match the unpickling process."""
+        return Variable, (self.name,)
+
+    def _same_structure(self, other: 'Variable') -> bool:
+        """Variables are equal when their names match."""
+        return self.name == other.name
+
     def occurs(self, var_name: str) -> bool:
         """Return True when `var_name` matches this variable's name."""
         return self.name == var_name
@@ -81,7 +179,7 @@ class Variable(Term):
     def apply_substitution(self, substitution: 'Substitution') -> 'Term':
         """Return the substituted term if present; otherwise return the variable."""
         if substitution.contains(self.name):
-            return substitution.get(self.name).apply_substitution(substitution)
+            return _apply_substitution(self, substitution)
         return self
 
     def __str__(self) -> str:
@@ -89,12 +187,27 @@ class Variable(Term):
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False)
 class Constant(Term):
     """Concrete symbol (typically uppercase or numeric) that always evaluates to itself during unification."""
 
     symbol: Any
 
+    def __post_init__(self):
+        """Intern the symbol and cache structural metadata."""
+        symbol_id = SYMBOLS.intern(self.symbol, CONSTANT)
+        symbol = SYMBOLS.names[symbol_id] if isinstance(self.symbol, str) else self.symbol
+        self.__dict__.update(symbol=symbol, symbol_id=symbol_id, _hash=hash(("const", symbol)),
+                             size=1, depth=1, ground=True, variable_mask=0)
+
+    def __reduce__(self):
+        """Rebuild through the constructor so cached hashes match the unpickling process."""
+        return Constant, (self.symbol,)
+
+    def _same_structure(self, other: 'Constant') -> bool:
+        """Constants are equal when their symbols match."""
+        return self.symbol == other.symbol
+
     def occurs(self, var_name: str) -> bool:
         """Constants never contain variables, so always return False."""
         return False
@@ -108,25 +221,186 @@ class Constant(Term):
         return str(self.symbol)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False)
 class Function(Term):
-    """Composite term consisting of a functor name and an ordered list of argument terms."""
+    """Composite term consisting of a functor name and an ordered tuple of argument terms."""
 
     name: str
-    arguments: List[Term]
+    arguments: Sequence[Term]
+
+    def __post_init__(self):
+        """Freeze the arguments into a tuple and derive metadata from the children's caches."""
+        args = tuple(self.arguments)
+        size, depth, mask = 1, 0, 0
+        for arg in args:
+            size += arg.size
+            if arg.depth > depth:
+                depth = arg.depth
+            mask |= arg.variable_mask
+        symbol_id = SYMBOLS.intern(self.name, FUNCTION, len(args))
+        name = SYMBOLS.names[symbol_id]
+        self.__dict__.update(name=name, arguments=args, symbol_id=symbol_id, _hash=hash((name, args)),
+                             size=size, depth=depth + 1, ground=mask == 0, variable_mask=mask)
+
+    def __reduce__(self):
+        """
+        Pickle as a flat node list (see `_encode`): the default nested form makes pickle recurse
+        once per level, which overflows the stack on deep terms.
+        """
+        return _decode, (_encode(self),)
+
+    def _same_structure(self, other: 'Function') -> bool:
+        """Functions are equal when functor and every argument match (explicit work stack)."""
+        stack = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            if left is right:
+                continue
+            if type(left) is not type(right) or left._hash != right._hash:
+                return False
+            if isinstance(left, Function):
+                if left.symbol_id != right.symbol_id:
+                    return False
+                stack.extend(zip(left.arguments, right.arguments))
+            elif not left._same_structure(right):
+                return False
+        return True
 
     def occurs(self, var_name: str) -> bool:
-        """Return True if any argument contains the variable `var_name`."""
-        return any(arg.occurs(var_name) for arg in self.arguments)
+        """Return True if any argument contains the variable `var_name` (explicit work stack)."""
+        stack = list(self.arguments)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Variable):
+                if node.name == var_name:
+                    return True
+            elif isinstance(node, Function) and not node.ground:
+                stack.extend(node.arguments)
+        return False
 
     def apply_substitution(self, substitution: 'Substitution') -> 'Term':
-        """Recursively apply `substitution` to every argument, returning a new function."""
-        new_args = [arg.apply_substitution(
-            substitution) for arg in self.arguments]
-        return Function(self.name, new_args)
+        """Apply `substitution` to every argument (functions without bound variables are returned as is)."""
+        if not self.variable_mask & substitution.variable_mask:
+            return self
+        return _apply_substitution(self, substitution)
 
     def __str__(self) -> str:
-        """Return the textual representation name(arg1, arg2, ...)."""
+        """Return the textual representation name(arg1, arg2, ...) without recursion."""
         if not self.arguments:
             return self.name
-        return f"{self.name}(" + ", ".join(str(a) for a in self.arguments) + ")"
+        parts: List[str] = []
+        stack: List[Any] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif isinstance(node, Function) and node.arguments:
+                parts.append(node.name + "(")
+                stack.append(")")
+                for i in range(len(node.arguments) - 1, -1, -1):
+                    stack.append(node.arguments[i])
+                    if i:
+                        stack.append(", ")
+            elif isinstance(node, Function):
+                parts.append(node.name)
+            else:
+                parts.append(str(node))
+        return "".join(parts)
+
+
+def _variable_bit(name: str) -> int:
+    """Return the `variable_mask` bit of the variable `name` (str hashes are cached, so this is cheap)."""
+    return 1 << (hash(name) & 63)
+
+
+def _encode(term: Function) -> List[Any]:
+    """
+    Return the distinct nodes of `term` in postorder (no recursion): variables and constants as
+    themselves, functions as `(name, argument indices)`. Shared subterms are listed once.
+    """
+    nodes: List[Any] = []
+    index: Dict[int, int] = {}
+    stack: List[Any] = [(term, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in index:
+            continue
+        if not isinstance(node, Function):
+            nodes.append(node)
+        elif expanded:
+            nodes.append((node.name, tuple(index[id(arg)] for arg in node.arguments)))
+        else:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in reversed(node.arguments))
+            continue
+        index[id(node)] = len(nodes) - 1
+    return nodes
+
+
+def _decode(nodes: List[Any]) -> Function:
+    """Unpickling helper: rebuild the term of an `_encode` node list through the constructors."""
+    built: List[Term] = []
+    for node in nodes:
+        if isinstance(node, tuple):
+            name, indices = node
+            node = Function(name, [built[i] for i in indices])
+        built.append(node)
+    return built[-1]
+
+
+def _apply_substitution(term: Term, substitution: 'Substitution',
+                        results: Dict[Any, Term] | None = None) -> Term:
+    """
+    Fully apply `substitution` to `term` with an explicit post-order work stack.
+
+    Bound variables are expanded into their (recursively substituted) bindings; results are
+    memoized per call so shared subterms and repeated variables are processed once.
+    Subterms whose `variable_mask` misses every bound variable (in particular ground ones) are
+    never visited, and a function whose arguments all come back unchanged
+    is reused instead of rebuilt, so untouched subtrees stay shared with the input.
+    Passing the same `results` dict to several calls with one substitution shares that memo
+    between them (see `Substitution.normalize`).
+    Raises ValueError if the substitution binds a variable to a term containing itself.
+    """
+    if results is None:
+        results = {}
+    bound_mask = substitution.variable_mask
+    expanding = set()
+    stack = [(term, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if isinstance(node, Variable):
+            key = node.name
+            if not expanded:
+                if key in results:
+                    continue
+                if not substitution.contains(key):
+                    results[key] = node
+                    continue
+                if key in expanding:
+                    raise ValueError(f"Cyclic substitution: variable '{key}' is bound to a term containing itself")
+                expanding.add(key)
+                stack.append((node, True))
+                stack.append((substitution.get(key), False))
+            else:
+                expanding.discard(key)
+                binding = substitution.get(key)
+                results[key] = results[binding.name if isinstance(binding, Variable) else id(binding)]
+        elif isinstance(node, Function):
+            key = id(node)
+            if not expanded:
+                if key in results:
+                    continue
+                if not node.variable_mask & bound_mask:
+                    results[key] = node
+                    continue
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in reversed(node.arguments))
+            else:
+                args = [results[arg.name if isinstance(arg, Variable) else id(arg)] for arg in node.arguments]
+                # Unbound variables map to the first object seen with that name, hence the `!=`
+                changed = any(new is not old and new != old for new, old in zip(args, node.arguments))
+                results[key] = Function(node.name, args) if changed else node
+        else:
+            results[id(node)] = node
+    return results[term.name if isinstance(term, Variable) else id(term)]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict, Iterable
+
+from src.models.term import Constant, Function, Term, Variable
+
+
+class TermStore:
+    """
+    Hash-consing factory: structurally equal terms built through the store are the same object.
+
+    Canonical terms are kept in a weak-value table keyed on the functor and the identities of
+    their (already canonical) children, so interning a node costs O(arity) and entries vanish
+    once no live term references them.
+    """
+
+    def __init__(self):
+        """Create an empty store."""
+        self._table: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    # Factories
+    def variable(self, name: str) -> Variable:
+        """Return the canonical variable called `name`."""
+        key = ("v", name)
+        term = self._table.get(key)
+        if term is None:
+            term = Variable(name)
+            self._table[key] = term
+        return term
+
+    def constant(self, symbol: Any) -> Constant:
+        """Return the canonical constant for `symbol`."""
+        key = ("c", symbol)
+        term = self._table.get(key)
+        if term is None:
+            term = Constant(symbol)
+            self._table[key] = term
+        return term
+
+    def function(self, name: str, arguments: Iterable[Term]) -> Function:
+        """Return the canonical function term `name(arguments...)`, interning arguments as needed."""
+        args = tuple(arg if self.is_canonical(arg) else self.intern(arg) for arg in arguments)
+        return self._function(name, args)
+
+    def _function(self, name: str, args: tuple) -> Function:
+        """Return the canonical function for arguments that are already canonical."""
+        key = ("f", name, tuple(id(arg) for arg in args))
+        term = self._table.get(key)
+        if term is None:
+            term = Function(name, args)
+            self._table[key] = term
+        return term
+
+    # Interning existing terms
+    def intern(self, term: Term) -> Term:
+        """Return the canonical representative of an arbitrary (possibly non-interned) term."""
+        if isinstance(term, Variable):
+            return self.variable(term.name)
+        if isinstance(term, Constant):
+            return self.constant(term.symbol)
+
+        canonical: Dict[int, Term] = {}
+        stack = [(term, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in canonical:
+                continue
+            if isinstance(node, Function):
+                if not expanded:
+                    stack.append((node, True))
+                    stack.extend((arg, False) for arg in node.arguments if id(arg) not in canonical)
+                    continue
+                canonical[id(node)] = self._function(
+                    node.name, tuple(canonical[id(arg)] for arg in node.arguments))
+            elif isinstance(node, Variable):
+                canonical[id(node)] = self.variable(node.name)
+            else:
+                canonical[id(node)] = self.constant(node.symbol)
+        return canonical[id(term)]
+
+    def is_canonical(self, term: Term) -> bool:
+        """Return True if `term` is the object this store hands out for its structure."""
+        return self._table.get(self._key(term)) is term
+
+    @staticmethod
+    def _key(term: Term) -> tuple:
+        """Return the table key of a term whose children are assumed canonical."""
+        if isinstance(term, Variable):
+            return "v", term.name
+        if isinstance(term, Constant):
+            return "c", term.symbol
+        return "f", term.name, tuple(id(arg) for arg in term.arguments)
+
+    def __len__(self) -> int:
+        """Return the number of live canonical terms."""
+        return len(self._table)
+
+
+# Shared store used by the parser so identical subterms across inputs are shared.
+TERMS = TermStore()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most `size` items without materializing `items`."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_chunk_map(func: Callable[[List[T]], List[R]], items: Iterable[T],
+                      workers: Optional[int] = None, chunk_size: int = 1000,
+                      local: Optional[Callable[[List[T]], List[R]]] = None) -> Iterator[R]:
+    """
+    Apply `func` to chunks of `items` across a process pool and yield the results in input order.
+
+    At most `2 * workers` chunks are in flight, so arbitrarily long inputs are consumed lazily.
+    `func` must be picklable (a module-level function or a `functools.partial` of one).
+    With `workers == 1`, or when the input fits in a single chunk, everything runs in the
+    calling process and no pool is started; `local` (default: `func`) is applied there, so it
+    may be a bound method using state that cannot be shipped to workers.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(items, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    chunks = chain([first] if second is None else [first, second], chunks)
+
+    if workers == 1 or second is None:
+        local = local or func
+        for chunk in chunks:
+            yield from local(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import time
 
 from colorama import Fore, Style, init
@@ -24,6 +26,18 @@ class Printer:
 
     SEPARATOR_LENGTH = 75
 
+    # Output switches; non-interactive modes turn both off (see `configure`)
+    USE_COLOR = True
+    USE_DELAYS = True
+
+    @staticmethod
+    def configure(color: bool | None = None, delays: bool | None = None):
+        """Enable/disable ANSI colors and the cosmetic processing delays globally."""
+        if color is not None:
+            Printer.USE_COLOR = color
+        if delays is not None:
+            Printer.USE_DELAYS = delays
+
     @staticmethod
     def print_header_app():
         """Prints a large header block for CLI sections."""
@@ -115,6 +129,9 @@ class Printer:
             bold (bool): If True, text is printed in bold.
             end (str): End character (default newline).
         """
+        if not Printer.USE_COLOR:
+            print(message, end=end)
+            return
         color_code = COLORS.get(color.lower(), Style.RESET_ALL)
         style = Style.BRIGHT if bold else ""
         print(f"{style}{color_code}{message}{Style.RESET_ALL}", end=end)
@@ -132,6 +149,8 @@ class Printer:
         Returns:
             str: The colored text with ANSI codes.
         """
+        if not Printer.USE_COLOR:
+            return message
         color_code = COLORS.get(color.lower(), Style.RESET_ALL)
         style = Style.BRIGHT if bold else ""
         return f"{style}{color_code}{message}{Style.RESET_ALL}"
@@ -162,13 +181,14 @@ class Printer:
 
     @staticmethod
     def print_three_dots(lapse: float = 1.2):
-        """Prints three dots with a slight delay to simulate processing."""
+        """Prints three dots with a slight delay to simulate processing (no delay when delays are disabled)."""
         if lapse <= 0:
             lapse = 1.2  # Default lapse time
-        wait_time = lapse / 3
+        wait_time = lapse / 3 if Printer.USE_DELAYS else 0
         for _ in range(3):
             print(".", end="", flush=True)
-            time.sleep(wait_time)
+            if wait_time:
+                time.sleep(wait_time)
         print('\n')  # New line after dots
 
     @staticmethod
@@ -190,7 +210,8 @@ class Printer:
         Printer.print_info("Press Enter to continue or 'E' to exit.")
         cont = input().strip().lower()
         if cont == "e":
-            time.sleep(0.5)
+            if Printer.USE_DELAYS:
+                time.sleep(0.5)
             Printer.print_dash_line()
             Printer.print_goodbye_with_style()
             exit(0)
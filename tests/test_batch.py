@@ -0,0 +1,61 @@
+import json
+import io
+
+from benchmarks.generators import deep_chain_pair
+from src.io.batch import run_batch
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+
+
+def test_unify_many_preserves_order_across_workers():
+    pairs = [(ParserAIMA.parse_term(f"p(x{i}, A)"), ParserAIMA.parse_term(f"p(C{i}, y)")) for i in range(40)]
+    pairs.insert(7, (ParserAIMA.parse_term("x"), ParserAIMA.parse_term("f(x)")))
+    pairs.append(("Q(x)", "~Q(B)"))
+    pairs.append(("Q(x)", "Q(B)"))
+
+    outcomes = Unifier(engine="union_find").unify_many(pairs, workers=2, chunk_size=5)
+
+    assert len(outcomes) == len(pairs)
+    assert isinstance(outcomes[7], UnificationError)
+    assert str(outcomes[8]) == "{ x7 / C7, y / A }"
+    assert str(outcomes[-2]) == "{ x / B }"
+    assert "not complementary" in str(outcomes[-1])
+    assert sum(isinstance(o, Substitution) for o in outcomes) == len(pairs) - 2
+
+
+def test_unify_many_in_process_uses_the_callers_unifier():
+    unifier = Unifier(cache_size=16)
+    stats = unifier.instrument()
+    outcomes = unifier.unify_many([("f(x, A)", "f(B, y)")] * 3 + [("f(x)", "g(x)")], workers=1)
+    assert [str(outcome) for outcome in outcomes[:3]] == ["{ x / B, y / A }"] * 3
+    assert stats.calls == 4 and stats.failures == {"clash": 1}
+    assert unifier.cache.hits == 2
+
+
+def test_unify_many_ships_deep_terms_to_workers():
+    pairs = [deep_chain_pair(5000) for _ in range(4)]
+    outcomes = Unifier(engine="union_find").unify_many(pairs, workers=2, chunk_size=1)
+    assert [str(outcome) for outcome in outcomes] == ["{ x / Z }"] * 4
+
+
+def test_run_batch_writes_one_record_per_line():
+    source = io.StringIO("f(x) ; f(A)\n# comment\n\nA ; B\nno separator\n")
+    out = io.StringIO()
+    failures = run_batch(source, out, workers=1)
+    assert failures == 2
+    assert out.getvalue().splitlines() == [
+        "1\tOK\t{ x / A }",
+        "4\tFAIL\tCannot unify A with B",
+        "5\tFAIL\tExpected 'expr1 ; expr2', got 'no separator'",
+    ]
+
+
+def test_run_batch_jsonl_records():
+    source = io.StringIO("P(x, A) ; ~P(B, y)\nx ; f(x)\n")
+    out = io.StringIO()
+    run_batch(source, out, workers=1, fmt="jsonl")
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[0] == {"line": 1, "ok": True, "mgu": {"x": "B", "y": "A"}}
+    assert records[1]["ok"] is False and records[1]["error"].startswith("Occurs check failed")
@@ -0,0 +1,33 @@
+import random
+import sys
+
+from benchmarks.generators import deep_chain_pair, exponential_pair, random_term, shared_variables_pair
+from benchmarks.run import compare, run_suite
+from src.logic.unifier import Unifier
+
+
+def test_generators_build_the_advertised_shapes():
+    left, right = deep_chain_pair(500)
+    assert left.depth == right.depth == 501
+    mgu = Unifier(engine="union_find").unify(*exponential_pair(10))
+    assert mgu.get("x10").size == 2 ** 11 - 1
+    assert len(Unifier().unify(*shared_variables_pair(5)).mapping) == 5
+    assert random_term(random.Random(1), 5).depth <= 5
+
+
+def test_suite_report_and_comparison():
+    report = run_suite("quick", only=["wide"], operations=["unify/union_find", "print"], min_time=0.001, repeat=1)
+    assert {r["operation"] for r in report["results"]} == {"unify/union_find", "print"}
+    assert all(r["ops_per_sec"] > 0 and r["peak_bytes"] >= 0 for r in report["results"])
+
+    slower = {"results": [dict(r, ops_per_sec=r["ops_per_sec"] / 2) for r in report["results"]]}
+    rows = compare(slower, report)
+    assert rows and all(row["regression"] for row in rows)
+    assert not any(row["regression"] for row in compare(report, slower))
+
+
+def test_suite_runs_deep_cases_under_the_default_recursion_limit():
+    limit = sys.getrecursionlimit()
+    report = run_suite("quick", only=["deep_chain"], min_time=0.001, repeat=1)
+    assert len(report["results"]) == 2 * 5
+    assert sys.getrecursionlimit() == limit
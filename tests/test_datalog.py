@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from src.logic.datalog import DatalogEngine
+from src.logic.rete import ReteNetwork
+
+FAMILY = [
+    "Parent(Tom, Bob)", "Parent(Bob, Ann)", "Parent(Bob, Pat)", "Parent(Pat, Jim)",
+    "Parent(x, y) ⇒ Ancestor(x, y)",
+    "Ancestor(x, z) ∧ Parent(z, y) ⇒ Ancestor(x, y)",
+]
+
+
+def test_fixpoint_queries_and_incremental_facts():
+    kb = DatalogEngine(FAMILY)
+    assert {str(s) for s in kb.ask("Ancestor(Tom, who)")} == {
+        "{ who / Bob }", "{ who / Ann }", "{ who / Pat }", "{ who / Jim }"}
+    assert {str(s) for s in kb.ask("Ancestor(x, y) ∧ Parent(y, Jim)")} == {
+        "{ x / Tom, y / Pat }", "{ x / Bob, y / Pat }"}
+    assert len(list(kb.facts("Ancestor"))) == 8 and "Ancestor(Tom, Jim)" in kb
+
+    # New facts and rules extend the closure from where the last run stopped
+    kb.add_fact("Parent(Jim, Kim)")
+    kb.add_rule("Ancestor(x, x) ⇒ Cyclic(x)")
+    assert len(list(kb.facts("Ancestor"))) == 12 and not list(kb.facts("Cyclic"))
+    kb.add_rows("Parent", [("Kim", "Tom")])
+    assert {str(f) for f in kb.facts("Cyclic")} == {"Cyclic(Tom)", "Cyclic(Bob)", "Cyclic(Pat)",
+                                                    "Cyclic(Jim)", "Cyclic(Kim)"}
+
+
+def test_constants_and_repeated_variables_in_rules():
+    kb = DatalogEngine(["Likes(x, x) ⇒ Vain(x)", "Likes(Ann, y) ∧ Likes(y, z) ⇒ Fof(z)"])
+    kb.add_rows("Likes", [("Ann", "Bob"), ("Bob", "Bob"), ("Bob", "Cid"), ("Cid", "Ann")])
+    assert {str(f) for f in kb.facts("Vain")} == {"Vain(Bob)"}
+    assert {str(f) for f in kb.facts("Fof")} == {"Fof(Bob)", "Fof(Cid)"}
+    with pytest.raises(ValueError):
+        kb.add_rule("Likes(x, y) ⇒ Knows(x, f(y))")
+    with pytest.raises(ValueError):
+        kb.add_rule("Likes(x, y) ⇒ Knows(x, z)")
+    with pytest.raises(ValueError):
+        kb.add_fact("Likes(x, Ann)")
+
+
+def test_closure_matches_forward_chaining():
+    rules = ["Edge(x, y) ⇒ Path(x, y)", "Path(x, z) ∧ Edge(z, y) ⇒ Path(x, y)",
+             "Path(x, y) ∧ Path(y, x) ⇒ Linked(x, y)"]
+    rng = random.Random(5)
+    edges = {(f"N{rng.randrange(25)}", f"N{rng.randrange(25)}") for _ in range(60)}
+    kb, net = DatalogEngine(rules), ReteNetwork(rules)
+    kb.add_rows("Edge", edges)
+    for a, b in edges:
+        net.assert_fact(f"Edge({a}, {b})")
+    assert set(kb.facts()) == set(net.facts())
+
+
+def test_first_run_joins_each_row_once(monkeypatch):
+    scanned = []
+    scan = DatalogEngine._scan
+
+    def counting_scan(step, rows, template):
+        for bindings in scan(step, rows, template):
+            scanned.append(bindings)
+            yield bindings
+
+    monkeypatch.setattr(DatalogEngine, "_scan", staticmethod(counting_scan))
+    kb = DatalogEngine(["R(x, y) ∧ S(y, z) ⇒ T(x, z)"])
+    kb.add_rows("R", [(f"A{i}", f"B{i % 5}") for i in range(50)])
+    kb.add_rows("S", [(f"B{i}", f"C{i}") for i in range(5)])
+    assert kb.run() == 50
+    # Only the pass over the full relations joins the rows, not the first delta round again
+    assert len(scanned) == 50
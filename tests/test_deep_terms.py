@@ -0,0 +1,47 @@
+import sys
+
+import pytest
+
+from src.logic.substitution import Substitution
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+from src.models.term import Constant, Function, Variable
+
+DEPTH = 50 * sys.getrecursionlimit()
+
+
+def peano(depth, base):
+    term = base
+    for _ in range(depth):
+        term = Function("s", [term])
+    return term
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_unify_deep_terms(engine):
+    subst = Unifier(engine=engine).unify(peano(DEPTH, Variable("x")), peano(DEPTH, Constant("Z")))
+    assert str(subst) == "{ x / Z }"
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_occurs_check_on_deep_terms(engine):
+    with pytest.raises(UnificationError):
+        Unifier(engine=engine).unify(Variable("x"), peano(DEPTH, Variable("x")))
+
+
+def test_traversals_on_deep_terms():
+    term = peano(DEPTH, Variable("x"))
+    assert term.depth == DEPTH + 1
+    assert term.occurs("x") and not term.occurs("y")
+    assert str(term).startswith("s(s(") and str(term).endswith("x" + ")" * DEPTH)
+    assert term == peano(DEPTH, Variable("x"))
+    assert term != peano(DEPTH, Variable("y"))
+
+    applied = Substitution({"x": peano(DEPTH, Constant("Z"))}).apply(term)
+    assert applied.depth == 2 * DEPTH + 1 and applied.ground
+
+
+def test_cyclic_substitution_is_reported():
+    subst = Substitution({"x": Function("f", [Variable("y")]), "y": Function("g", [Variable("x")])})
+    with pytest.raises(ValueError):
+        subst.apply(Variable("x"))
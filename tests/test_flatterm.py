@@ -0,0 +1,68 @@
+import pickle
+import sys
+
+from src.logic.flat_unification import flat_match, flat_unify, to_substitution
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.flatterm import FlatTerm
+from src.models.term import Constant, Function
+
+term = ParserAIMA.parse_term
+
+
+def test_round_trip_and_skips():
+    original = term("f(g(x, A), h(B), y)")
+    flat = FlatTerm.from_term(original)
+    assert len(flat) == 7
+    assert list(flat.skips) == [7, 4, 3, 4, 6, 6, 7]
+    assert flat.to_term() == original and str(flat) == "f(g(x, A), h(B), y)"
+    assert flat.subterm(1).to_term() == term("g(x, A)")
+    assert flat.occurs("x") and not flat.occurs("z")
+    assert FlatTerm.from_symbols(flat.symbols).skips == flat.skips
+    assert pickle.loads(pickle.dumps(flat)) == flat
+
+
+def test_flat_unify_agrees_with_unifier():
+    cases = [("f(x, g(y))", "f(h(y), g(A))"), ("p(x, y, x)", "p(y, z, A)"), ("f(x)", "g(x)"), ("x", "f(x)")]
+    for left, right in cases:
+        t1, t2 = term(left), term(right)
+        bindings = flat_unify(FlatTerm.from_term(t1), FlatTerm.from_term(t2))
+        try:
+            expected = Unifier(engine="union_find").unify(t1, t2)
+        except Exception:
+            assert bindings is None
+            continue
+        subst = to_substitution(bindings)
+        assert t1.apply_substitution(subst) == t2.apply_substitution(subst)
+        assert t1.apply_substitution(subst) == t1.apply_substitution(expected)
+
+
+def test_flat_unify_without_occurs_check_returns_rational_trees():
+    cases = [("x", "f(x)", "{ x / f(x) }"),
+             ("h(x, y, x)", "h(f(x), f(y), y)", "{ x / f(x), y / f(y) }"),
+             ("f(x, y)", "f(g(y), g(x))", "{ x / g(g(x)), y / g(g(y)) }")]
+    for left, right, expected in cases:
+        bindings = flat_unify(FlatTerm.from_term(term(left)), FlatTerm.from_term(term(right)), occurs_check=False)
+        assert str(to_substitution(bindings)) == expected
+    assert flat_unify(FlatTerm.from_term(term("f(x, x)")), FlatTerm.from_term(term("f(g(x), A)")),
+                      occurs_check=False) is None
+
+
+def test_flat_match_binds_pattern_side_only():
+    pattern = FlatTerm.from_term(term("edge(x, g(y, x))"))
+    assert str(to_substitution(flat_match(pattern, FlatTerm.from_term(term("edge(A, g(f(B), A))"))))) \
+        == "{ x / A, y / f(B) }"
+    assert flat_match(pattern, FlatTerm.from_term(term("edge(A, g(B, C))"))) is None
+    assert flat_match(FlatTerm.from_term(term("f(A)")), FlatTerm.from_term(term("f(z)"))) is None
+
+
+def test_deep_flatterms_need_no_recursion():
+    depth = 20 * sys.getrecursionlimit()
+    deep = Constant("Z")
+    for _ in range(depth):
+        deep = Function("s", [deep])
+    flat = FlatTerm.from_term(deep)
+    assert flat.skips[0] == depth + 1
+    assert flat.to_term() == deep
+    pattern = FlatTerm.from_term(Function("s", [term("x")]))
+    assert flat_match(pattern, flat)[pattern.symbols[1]] == flat.subterm(1)
@@ -0,0 +1,37 @@
+from src.logic.generalization import generalize, generalize_all
+from src.logic.parser import ParserAIMA
+
+term = ParserAIMA.parse_term
+literal = ParserAIMA.parse_literal
+
+
+def test_generalize_shares_variables_for_equal_disagreements():
+    general, theta1, theta2 = generalize("f(A, A, g(B), h(C))", "f(D, D, g(E), h(C))")
+    assert str(general) == "f(z1, z1, g(z2), h(C))"
+    assert str(theta1) == "{ z1 / A, z2 / B }" and str(theta2) == "{ z1 / D, z2 / E }"
+    assert general.apply_substitution(theta1) == term("f(A, A, g(B), h(C))")
+    assert general.apply_substitution(theta2) == term("f(D, D, g(E), h(C))")
+
+    # Input variables are kept where the inputs agree, and fresh names avoid them
+    general, theta1, _ = generalize(term("f(z1, g(A))"), term("f(z1, k(A))"))
+    assert str(general) == "f(z1, z2)" and str(theta1) == "{ z2 / g(A) }"
+
+
+def test_generalize_literals_and_incompatible_inputs():
+    general, theta1, theta2 = generalize(literal("¬Knows(John, mother(x))"),
+                                         literal("¬Knows(Ann, mother(Bob))"))
+    assert str(general) == "¬Knows(z1, mother(z2))"
+    assert general.apply_substitution(theta1) == literal("¬Knows(John, mother(x))")
+    assert str(theta2) == "{ z1 / Ann, z2 / Bob }"
+    assert generalize("P(A)", "¬P(A)") is None
+    assert generalize("P(A)", "Q(A)") is None
+    assert generalize("P(A)", "f(A)") is None
+    assert generalize("f(A, B)", "f(A, B)")[0] == term("f(A, B)")
+
+
+def test_generalize_all_maps_back_to_every_input():
+    inputs = [term(f"h(k(A, f(C{i}, g(B))), f(C{i}, g(B)), D{i % 3})") for i in range(200)]
+    general, substitutions = generalize_all(inputs)
+    assert str(general) == "h(k(A, f(z1, g(B))), f(z1, g(B)), z2)"
+    assert len(substitutions) == len(inputs)
+    assert all(general.apply_substitution(s) == t for s, t in zip(substitutions, inputs))
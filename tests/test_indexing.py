@@ -0,0 +1,71 @@
+import random
+
+from src.logic.indexing import DiscriminationTree
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+
+STORED = [
+    "P(A, f(B))", "P(x, f(B))", "P(A, y)", "P(g(x), f(z))", "P(A, f(f(B)))",
+    "~P(A, f(B))", "Q(A)", "P(x, x)", "P(B, f(B))",
+]
+
+
+def _index():
+    tree = DiscriminationTree()
+    for text in STORED:
+        tree.insert(ParserAIMA.parse_literal(text), text)
+    return tree
+
+
+def _names(entries):
+    return sorted(value for _, value in entries)
+
+
+def test_unifiable_candidates_are_a_superset_of_unifiers():
+    tree = _index()
+    query = ParserAIMA.parse_literal("P(A, f(w))")
+    expected = []
+    for text in STORED:
+        stored = ParserAIMA.parse_literal(text)
+        try:
+            if stored.name == query.name and stored.negated == query.negated:
+                Unifier().unify_literals(stored, query.negate())
+                expected.append(text)
+        except UnificationError:
+            pass
+    candidates = _names(tree.unifiable(query))
+    assert set(expected) <= set(candidates)
+    assert candidates == sorted(["P(A, f(B))", "P(x, f(B))", "P(A, y)", "P(A, f(f(B)))", "P(x, x)"])
+
+
+def test_instances_and_generalizations():
+    tree = _index()
+    assert _names(tree.instances(ParserAIMA.parse_literal("P(A, f(v))"))) == ["P(A, f(B))", "P(A, f(f(B)))"]
+    assert _names(tree.generalizations(ParserAIMA.parse_literal("P(A, f(B))"))) == sorted(
+        ["P(A, f(B))", "P(x, f(B))", "P(A, y)", "P(x, x)"])
+    assert _names(tree.unifiable(ParserAIMA.parse_literal("~P(v, w)"))) == ["~P(A, f(B))"]
+
+
+def test_delete_prunes_entries():
+    tree = _index()
+    assert tree.delete(ParserAIMA.parse_literal("P(A, y)"), "P(A, y)")
+    assert not tree.delete(ParserAIMA.parse_literal("P(A, y)"), "P(A, y)")
+    assert "P(A, y)" not in _names(tree.unifiable(ParserAIMA.parse_literal("P(A, f(w))")))
+    for text in STORED:
+        if text != "P(A, y)":
+            assert tree.delete(ParserAIMA.parse_literal(text), text)
+    assert len(tree) == 0 and list(tree.entries()) == []
+
+
+def test_retrieval_agrees_with_unifier_on_random_facts():
+    rng = random.Random(7)
+    tree = DiscriminationTree()
+    facts = []
+    for i in range(500):
+        fact = ParserAIMA.parse_literal(f"R(C{rng.randrange(20)}, f(C{rng.randrange(5)}))")
+        facts.append(fact)
+        tree.insert(fact, i)
+    query = ParserAIMA.parse_literal("~R(C3, x)").negate()
+    hits = {value for _, value in tree.unifiable(query)}
+    assert hits == {i for i, fact in enumerate(facts) if fact.arguments[0] == query.arguments[0]}
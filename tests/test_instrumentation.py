@@ -0,0 +1,59 @@
+import pytest
+
+from src.logic.instrumentation import UnifyStats
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+
+term = ParserAIMA.parse_term
+literal = ParserAIMA.parse_literal
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_counters_and_failure_causes(engine):
+    unifier = Unifier(engine=engine)
+    stats = unifier.instrument()
+    unifier.unify(term("f(x, g(y))"), term("f(A, g(B))"))
+    assert stats.calls == 1 and stats.bindings == 2 and stats.steps >= 3
+
+    for left, right, cause in [("f(x)", "g(x)", "clash"), ("f(x)", "f(x, y)", "arity"), ("x", "f(x)", "occurs")]:
+        with pytest.raises(UnificationError) as info:
+            unifier.unify(term(left), term(right))
+        assert info.value.cause == cause
+    assert unifier.unify_literals(literal("P(x)"), literal("P(A)")) is None
+    assert stats.failures == {"clash": 1, "arity": 1, "occurs": 1, "not_complementary": 1}
+    assert stats.occurs_nodes > 0 and stats.calls == 5
+
+
+def test_callback_and_timing_spans():
+    events = []
+    unifier = Unifier()
+    stats = unifier.instrument(UnifyStats(), callback=lambda event, data: events.append((event, data)), timing=True)
+    unifier.unify(term("f(x)"), term("f(A)"))
+    assert ("bind", {"var": "x", "term": term("A")}) in events
+    assert stats.spans["unify"][0] == 1 and stats.as_dict()["spans"]["unify"]["count"] == 1
+
+
+def test_cached_failures_keep_their_cause_and_uninstrument_stops_counting():
+    unifier = Unifier(cache_size=4)
+    stats = unifier.instrument()
+    for _ in range(2):
+        with pytest.raises(UnificationError):
+            unifier.unify(term("x"), term("f(x)"))
+    assert stats.failures == {"occurs": 2}
+    unifier.uninstrument()
+    unifier.unify(term("y"), term("A"))
+    assert unifier.stats is None and stats.calls == 2
+
+
+def test_applications_count_substitutions_applied_not_bindings():
+    unifier = Unifier(engine="recursive")
+    stats = unifier.instrument()
+    unifier.unify(term("f(x, y, z)"), term("f(g(y), h(z), A)"))
+    # One application per variable binding plus the normalization of the result
+    assert stats.bindings == 3 and stats.applications == 4
+    stats.reset()
+    with pytest.raises(UnificationError):
+        unifier.unify(term("x"), term("f(x)"))
+    # The term is substituted before the occurs check rejects the binding
+    assert stats.bindings == 0 and stats.applications == 1
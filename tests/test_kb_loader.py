@@ -0,0 +1,42 @@
+import io
+
+from src.io.kb_loader import KnowledgeBaseLoader
+from src.logic.parser import ParserAIMA
+
+
+def test_parse_clause():
+    clause = ParserAIMA.parse_clause("¬Man(x) ∨ Mortal(x) | ~Rock(x)")
+    assert [str(l) for l in clause] == ["¬Man(x)", "Mortal(x)", "¬Rock(x)"]
+
+
+def test_streams_lines_and_dot_separated_statements():
+    source = io.StringIO(
+        "# facts\n"
+        "Man(Socrates)\n"
+        "Man(Plato). Greek(Plato).\n"
+        "\n"
+        "¬Man(x) ∨\n"
+        "  Mortal(f(x,\n"
+        "  y)).\n"
+    )
+    loader = KnowledgeBaseLoader(source)
+    clauses = [[str(l) for l in c] for c in loader.clauses()]
+    assert clauses == [["Man(Socrates)"], ["Man(Plato)"], ["Greek(Plato)"], ["¬Man(x)", "Mortal(f(x, y))"]]
+    assert loader.error_count == 0 and loader.statements_loaded == 4
+
+
+def test_errors_are_collected_without_aborting():
+    source = io.StringIO("P(A)\np(A)\nQ(B))\nR(C)\n")
+    loader = KnowledgeBaseLoader(source, max_errors=1)
+    assert [str(l) for l in loader.literals()] == ["P(A)", "R(C)"]
+    assert loader.error_count == 2
+    assert len(loader.errors) == 1 and loader.errors[0].line == 2
+
+
+def test_literals_rejects_disjunctions_and_reports_progress():
+    reports = []
+    source = io.StringIO("P(A)\nP(x) ∨ Q(x)\nQ(B)\n")
+    loader = KnowledgeBaseLoader(source, progress=lambda *r: reports.append(r), progress_every=2)
+    assert len(list(loader.literals())) == 2
+    assert loader.errors[0].message.startswith("Expected a single literal")
+    assert reports == [(2, 1, 0), (3, 2, 1)]
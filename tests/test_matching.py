@@ -0,0 +1,48 @@
+from src.logic.matching import match
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.logic.unifier import Unifier
+from src.models.term import Constant
+
+term = ParserAIMA.parse_term
+literal = ParserAIMA.parse_literal
+
+
+def test_match_binds_pattern_variables_only():
+    result = match(literal("Parent(x, f(y))"), literal("Parent(John, f(Mary))"))
+    assert str(result) == "{ x / John, y / Mary }"
+    # The instance side is never bound, even where unification would succeed
+    assert match(term("f(A)"), term("f(z)")) is None
+    assert match(term("f(x)"), term("f(g(x))")) == Substitution({"x": term("g(x)")})
+
+
+def test_match_rejects_mismatches():
+    assert match(term("f(x, x)"), term("f(A, B)")) is None
+    assert match(term("f(x)"), term("g(A)")) is None
+    assert match(term("f(x)"), term("f(A, B)")) is None
+    assert match(literal("P(x)"), literal("¬P(A)")) is None
+    assert match(literal("P(x)"), term("p(A)")) is None
+
+
+def test_match_respects_existing_bindings():
+    prior = Substitution({"x": Constant("A")})
+    assert match(term("f(x, y)"), term("f(A, B)"), prior).get("y") == Constant("B")
+    assert match(term("f(x)"), term("f(B)"), prior) is None
+
+
+def test_unifier_match_delegates():
+    assert Unifier().match(term("x"), term("A")) == Substitution({"x": Constant("A")})
+
+
+def test_match_omits_self_bindings():
+    result = match(term("f(x, y)"), term("f(x, A)"))
+    assert str(result) == "{ y / A }"
+    assert term("f(x, y)").apply_substitution(result) == term("f(x, A)")
+    # The self-binding still constrains later occurrences of the variable
+    assert match(term("f(x, x)"), term("f(x, A)")) is None
+
+
+def test_verbose_match_prints_the_message(capsys):
+    Unifier(verbose=True).match(term("f(x)"), term("f(A)"))
+    output = capsys.readouterr().out
+    assert "Match f(x) against f(A): { x / A }" in output and "cyan" not in output
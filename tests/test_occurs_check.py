@@ -0,0 +1,60 @@
+import pytest
+
+from src.logic.occurs_check import POLICIES, find_cycle
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+from src.models.term import Constant, Function, Variable
+
+term = ParserAIMA.parse_term
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+@pytest.mark.parametrize("policy", POLICIES)
+def test_policies_agree_on_acyclic_problems(engine, policy):
+    unifier = Unifier(engine=engine, occurs_check=policy)
+    expected = Unifier().unify(term("f(x, g(y), z)"), term("f(g(A), x, h(y))"))
+    assert unifier.unify(term("f(x, g(y), z)"), term("f(g(A), x, h(y))")) == expected
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+@pytest.mark.parametrize("left, right", [("x", "f(x)"), ("f(x, y)", "f(g(y), g(x))")])
+def test_checking_policies_reject_cycles(engine, left, right):
+    for policy in ("always", "incremental", "deferred"):
+        with pytest.raises(UnificationError) as info:
+            Unifier(engine=engine, occurs_check=policy).unify(term(left), term(right))
+        assert info.value.cause == "occurs"
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_never_returns_rational_tree_bindings(engine):
+    result = Unifier(engine=engine, occurs_check="never").unify(term("x"), term("f(x)"))
+    assert str(result) == "{ x / f(x) }"
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_unchecked_policies_terminate_and_report_clashes_on_cyclic_bindings(engine):
+    # Once x / f(x) and y / f(y) are bound, x = y keeps decomposing f(x) = f(y)
+    cyclic = (term("h(x, y, x)"), term("h(f(x), f(y), y)"))
+    result = Unifier(engine=engine, occurs_check="never").unify(*cyclic)
+    assert set(result.mapping) == {"x", "y"}
+    with pytest.raises(UnificationError) as info:
+        Unifier(engine=engine, occurs_check="deferred").unify(*cyclic)
+    assert info.value.cause == "occurs"
+
+    for policy in ("never", "deferred"):
+        with pytest.raises(UnificationError, match="Cannot unify g\\(x\\) with A"):
+            Unifier(engine=engine, occurs_check=policy).unify(term("f(x, x)"), term("f(g(x), A)"))
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError, match="occurs check policy"):
+        Unifier(occurs_check="sometimes")
+
+
+def test_find_cycle_and_variable_masks():
+    assert find_cycle({"x": term("f(y)"), "y": term("g(z)")}) is None
+    assert find_cycle({"x": term("f(y)"), "y": term("g(x)")}) in ("x", "y")
+    assert Function("f", [Constant("A"), Constant("B")]).variable_mask == 0
+    mixed = Function("f", [Variable("x"), Function("g", [Variable("y")])])
+    assert mixed.variable_mask == Variable("x").variable_mask | Variable("y").variable_mask
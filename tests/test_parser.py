@@ -0,0 +1,57 @@
+import pytest
+
+from src.logic.lexer import Lexer
+from src.logic.parser import ParserAIMA
+from src.models.errors import ParseError
+from src.models.literal import Literal
+from src.models.term import Constant, Function, Variable
+
+
+def test_parse_term_kinds():
+    assert ParserAIMA.parse_term("x") == Variable("x")
+    assert ParserAIMA.parse_term(" John ") == Constant("John")
+    assert ParserAIMA.parse_term("42") == Constant("42")
+    assert ParserAIMA.parse_term("f(x, g(A, y))") == Function(
+        "f", [Variable("x"), Function("g", [Constant("A"), Variable("y")])])
+    assert ParserAIMA.parse_term("f()") == Function("f", [])
+
+
+def test_parse_literal():
+    assert ParserAIMA.parse_literal("¬Loves(John, f(x))") == Literal(
+        "Loves", [Constant("John"), Function("f", [Variable("x")])], True)
+    assert ParserAIMA.parse_literal("~ P(x)").negated
+    assert not ParserAIMA.parse_literal("P(x)").negated
+
+
+@pytest.mark.parametrize("text, position", [
+    ("f(x", 3),
+    ("f(x))", 4),
+    ("F(x)", 0),
+    ("f(,x)", 2),
+    ("f(x;y)", 3),
+    ("g(x) h", 5),
+])
+def test_term_errors_report_offsets(text, position):
+    with pytest.raises(ParseError) as info:
+        ParserAIMA.parse_term(text)
+    assert info.value.position == position
+    assert f"offset {position}" in str(info.value)
+
+
+def test_literal_errors_are_value_errors():
+    with pytest.raises(ValueError):
+        ParserAIMA.parse_literal("p(x)")
+    with pytest.raises(ValueError):
+        ParserAIMA.parse_literal("P")
+
+
+def test_tokens_carry_positions():
+    kinds = [(t.kind, t.text, t.position) for t in Lexer.tokenize("~P( x,A)")]
+    assert kinds == [("NOT", "~", 0), ("NAME", "P", 1), ("LPAREN", "(", 2), ("NAME", "x", 4),
+                     ("COMMA", ",", 5), ("NAME", "A", 6), ("RPAREN", ")", 7), ("EOF", "", 8)]
+
+
+def test_deeply_nested_input():
+    depth = 20000
+    term = ParserAIMA.parse_term("s(" * depth + "Z" + ")" * depth)
+    assert term.depth == depth + 1
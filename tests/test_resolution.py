@@ -0,0 +1,54 @@
+from src.logic.parser import ParserAIMA
+from src.logic.resolution import CLAUSE_LIMIT, PROOF, SATURATED, ResolutionProver
+from src.models.clause import Clause
+
+
+def _clauses(*texts):
+    return [ParserAIMA.parse_clause(text) for text in texts]
+
+
+def test_clause_is_a_set_of_literals():
+    a = Clause(ParserAIMA.parse_clause("P(x) ∨ Q(A) ∨ P(x)"))
+    b = Clause(ParserAIMA.parse_clause("Q(A) ∨ P(x)"))
+    assert a == b and hash(a) == hash(b)
+    assert len(a) == 2
+    assert str(Clause()) == "□"
+    assert Clause(ParserAIMA.parse_clause("P(x) ∨ ¬P(x)")).is_tautology()
+
+
+def test_rename_apart_keeps_distinct_variables_distinct():
+    clause = Clause(ParserAIMA.parse_clause("P(x, x_1) ∨ Q(y_4)"))
+    renamed = clause.rename_apart(7)
+    assert len(renamed.variables()) == 3
+    assert renamed.variant_key() == clause.variant_key()
+
+
+def test_syllogism_proof_trace():
+    result = ResolutionProver().prove(_clauses("¬Man(x) ∨ Mortal(x)", "Man(Socrates)", "¬Mortal(Socrates)"))
+    assert result.status == PROOF and result.proved
+    assert result.proof[-1].clause.is_empty()
+    assert [step.rule for step in result.proof].count("input") == 3
+
+
+def test_self_resolution_and_factoring():
+    chain = ResolutionProver().prove(_clauses("¬P(x) ∨ P(f(x))", "P(A)", "¬P(f(f(f(A))))"))
+    assert chain.proved
+
+    factored = ResolutionProver().prove(_clauses("P(x) ∨ P(y)", "¬P(u) ∨ ¬P(v)"))
+    assert factored.proved
+    assert "factoring" in {step.rule for step in factored.proof}
+
+
+def test_saturation_and_limits():
+    assert ResolutionProver().prove(_clauses("P(x)", "¬Q(A)")).status == SATURATED
+
+    # P(x) ⇒ P(f(x)) never saturates
+    endless = _clauses("¬P(x) ∨ P(f(x))", "P(A)", "¬Q(A)")
+    assert ResolutionProver(max_clauses=50).prove(endless).status == CLAUSE_LIMIT
+
+
+def test_long_implication_chain():
+    n = 2000
+    texts = [f"¬R{i}(x) ∨ R{i + 1}(x)" for i in range(n)] + ["R0(A)", f"¬R{n}(A)"]
+    result = ResolutionProver().prove(_clauses(*texts))
+    assert result.proved
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.logic.rete import ReteNetwork
+
+FAMILY_RULES = ["Parent(x, y) ⇒ Ancestor(x, y)", "Ancestor(x, z) ∧ Parent(z, y) ⇒ Ancestor(x, y)"]
+PATH_RULES = ["Edge(x, y) ⇒ Path(x, y)", "Path(x, z) ∧ Edge(z, y) ⇒ Path(x, y)"]
+
+
+def test_assert_derives_closure_and_retract_removes_only_unsupported_facts():
+    net = ReteNetwork(FAMILY_RULES)
+    for fact in ["Parent(Tom, Bob)", "Parent(Bob, Ann)", "Parent(Bob, Pat)", "Parent(Pat, Jim)"]:
+        net.assert_fact(fact)
+    assert len(net.derived()) == 8 and "Ancestor(Tom, Jim)" in net
+
+    assert net.retract_fact("Parent(Bob, Pat)")
+    assert {str(f) for f in net.facts("Ancestor")} == {
+        "Ancestor(Tom, Bob)", "Ancestor(Bob, Ann)", "Ancestor(Tom, Ann)", "Ancestor(Pat, Jim)"}
+    assert not net.retract_fact("Parent(Bob, Pat)")
+
+    # A fact both asserted and derived survives retraction while a derivation remains
+    net.assert_fact("Ancestor(Tom, Ann)")
+    assert net.retract_fact("Ancestor(Tom, Ann)") and "Ancestor(Tom, Ann)" in net
+
+
+def test_cyclic_support_is_retracted():
+    net = ReteNetwork(["A(x) ⇒ B(x)", "B(x) ⇒ A(x)"])
+    net.assert_fact("A(K)")
+    assert {str(f) for f in net.derived()} == {"B(K)"}  # A(K) is asserted, and also derived from B(K)
+    net.retract_fact("A(K)")
+    assert len(net) == 0
+
+
+def test_rules_added_after_facts_and_constant_tests():
+    net = ReteNetwork()
+    net.assert_fact("Likes(Ann, Ann)")
+    net.assert_fact("Likes(Ann, Bob)")
+    net.add_rule("Likes(x, x) ⇒ Vain(x)")
+    net.add_rule("Likes(Ann, y) ⇒ Friend(y)")
+    assert {str(f) for f in net.derived()} == {"Vain(Ann)", "Friend(Ann)", "Friend(Bob)"}
+    with pytest.raises(ValueError):
+        net.add_rule("Likes(x, y) ⇒ Knows(x, z)")
+    with pytest.raises(ValueError):
+        net.assert_fact("Likes(x, Bob)")
+
+
+def test_incremental_updates_match_recomputed_closure():
+    rng = random.Random(7)
+    net, present = ReteNetwork(PATH_RULES), set()
+    for _ in range(200):
+        fact = f"Edge(N{rng.randrange(8)}, N{rng.randrange(8)})"
+        if fact in present:
+            net.retract_fact(fact)
+            present.discard(fact)
+        else:
+            net.assert_fact(fact)
+            present.add(fact)
+    fresh = ReteNetwork(PATH_RULES)
+    for fact in present:
+        fresh.assert_fact(fact)
+    assert set(net.facts()) == set(fresh.facts())
@@ -0,0 +1,50 @@
+import pytest
+
+from src.logic.parser import ParserAIMA
+from src.logic.sld import SLDEngine
+from src.models.errors import ParseError
+
+FAMILY = [
+    "Parent(Tom, Bob)", "Parent(Bob, Ann)", "Parent(Bob, Pat)", "Parent(Pat, Jim)",
+    "Parent(x, y) ⇒ Ancestor(x, y)",
+    "Parent(x, z) ∧ Ancestor(z, y) ⇒ Ancestor(x, y)",
+]
+
+
+def test_answers_are_enumerated_lazily_in_sld_order():
+    kb = SLDEngine(FAMILY)
+    answers = kb.ask("Ancestor(Tom, who)")
+    assert str(next(answers)) == "{ who / Bob }"
+    assert [str(s) for s in answers] == ["{ who / Ann }", "{ who / Pat }", "{ who / Jim }"]
+    assert str(kb.ask_one("Ancestor(a, Jim) ∧ Parent(Tom, a)")) == "{ a / Bob }"
+    assert kb.ask_one("Parent(Jim, x)") is None
+
+
+def test_recursive_rules_with_compound_terms():
+    kb = SLDEngine(["Append(Nil, l, l)", "Append(t, l, r) => Append(cons(h, t), l, cons(h, r))"])
+    splits = [str(s) for s in kb.ask("Append(x, y, cons(A, cons(B, Nil)))")]
+    assert splits == ["{ x / Nil, y / cons(A, cons(B, Nil)) }",
+                      "{ x / cons(A, Nil), y / cons(B, Nil) }",
+                      "{ x / cons(A, cons(B, Nil)), y / Nil }"]
+    unbound = kb.ask_one("Append(cons(A, Nil), rest, out)")
+    assert str(unbound.get("out")) == f"cons(A, {unbound.get('rest')})"
+
+
+def test_occurs_check_and_first_argument_index():
+    assert SLDEngine(["Same(x, x)"]).ask_one("Same(y, f(y))") is None
+    kb = SLDEngine(f"Edge(N{i}, N{i + 1})" for i in range(2000))
+    kb.add("Edge(x, y) ⇒ Path(x, y)")
+    kb.add("Edge(x, z) ∧ Path(z, y) ⇒ Path(x, y)")
+    assert len(kb) == 2002
+    assert str(kb.ask_one("Edge(N1500, y)")) == "{ y / N1501 }"
+    assert kb.ask_one("Path(N10, N1900)") is not None
+
+
+def test_parse_rule_syntax():
+    rule = ParserAIMA.parse_rule("Parent(x, y) & Male(x) => Father(x, y)")
+    assert str(rule) == "Parent(x, y) ∧ Male(x) ⇒ Father(x, y)" and not rule.is_fact
+    assert str(rule.to_clause()) == "¬Parent(x, y) ∨ ¬Male(x) ∨ Father(x, y)"
+    with pytest.raises(ParseError):
+        ParserAIMA.parse_rule("P(x) ∧ Q(x)")
+    with pytest.raises(ParseError):
+        ParserAIMA.parse_rule("¬P(x) ⇒ Q(x)")
@@ -0,0 +1,100 @@
+from src.logic.persistent_map import PersistentMap
+from src.logic.substitution import Substitution
+from src.models.term import Constant, Function, Variable
+
+
+class _CollidingKey:
+    """Key whose hash collides with every other instance."""
+
+    def __init__(self, label):
+        self.label = label
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and other.label == self.label
+
+
+def test_extend_is_persistent():
+    base = Substitution({"x": Constant("A")})
+    extended = base.extend("y", Function("f", [Variable("x")]))
+
+    assert not base.contains("y")
+    assert extended.contains("x") and extended.contains("y")
+    assert str(extended) == "{ x / A, y / f(x) }"
+    assert extended.apply(Variable("y")) == Function("f", [Constant("A")])
+
+
+def test_extend_ignores_self_binding():
+    base = Substitution()
+    assert base.extend("x", Variable("x")) is base
+
+
+def test_rebinding_keeps_insertion_position():
+    subst = Substitution().extend("x", Constant("A")).extend("y", Constant("B")).extend("x", Constant("C"))
+    assert str(subst) == "{ x / C, y / B }"
+    assert len(subst.mapping) == 2
+
+
+def test_empty_substitution_is_truthy():
+    # Callers test `if result:` to distinguish a (possibly empty) MGU from None
+    assert Substitution()
+
+
+def test_compose_matches_dict_semantics():
+    s1 = Substitution({"y": Constant("B")})
+    s2 = Substitution({"x": Function("f", [Variable("y")]), "y": Constant("C")})
+    composed = s1.compose(s2)
+    assert composed == Substitution({"x": Function("f", [Constant("B")]), "y": Constant("B")})
+
+
+def test_persistent_map_many_keys_and_collisions():
+    reference = {}
+    pmap = PersistentMap()
+    snapshots = []
+    for i in range(3000):
+        key = _CollidingKey(i) if i % 100 == 0 else f"v{i}"
+        pmap = pmap.set(key, i)
+        reference[key] = i
+        if i % 500 == 0:
+            snapshots.append((pmap, dict(reference)))
+
+    assert len(pmap) == len(reference)
+    assert list(pmap.items()) == list(reference.items())
+    for snapshot, expected in snapshots:
+        assert len(snapshot) == len(expected)
+        assert all(snapshot.get(k) == v for k, v in expected.items())
+        assert "v2999" not in snapshot
+
+
+def test_apply_shares_unchanged_subterms():
+    untouched = Function("g", [Variable("y"), Variable("z")])
+    term = Function("f", [Variable("x"), untouched])
+    subst = Substitution({"x": Constant("A")})
+    result = subst.apply(term)
+    assert str(result) == "f(A, g(y, z))" and result.arguments[1] is untouched
+    assert Substitution({"w": Constant("B")}).apply(term) is term
+
+
+def test_dereference_follows_chains_and_detects_cycles():
+    subst = Substitution({"x": Variable("y"), "y": Function("f", [Variable("x")])})
+    assert str(subst.dereference(Variable("x"))) == "f(x)"
+    assert subst.dereference(Variable("z")) == Variable("z")
+    cyclic = Substitution({"x": Variable("y"), "y": Variable("x")})
+    try:
+        cyclic.dereference(Variable("x"))
+    except ValueError as error:
+        assert "Cyclic" in str(error)
+    else:
+        raise AssertionError("cyclic bindings were not detected")
+
+
+def test_normalize_resolves_chains_and_restrict_projects():
+    z = Variable("z")
+    chained = Substitution({"x": Variable("y"), "y": Function("f", [z]), "z": Constant("A")})
+    assert not chained.is_idempotent()
+    normal = chained.normalize()
+    assert str(normal) == "{ x / f(A), y / f(A), z / A }" and normal.is_idempotent()
+    assert normal.normalize() is normal
+    assert str(normal.restrict(["x", "w"])) == "{ x / f(A) }"
@@ -0,0 +1,57 @@
+from src.logic.indexing import FeatureVectorIndex
+from src.logic.parser import ParserAIMA
+from src.logic.resolution import ResolutionProver
+from src.logic.subsumption import subsumes
+from src.models.clause import Clause
+from src.models.term import Constant
+
+
+def _clause(text):
+    return Clause(ParserAIMA.parse_clause(text))
+
+
+def test_subsumption_binds_only_the_general_side():
+    theta = subsumes(_clause("P(x, y)"), _clause("P(A, f(B)) ∨ Q(z)"))
+    assert theta is not None and theta.get("x") == Constant("A")
+    # Instance variables are never bound
+    assert subsumes(_clause("P(A)"), _clause("P(z)")) is None
+    # Repeated variables must match the same subterm
+    assert subsumes(_clause("P(x, x)"), _clause("P(A, B)")) is None
+
+
+def test_subsumption_backtracks_over_literal_choices():
+    general = _clause("P(x, y) ∨ P(y, A)")
+    specific = _clause("P(B, A) ∨ P(C, B)")
+    # P(x, y) must take P(C, B) so that P(y, A) can take P(B, A)
+    assert subsumes(general, specific) is not None
+    assert subsumes(_clause("P(x) ∨ Q(x)"), _clause("P(A) ∨ Q(B)")) is None
+
+
+def test_multiset_subsumption_spares_factors():
+    assert subsumes(_clause("P(x) ∨ P(y)"), _clause("P(z)")) is None
+    assert subsumes(_clause("P(z)"), _clause("P(x) ∨ P(y)")) is not None
+
+
+def test_feature_vector_index_filters_candidates():
+    index = FeatureVectorIndex()
+    stored = {text: _clause(text) for text in ("P(x)", "P(A) ∨ Q(B)", "Q(f(x))", "P(f(A)) ∨ ¬R(x)")}
+    for text, clause in stored.items():
+        index.insert(clause, text)
+
+    forward = {value for _, value in index.generalizations(_clause("P(A) ∨ Q(B) ∨ R(C)"))}
+    assert forward == {"P(x)", "P(A) ∨ Q(B)"}
+    backward = {value for _, value in index.instances(_clause("P(f(y))"))}
+    assert backward == {"P(f(A)) ∨ ¬R(x)"}
+
+    assert index.delete(stored["P(x)"], "P(x)")
+    assert not index.delete(stored["P(x)"], "P(x)")
+    assert len(index) == 3
+    # Every stored clause is a candidate for the empty clause
+    assert len(index.instances(Clause())) == 3
+
+
+def test_prover_discards_subsumed_clauses():
+    texts = ["P(x)", "P(A) ∨ Q(B)", "¬P(A) ∨ R(C)", "¬R(C)"]
+    result = ResolutionProver().prove(ParserAIMA.parse_clause(text) for text in texts)
+    assert result.proved
+    assert result.stats["backward_subsumed"] + result.stats["forward_subsumed"] >= 1
@@ -0,0 +1,40 @@
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.models.literal import Literal
+from src.models.symbols import CONSTANT, FUNCTION, PREDICATE, SYMBOLS, VARIABLE, SymbolTable
+from src.models.term import VARIABLE_ID, Constant, Function, Variable
+
+
+def test_symbol_table_keys_on_kind_name_and_arity():
+    table = SymbolTable()
+    f1 = table.intern("f", FUNCTION, 1)
+    assert table.intern("f", FUNCTION, 1) == f1
+    assert len({f1, table.intern("f", FUNCTION, 2), table.intern("f", CONSTANT), table.intern("f", VARIABLE)}) == 4
+    assert (table.name(f1), table.kind(f1), table.arity(f1)) == ("f", FUNCTION, 1)
+    assert table.lookup("g", FUNCTION, 1) is None
+    assert len(table) == 4
+
+
+def test_models_carry_global_symbol_ids():
+    parsed = ParserAIMA.parse_term("f(x, A)")
+    built = Function("f", [Variable("x"), Constant("A")])
+    assert parsed.symbol_id == built.symbol_id == SYMBOLS.lookup("f", FUNCTION, 2)
+    assert Function("f", [Variable("x")]).symbol_id != parsed.symbol_id
+    # Names are shared, so equal names are the same string object
+    assert parsed.arguments[0].name is Variable("x").name
+    assert parsed.arguments[1].symbol is SYMBOLS.name(Constant("A").symbol_id)
+
+    literal = ParserAIMA.parse_literal("¬Loves(John, x)")
+    assert literal.symbol_id == SYMBOLS.lookup("Loves", PREDICATE, 2)
+    assert literal.is_complementary(Literal("Loves", literal.arguments))
+    assert not literal.is_complementary(Literal("Loves", literal.arguments[:1]))
+    assert str(literal) == "¬Loves(John, x)"
+
+
+def test_variables_are_not_interned():
+    size = len(SYMBOLS)
+    fresh = [Variable(f"x#{n}") for n in range(100)]
+    Substitution({var.name: Constant("A") for var in fresh})
+    assert len(SYMBOLS) == size
+    assert {var.symbol_id for var in fresh} == {VARIABLE_ID}
+    assert Variable("x#7").variable_mask == fresh[7].variable_mask
@@ -0,0 +1,45 @@
+import pickle
+
+from src.logic.parser import ParserAIMA
+from src.models.literal import Literal
+from src.models.term import Constant, Function, Variable
+from src.models.term_store import TermStore
+
+
+def test_parser_shares_structurally_equal_terms():
+    t1 = ParserAIMA.parse_term("f(g(x, A), g(x, A))")
+    t2 = ParserAIMA.parse_term("f(g(x, A), g(x, A))")
+    assert t1 is t2
+    assert t1.arguments[0] is t1.arguments[1]
+
+
+def test_store_interns_foreign_terms():
+    store = TermStore()
+    plain = Function("f", [Variable("x"), Function("g", [Constant("A")])])
+    canonical = store.intern(plain)
+    assert canonical == plain and canonical is not plain
+    assert store.intern(plain) is canonical
+    assert store.function("f", [Variable("x"), Function("g", [Constant("A")])]) is canonical
+    assert store.is_canonical(canonical) and not store.is_canonical(plain)
+
+
+def test_cached_metadata():
+    term = ParserAIMA.parse_term("f(g(x, A), B)")
+    assert term.size == 5
+    assert term.depth == 3
+    assert not term.ground
+    assert ParserAIMA.parse_term("f(g(C, A), B)").ground
+    assert isinstance(term.arguments, tuple)
+
+
+def test_terms_and_literals_are_hashable():
+    lit = ParserAIMA.parse_literal("P(f(x), A)")
+    table = {lit: 1, lit.arguments[0]: 2}
+    assert table[Literal("P", [Function("f", [Variable("x")]), Constant("A")])] == 1
+    assert table[Function("f", [Variable("x")])] == 2
+
+
+def test_pickle_round_trip_recomputes_hash():
+    term = ParserAIMA.parse_term("f(g(x, A), B)")
+    clone = pickle.loads(pickle.dumps(term))
+    assert clone == term and hash(clone) == hash(term)
@@ -0,0 +1,51 @@
+import pytest
+
+from src.logic.parser import ParserAIMA
+from src.logic.substitution import Substitution
+from src.logic.unifier import Unifier
+from src.logic.unify_cache import UnificationCache
+from src.models.errors import UnificationError
+
+term = ParserAIMA.parse_term
+literal = ParserAIMA.parse_literal
+
+
+@pytest.mark.parametrize("engine", Unifier.ENGINES)
+def test_cached_mgu_is_renamed_to_caller_variables(engine):
+    unifier = Unifier(engine=engine, cache_size=8)
+    first = unifier.unify(term("f(x, g(y))"), term("f(A, z)"))
+    second = unifier.unify(term("f(u, g(v))"), term("f(A, w)"))
+    assert unifier.cache.stats()["hits"] == 1 and unifier.cache.stats()["misses"] == 1
+    assert first == Unifier(engine=engine).unify(term("f(x, g(y))"), term("f(A, z)"))
+    assert second == Unifier(engine=engine).unify(term("f(u, g(v))"), term("f(A, w)"))
+    assert "u" in second.mapping and "x" not in second.mapping
+
+
+def test_cached_failures_keep_caller_names():
+    unifier = Unifier(cache_size=8)
+    with pytest.raises(UnificationError, match="'x' occurs"):
+        unifier.unify(term("x"), term("f(x)"))
+    with pytest.raises(UnificationError, match="'q' occurs"):
+        unifier.unify(term("q"), term("f(q)"))
+    assert unifier.cache.hits == 1
+
+
+def test_literal_cache_and_prior_bindings_bypass():
+    unifier = Unifier(cache_size=8)
+    mgu = unifier.unify_literals(literal("Knows(John, x)"), literal("¬Knows(y, Mary)"))
+    assert str(mgu) == "{ y / John, x / Mary }"
+    assert unifier.unify_literals(literal("Knows(John, a)"), literal("¬Knows(b, Mary)")).get("a") == term("Mary")
+    assert unifier.cache.hits == 1
+    # A non-empty starting substitution changes the problem, so it is never cached
+    unifier.unify(term("x"), term("A"), Substitution({"y": term("B")}))
+    assert len(unifier.cache) == 1
+
+
+def test_lru_eviction():
+    cache = UnificationCache(maxsize=2)
+    cache.put("a", (True, ()))
+    cache.put("b", (True, ()))
+    cache.get("a")
+    cache.put("c", (True, ()))
+    assert cache.get("b") is None and cache.get("a") is not None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
@@ -0,0 +1,70 @@
+import pytest
+
+from src.logic.parser import ParserAIMA
+from src.logic.unifier import Unifier
+from src.models.errors import UnificationError
+from src.models.term import Function, Variable
+
+TERM_PAIRS = [
+    ("x", "A"),
+    ("x", "y"),
+    ("f(x)", "f(A)"),
+    ("h(f(x), B)", "h(f(A), B)"),
+    ("p(x, x)", "p(A, A)"),
+    ("p(x, y)", "p(y, A)"),
+    ("p(x, f(x))", "p(A, y)"),
+    ("g(x, f(y), y)", "g(f(z), x, A)"),
+]
+
+FAILING_PAIRS = [
+    ("A", "B"),
+    ("x", "f(x)"),
+    ("p(f(A), g(y))", "p(x, x)"),
+    ("p(x, y)", "p(f(y), f(x))"),
+]
+
+
+def _resolved(subst, names):
+    return {name: subst.apply(Variable(name)) for name in names}
+
+
+@pytest.mark.parametrize("e1, e2", TERM_PAIRS)
+def test_union_find_matches_recursive_mgu(e1, e2):
+    t1, t2 = ParserAIMA.parse_term(e1), ParserAIMA.parse_term(e2)
+    expected = Unifier().unify(t1, t2)
+    actual = Unifier(engine="union_find").unify(t1, t2)
+
+    assert set(actual.mapping) == set(expected.mapping)
+    assert _resolved(actual, expected.mapping) == _resolved(expected, expected.mapping)
+    assert actual.apply(t1) == actual.apply(t2)
+
+
+@pytest.mark.parametrize("e1, e2", FAILING_PAIRS)
+def test_union_find_reports_failures(e1, e2):
+    t1, t2 = ParserAIMA.parse_term(e1), ParserAIMA.parse_term(e2)
+    with pytest.raises(UnificationError):
+        Unifier(engine="union_find").unify(t1, t2)
+
+
+def test_union_find_literals():
+    l1 = ParserAIMA.parse_literal("R(f(x), g(y))")
+    l2 = ParserAIMA.parse_literal("~R(f(A), g(B))")
+    subst = Unifier(engine="union_find").unify_literals(l1, l2)
+    assert str(subst) == "{ x / A, y / B }"
+    assert Unifier(engine="union_find").unify_literals(l1, l1) is None
+
+
+def test_union_find_shared_chain_is_not_exponential():
+    n = 60
+    xs = [Variable(f"x{i}") for i in range(n + 1)]
+    ys = [Variable(f"y{i}") for i in range(n + 1)]
+    left = Function("p", xs[1:] + ys[1:])
+    right = Function("p", [Function("f", [xs[i - 1], xs[i - 1]]) for i in range(1, n + 1)]
+                     + [Function("f", [ys[i - 1], ys[i - 1]]) for i in range(1, n + 1)])
+    subst = Unifier(engine="union_find").unify(left, right)
+    assert subst.contains("x60") and subst.contains("y60")
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        Unifier(engine="quantum")